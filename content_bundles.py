@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Static per-course and per-chapter lesson bundles for CDN delivery
+Each bundle is a JSON file named by the hash of its contents, written with .gz and .br
+siblings so the CDN can serve it pre-compressed with immutable caching. bundles.json maps
+every (course_id, chapter_number, lesson_number) to the bundles holding that lesson.
+A bundle whose contents did not change keeps its filename and is not rewritten, and neither is an
+unchanged bundles.json. Two rows claiming one location stop the build, listing the ids involved.
+
+Usage:
+    python3 content_bundles.py all_course_content.csv batch3_final.csv --output-dir public/content/
+    python3 content_bundles.py all_course_content.csv --structure course_structure.csv --output-dir public/content/
+    python3 content_bundles.py all_course_content.csv --output-dir public/content/ --prune
+"""
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate_migration_batch import COLUMNS, entry_values
+from lesson_fuzzy_match import install_resolver
+from lesson_resolver import CACHE_DIR
+from migrate_course_content import iter_entries, iter_rows
+
+BUNDLE_VERSION = 1
+MANIFEST_FILENAME = 'bundles.json'
+COURSE_FILENAME = 'course_{course_id}.{digest}.json'
+CHAPTER_FILENAME = 'course_{course_id}_ch{chapter_number}.{digest}.json'
+# Hex digits of the content hash kept in a bundle filename
+DIGEST_LENGTH = 16
+# Bundles are compressed once and served many times, so both use their highest setting
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+def bundle_bytes(document):
+    """Compact, deterministic UTF-8 JSON for a bundle"""
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _same_contents(path, data):
+    if not os.path.exists(path):
+        return False
+    with open(path, 'rb') as f:
+        return f.read() == data
+
+def content_digest(data):
+    return hashlib.blake2b(data, digest_size=DIGEST_LENGTH // 2).hexdigest()
+
+def collect_lessons(values_iter, duplicates=None):
+    """{course_id: {chapter_number: {lesson_number: lesson dict}}} from COLUMNS-ordered value tuples
+
+    A location claimed by more than one row keeps the first row and appends
+    (location, first id, duplicate id) to duplicates; callers must not publish
+    the result then, since either row may be the one the location belongs to.
+    """
+    courses = {}
+    for values in values_iter:
+        lesson = dict(zip(COLUMNS, values))
+        chapters = courses.setdefault(lesson['course_id'], {})
+        lessons = chapters.setdefault(lesson['chapter_number'], {})
+        first = lessons.get(lesson['lesson_number'])
+        if first is not None:
+            if duplicates is not None:
+                location = (lesson['course_id'], lesson['chapter_number'], lesson['lesson_number'])
+                duplicates.append((location, first['id'], lesson['id']))
+            continue
+        lessons[lesson['lesson_number']] = lesson
+    return courses
+
+def build_bundles(courses):
+    """Yield (kind, course_id, chapter_number, document) for every course and chapter bundle"""
+    for course_id in sorted(courses):
+        chapters = []
+        for chapter_number in sorted(courses[course_id]):
+            lessons = courses[course_id][chapter_number]
+            chapter = {
+                'course_id': course_id,
+                'chapter_number': chapter_number,
+                'lessons': [lessons[number] for number in sorted(lessons)],
+            }
+            chapters.append(chapter)
+            yield 'chapter', course_id, chapter_number, chapter
+        yield 'course', course_id, None, {'course_id': course_id, 'chapters': chapters}
+
+class BundleWriter:
+    """Writes content-addressed bundles and their compressed siblings into one directory"""
+
+    def __init__(self, output_dir, brotli=True):
+        self.output_dir = output_dir
+        self.brotli = _brotli() if brotli else None
+        self.encodings = ['gzip'] + (['br'] if self.brotli is not None else [])
+        self.written = 0
+        self.unchanged = 0
+        self.bytes = {'json': 0, 'gzip': 0, 'br': 0}
+
+    def write(self, filename_pattern, document, **names):
+        """Write one bundle unless a file with the same contents exists; returns its filename"""
+        data = bundle_bytes(document)
+        filename = filename_pattern.format(digest=content_digest(data), **names)
+        path = os.path.join(self.output_dir, filename)
+        variants = {path: data, path + '.gz': None}
+        if self.brotli is not None:
+            variants[path + '.br'] = None
+        if all(os.path.exists(variant) for variant in variants):
+            self.unchanged += 1
+        else:
+            variants[path + '.gz'] = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+            if self.brotli is not None:
+                variants[path + '.br'] = self.brotli.compress(data, quality=BROTLI_QUALITY)
+            for variant, contents in variants.items():
+                tmp_path = variant + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(contents)
+                os.replace(tmp_path, variant)
+            self.written += 1
+        for variant, encoding in ((path, 'json'), (path + '.gz', 'gzip'), (path + '.br', 'br')):
+            if variant in variants:
+                self.bytes[encoding] += os.path.getsize(variant)
+        return filename
+
+def write_bundles(courses, output_dir, brotli=True):
+    """Write every bundle and bundles.json; returns (manifest, BundleWriter)"""
+    writer = BundleWriter(output_dir, brotli)
+    manifest = {
+        'version': BUNDLE_VERSION,
+        'encodings': writer.encodings,
+        'courses': {},
+        'lessons': {},
+    }
+    chapter_files = {}
+    for kind, course_id, chapter_number, document in build_bundles(courses):
+        if kind == 'chapter':
+            chapter_files[chapter_number] = writer.write(CHAPTER_FILENAME, document, course_id=course_id,
+                                                         chapter_number=chapter_number)
+            continue
+        course_file = writer.write(COURSE_FILENAME, document, course_id=course_id)
+        manifest['courses'][str(course_id)] = {
+            'bundle': course_file,
+            'chapters': {str(number): name for number, name in chapter_files.items()},
+        }
+        for chapter in document['chapters']:
+            chapter_number = chapter['chapter_number']
+            for index, lesson in enumerate(chapter['lessons']):
+                # JSON keys are strings; the frontend builds the same key from the lesson's location
+                key = f"{course_id}/{chapter_number}/{lesson['lesson_number']}"
+                manifest['lessons'][key] = {
+                    'course': course_file,
+                    'chapter': chapter_files[chapter_number],
+                    'index': index,
+                    'id': lesson['id'],
+                }
+        chapter_files = {}
+    data = (json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + '\n').encode('utf-8')
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    # Left alone when unchanged, so its mtime and ETag only move when the content does
+    if not _same_contents(path, data):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return manifest, writer
+
+def prune_bundles(manifest, output_dir):
+    """Remove bundle files bundles.json no longer references; returns how many were removed"""
+    referenced = set()
+    for course in manifest['courses'].values():
+        referenced.add(course['bundle'])
+        referenced.update(course['chapters'].values())
+    removed = 0
+    for path in glob.glob(os.path.join(output_dir, 'course_*.json*')):
+        name = os.path.basename(path)
+        for suffix in ('.gz', '.br'):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+        if name not in referenced:
+            os.remove(path)
+            removed += 1
+    return removed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('inputs', nargs='+', help="CSV/JSON/JSONL exports or INSERT dumps")
+    parser.add_argument('--format', default='auto')
+    parser.add_argument('--output-dir', required=True, help="directory served as static assets")
+    parser.add_argument('--structure', help="course_structure export or sqlite:///path.db (default: LESSON_MAP)")
+    parser.add_argument('--courses', help="course_metadata export with course_id, course_title")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--fuzzy-threshold', type=float,
+                        help="match unknown titles by trigram similarity at or above this score (0-1)")
+    parser.add_argument('--default-location', action='store_true',
+                        help="put lessons no resolver matches at chapter 1 / lesson 1 of their course "
+                             "instead of skipping them")
+    parser.add_argument('--no-brotli', action='store_true', help="write gzip siblings only")
+    parser.add_argument('--prune', action='store_true',
+                        help="remove bundles the new manifest no longer references (clients holding an "
+                             "older manifest will miss them)")
+    args = parser.parse_args(argv)
+
+    if not args.no_brotli and _brotli() is None:
+        print("-- WARNING: brotli is not installed (pip install brotli); writing gzip siblings only", file=sys.stderr)
+    os.makedirs(args.output_dir, exist_ok=True)
+    install_resolver(args.structure, args.courses, args.cache_dir, args.fuzzy_threshold,
+                     default_location=args.default_location)
+
+    stats = {'rows': 0, 'skipped': 0}
+    values = (values for path in args.inputs
+              for values in iter_entries(iter_rows(path, args.format), stats, render=entry_values))
+    duplicates = []
+    courses = collect_lessons(values, duplicates)
+    if duplicates:
+        for (course_id, chapter_number, lesson_number), first_id, duplicate_id in duplicates:
+            print(f"-- ERROR: course {course_id} chapter {chapter_number} lesson {lesson_number}: "
+                  f"ids {first_id} and {duplicate_id}", file=sys.stderr)
+        print(f"-- {len(duplicates):,} duplicate locations; no bundles written", file=sys.stderr)
+        return 1
+    manifest, writer = write_bundles(courses, args.output_dir, brotli=not args.no_brotli)
+    removed = prune_bundles(manifest, args.output_dir) if args.prune else 0
+
+    sizes = ', '.join(f"{encoding} {size / 1024:,.0f} KiB" for encoding, size in writer.bytes.items() if size)
+    print(f"-- {len(manifest['lessons']):,} lessons from {stats['rows']:,} rows ({stats['skipped']:,} skipped) in "
+          f"{len(manifest['courses'])} courses; {writer.written} bundles written, {writer.unchanged} unchanged"
+          f"{f', {removed} files pruned' if args.prune else ''} ({sizes})", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
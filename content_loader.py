@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Chunked, resumable load of a content export into course_content on a stand-in or Postgres database
+Input rows are loaded in fixed chunks, one transaction each; every committed chunk id is appended
+to a checkpoint file, so a load that dies part-way resumes after the last committed chunk.
+Resumed chunks are upserted, so a chunk that committed just before the crash replays cleanly.
+
+Usage:
+    python3 content_loader.py all_course_content.csv --target sqlite:///migration_standin.db
+    python3 content_loader.py catalog.csv --target postgresql://localhost/catalyst --chunk-rows 5000
+    python3 content_loader.py catalog.csv --target sqlite:///migration_standin.db --restart
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate_migration_batch import COLUMNS, entry_values, upsert_clause
+from lesson_fuzzy_match import install_resolver
+from lesson_resolver import CACHE_DIR
+from migrate_course_content import iter_entries, iter_rows
+from row_cache import file_digest
+from standin_db import StandIn, column_ddl
+
+CHECKPOINT_VERSION = 1
+DEFAULT_CHUNK_ROWS = 1000
+DEFAULT_RETRIES = 3
+# Seconds before the first retry of a failed chunk; doubled for each further attempt
+RETRY_DELAY = 1.0
+# Progress is printed every this many chunks
+PROGRESS_EVERY = 50
+
+class CheckpointMismatch(Exception):
+    """The checkpoint was written for a different input, target, chunk size or resolver setup"""
+
+class LoadCheckpoint:
+    """Append-only record of committed chunks: a header line, then one JSON line per chunk"""
+
+    def __init__(self, path, header):
+        self.path = path
+        self.header = header
+        self.committed = set()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f if line.strip()]
+            if lines and lines[0] != header:
+                differing = sorted(key for key in header if lines[0].get(key) != header[key])
+                raise CheckpointMismatch(
+                    f"{path} belongs to a different load ({', '.join(differing)} changed); use --restart"
+                )
+            self.committed = {line['chunk'] for line in lines[1:]}
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._append(header)
+
+    def resume_after(self):
+        """Index of the last chunk in an unbroken committed run from 0, or -1"""
+        n = -1
+        while n + 1 in self.committed:
+            n += 1
+        return n
+
+    def record(self, chunk, rows, last_id):
+        self.committed.add(chunk)
+        self._append({
+            'chunk': chunk,
+            'rows': rows,
+            'last_id': last_id,
+            'committed_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        })
+
+    def _append(self, record):
+        # One short line per chunk; fsync so a recorded chunk survives a crash of the machine too
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+def default_checkpoint(path, cache_dir=CACHE_DIR):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"load_{stem}.checkpoint.jsonl")
+
+class ContentLoader:
+    """Writes chunks of COLUMNS-ordered value tuples into course_content, one transaction per chunk"""
+
+    def __init__(self, target, table='course_content', retries=DEFAULT_RETRIES):
+        self.target = target
+        self.db = StandIn(target)
+        self.table = table
+        self.retries = retries
+        if self.db.is_sqlite:
+            self.db.execute(f"CREATE TABLE IF NOT EXISTS {table} (\n    {column_ddl()},\n    PRIMARY KEY (id)\n)")
+            self.db.commit()
+        insert = (f"INSERT INTO {table} ({', '.join(COLUMNS)}) "
+                  f"VALUES ({self.db.placeholders(len(COLUMNS))})")
+        self._insert = insert
+        self._upsert = f"{insert}\n{upsert_clause()}"
+
+    def load_chunk(self, values, upsert=False):
+        """Commit one chunk, retrying it from scratch on a fresh connection if need be; raises after the last retry"""
+        sql = self._upsert if upsert else self._insert
+        delay = RETRY_DELAY
+        for attempt in range(self.retries + 1):
+            try:
+                if self.db is None:
+                    self.db = StandIn(self.target)
+                self.db.executemany(sql, values)
+                self.db.commit()
+                return
+            except Exception as e:
+                self._abandon(e)
+                if attempt == self.retries or _is_data_error(e):
+                    raise
+                print(f"-- WARNING: chunk failed ({e}); retrying in {delay:.0f}s", file=sys.stderr)
+                time.sleep(delay)
+                delay *= 2
+
+    def _abandon(self, error):
+        """Roll back the failed chunk; a lost connection is closed so the next attempt opens a new one"""
+        if self.db is None:
+            return
+        if not _is_connection_error(error):
+            try:
+                self.db.rollback()
+                return
+            except Exception:
+                # rollback() on a dropped psycopg2 connection raises InterfaceError itself
+                pass
+        try:
+            self.db.close()
+        except Exception:
+            pass
+        self.db = None
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+
+def _is_data_error(error):
+    """Errors a retry cannot fix (duplicate key, bad value), as opposed to a dropped connection or timeout"""
+    return type(error).__name__ in ('IntegrityError', 'DataError', 'ProgrammingError')
+
+def _is_connection_error(error):
+    """A dropped connection or server restart (psycopg2 and sqlite3 both name these so)"""
+    return type(error).__name__ in ('OperationalError', 'InterfaceError')
+
+def load(path, loader, checkpoint, chunk_rows=DEFAULT_CHUNK_ROWS, upsert=False, fmt='auto', out=sys.stderr):
+    """Load every chunk of path not yet in the checkpoint; returns (chunks, rows) loaded this run
+
+    Chunk n is input rows [n * chunk_rows, (n + 1) * chunk_rows), so a resumed
+    run skips committed chunks without resolving or rendering them.
+    """
+    resume_after = checkpoint.resume_after()
+    start_chunk = resume_after + 1
+    if start_chunk:
+        print(f"-- Resuming after chunk {resume_after} ({start_chunk * chunk_rows:,} input rows committed); "
+              f"replaying with upserts", file=out)
+        upsert = True
+    rows = itertools.islice(iter_rows(path, fmt), start_chunk * chunk_rows, None)
+    started = time.perf_counter()
+    chunks = loaded = 0
+    for chunk in itertools.count(start_chunk):
+        raw = list(itertools.islice(rows, chunk_rows))
+        if not raw:
+            break
+        if chunk in checkpoint.committed:
+            continue
+        values = list(iter_entries(raw, render=entry_values))
+        if values:
+            loader.load_chunk(values, upsert)
+        checkpoint.record(chunk, len(values), values[-1][0] if values else None)
+        chunks += 1
+        loaded += len(values)
+        if chunks % PROGRESS_EVERY == 0:
+            elapsed = time.perf_counter() - started
+            print(f"-- chunk {chunk}: {loaded:,} rows in {elapsed:.1f}s ({loaded / elapsed:,.0f} rows/sec)", file=out)
+    return chunks, loaded
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('input', help="CSV/JSON/JSONL export or INSERT dump")
+    parser.add_argument('--format', default='auto')
+    parser.add_argument('--target', default='sqlite:///migration_standin.db',
+                        help="sqlite:///path.db or postgresql://... (course_content must exist on Postgres)")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS,
+                        help=f"input rows per transaction (default: {DEFAULT_CHUNK_ROWS})")
+    parser.add_argument('--checkpoint', help="checkpoint file (default: <cache-dir>/load_<input>.checkpoint.jsonl)")
+    parser.add_argument('--restart', action='store_true', help="discard the checkpoint and load from the first chunk")
+    parser.add_argument('--upsert', action='store_true',
+                        help="upsert from the first chunk (resumed chunks are always upserted)")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help="attempts per chunk after a connection error or timeout")
+    parser.add_argument('--structure', help="course_structure export or sqlite:///path.db (default: LESSON_MAP)")
+    parser.add_argument('--courses', help="course_metadata export with course_id, course_title")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--fuzzy-threshold', type=float,
+                        help="match unknown titles by trigram similarity at or above this score (0-1)")
+    parser.add_argument('--default-location', action='store_true',
+                        help="put lessons no resolver matches at chapter 1 / lesson 1 of their course "
+                             "instead of skipping them")
+    args = parser.parse_args(argv)
+
+    if args.chunk_rows < 1:
+        parser.error("--chunk-rows must be at least 1")
+    if args.input == '-' or not os.path.isfile(args.input):
+        parser.error("a resumable load needs an input file (stdin cannot be replayed)")
+    if args.target.startswith('sqlite://') and not args.target.startswith('sqlite:///'):
+        parser.error("an in-memory SQLite target cannot be resumed; use sqlite:///path.db")
+
+    checkpoint_path = args.checkpoint or default_checkpoint(args.input, args.cache_dir)
+    if args.restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    header = {
+        'version': CHECKPOINT_VERSION,
+        'input': os.path.abspath(args.input),
+        'input_hash': file_digest(args.input, args.cache_dir),
+        'target': args.target,
+        'chunk_rows': args.chunk_rows,
+        'structure': args.structure,
+        'courses': args.courses,
+        'fuzzy_threshold': args.fuzzy_threshold,
+        'default_location': args.default_location,
+    }
+    try:
+        checkpoint = LoadCheckpoint(checkpoint_path, header)
+    except CheckpointMismatch as e:
+        print(f"-- ERROR: {e}", file=sys.stderr)
+        return 1
+
+    install_resolver(args.structure, args.courses, args.cache_dir, args.fuzzy_threshold,
+                     default_location=args.default_location)
+    loader = ContentLoader(args.target, retries=args.retries)
+    started = time.perf_counter()
+    try:
+        chunks, rows = load(args.input, loader, checkpoint, args.chunk_rows, args.upsert, args.format)
+    except Exception as e:
+        print(f"-- FAILED at chunk {checkpoint.resume_after() + 1}: {e}", file=sys.stderr)
+        print(f"-- {len(checkpoint.committed)} chunks are committed; rerun to resume", file=sys.stderr)
+        return 1
+    finally:
+        loader.close()
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"Loaded {rows:,} rows in {chunks} chunks into {args.target} in {elapsed:.2f}s ({rate:,.0f} rows/sec); "
+          f"{len(checkpoint.committed)} chunks committed in total", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
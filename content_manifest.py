@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Per-row content hashes of course_content, for incremental migrations
+A manifest maps each row id to a hash of the values generate_sql_entry renders;
+diffing against it yields only new or changed rows, plus the ids that disappeared
+
+Usage:
+    python3 content_manifest.py old_manifest.csv new_manifest.csv
+"""
+import csv
+import hashlib
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate_migration_batch import COLUMNS
+
+MANIFEST_FIELDS = ['id', 'hash']
+
+# Ids per DELETE statement
+DELETE_CHUNK = 500
+
+def row_hash(values):
+    """Stable hash of a COLUMNS-ordered value tuple (None and '' hash differently)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        if value is None:
+            digest.update(b'\x00')
+        else:
+            digest.update(b'\x01' + str(value).encode('utf-8') + b'\x1f')
+    return digest.hexdigest()
+
+class ContentManifest:
+    """id -> row hash, plus the columns the hashes were computed over"""
+
+    def __init__(self, hashes=None, columns=COLUMNS):
+        self.hashes = dict(hashes or {})
+        self.columns = tuple(columns)
+
+    @classmethod
+    def load(cls, path):
+        """Read a manifest CSV; a missing file is an empty manifest"""
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path, encoding='utf-8', newline='') as f:
+            first = f.readline()
+            columns = COLUMNS
+            if first.startswith('# columns: '):
+                columns = tuple(first[len('# columns: '):].strip().split(','))
+            else:
+                f.seek(0)
+            hashes = {int(row['id']): row['hash'] for row in csv.DictReader(f)}
+        return cls(hashes, columns)
+
+    def save(self, path):
+        """Write the manifest atomically, sorted by id so diffs between runs stay small"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write('# columns: ' + ','.join(self.columns) + '\n')
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(MANIFEST_FIELDS)
+            for row_id in sorted(self.hashes):
+                writer.writerow((row_id, self.hashes[row_id]))
+        os.replace(tmp_path, path)
+
+    def compatible_with(self, other):
+        return self.columns == other.columns
+
+class ManifestDiff:
+    """Stream values through a previous manifest, keeping only new and changed rows"""
+
+    def __init__(self, previous):
+        self.previous = previous
+        self.current = ContentManifest()
+        self.new = 0
+        self.changed = 0
+        self.unchanged = 0
+        # A manifest over a different column list cannot be compared row by row
+        self._comparable = previous.compatible_with(self.current)
+
+    def filter(self, values_iter, values_of=None):
+        """Yield the value tuples that differ from the previous manifest
+
+        values_of extracts the value tuple when the items carry more than that.
+        """
+        previous = self.previous.hashes if self._comparable else {}
+        current = self.current.hashes
+        for item in values_iter:
+            values = item if values_of is None else values_of(item)
+            row_id = int(values[0])
+            digest = row_hash(values)
+            current[row_id] = digest
+            old = previous.get(row_id)
+            if old == digest:
+                self.unchanged += 1
+                continue
+            if old is None:
+                self.new += 1
+            else:
+                self.changed += 1
+            yield item
+
+    def keep(self, entry):
+        """Carry an entry's previous hash forward when it could not be rendered this run,
+        so a resolution failure is not mistaken for a deleted row"""
+        try:
+            row_id = int(entry['id'])
+        except (KeyError, TypeError, ValueError):
+            return
+        if row_id in self.previous.hashes:
+            self.current.hashes[row_id] = self.previous.hashes[row_id]
+
+    def removed_ids(self):
+        """Ids in the previous manifest that were not seen in this run"""
+        return sorted(set(self.previous.hashes) - set(self.current.hashes))
+
+def delete_statements(ids, table='course_content', chunk=DELETE_CHUNK):
+    """DELETE ... WHERE id IN (...) statements, at most `chunk` ids each"""
+    ids = list(ids)
+    for start in range(0, len(ids), chunk):
+        id_list = ", ".join(str(row_id) for row_id in ids[start:start + chunk])
+        yield f"DELETE FROM {table} WHERE id IN ({id_list});"
+
+if __name__ == '__main__':
+    # Summarize the difference between two saved manifests
+    old = ContentManifest.load(sys.argv[1])
+    new = ContentManifest.load(sys.argv[2])
+    added = set(new.hashes) - set(old.hashes)
+    removed = set(old.hashes) - set(new.hashes)
+    changed = {i for i in set(old.hashes) & set(new.hashes) if old.hashes[i] != new.hashes[i]}
+    print(f"{len(added)} new, {len(changed)} changed, {len(removed)} removed")
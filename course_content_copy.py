@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Emit course_content rows as PostgreSQL COPY ... FROM STDIN data
+Text format by default, CSV or PGCOPY binary format optionally; load the output with psql
+"""
+import os
+import struct
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from course_content_schema import COLUMN_TYPES, COLUMNS
+
+# Backslash must be escaped first so the other escapes are not doubled
+TEXT_ESCAPES = (
+    ('\\', '\\\\'),
+    ('\t', '\\t'),
+    ('\n', '\\n'),
+    ('\r', '\\r'),
+)
+
+# Binary COPY wire types per column, from the schema; anything not listed is sent as text.
+# These must match the course_content column types exactly, binary COPY does no casting.
+BINARY_TYPES = COLUMN_TYPES
+
+PGCOPY_SIGNATURE = b'PGCOPY\n\xff\r\n\x00'
+PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+_INT16 = struct.Struct('!h')
+_INT32 = struct.Struct('!i')
+_FIELD_INT4 = struct.Struct('!ii')
+_FIELD_INT8 = struct.Struct('!iq')
+_NULL_FIELD = _INT32.pack(-1)
+
+def copy_statement(fmt='text', table='course_content'):
+    """Return the COPY ... FROM STDIN command line for the given format"""
+    columns = ", ".join(COLUMNS)
+    if fmt in ('csv', 'binary'):
+        return f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT {fmt});"
+    return f"COPY {table} ({columns}) FROM STDIN;"
+
+def escape_text_field(value):
+    """Escape a single value for COPY text format (None becomes \\N)"""
+    if value is None:
+        return '\\N'
+    text = str(value)
+    for char, escaped in TEXT_ESCAPES:
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
+
+def copy_text_line(values):
+    """Render a tuple of column values as one COPY text-format line"""
+    return "\t".join(escape_text_field(value) for value in values) + "\n"
+
+def escape_csv_field(value):
+    """Quote a single value for COPY CSV format: None is an unquoted empty field (NULL), numbers are bare"""
+    if value is None:
+        return ''
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+def copy_csv_line(values):
+    """Render a tuple of column values as one COPY CSV-format line"""
+    return ",".join(escape_csv_field(value) for value in values) + "\n"
+
+class CopyWriter:
+    """Stream rows as a COPY block: the command, one line per row, then the \\. terminator"""
+
+    def __init__(self, out, fmt='text', table='course_content', columns=COLUMNS, types=BINARY_TYPES):
+        if fmt not in ('text', 'csv'):
+            raise ValueError(f"Unsupported COPY format: {fmt}")
+        self.out = out
+        self.fmt = fmt
+        self.table = table
+        self.rows = 0
+        # Every string is quoted, so "" is an empty string and an unquoted empty field is NULL,
+        # matching COPY's CSV defaults (csv.QUOTE_NONNUMERIC would write None as "" too)
+        self._line = copy_csv_line if fmt == 'csv' else copy_text_line
+        # '' is not a valid int or timestamptz; like BinaryCopyWriter, typed columns send it as NULL
+        self._typed = tuple(i for i, column in enumerate(columns) if types.get(column))
+        self._started = False
+
+    def begin(self):
+        self.out.write(copy_statement(self.fmt, self.table) + "\n")
+        self._started = True
+
+    def write_row(self, values):
+        if not self._started:
+            self.begin()
+        if any(values[i] == '' for i in self._typed):
+            values = list(values)
+            for i in self._typed:
+                if values[i] == '':
+                    values[i] = None
+        self.out.write(self._line(values))
+        self.rows += 1
+
+    def finish(self):
+        if not self._started:
+            self.begin()
+        self.out.write("\\.\n")
+        return self.rows
+
+def to_pg_timestamp(value):
+    """Microseconds since 2000-01-01 UTC for a datetime or ISO-8601 string"""
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - PG_EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+def _encode_int4(value):
+    return _FIELD_INT4.pack(4, int(value))
+
+def _encode_int8(value):
+    return _FIELD_INT8.pack(8, int(value))
+
+def _encode_timestamptz(value):
+    return _FIELD_INT8.pack(8, to_pg_timestamp(value))
+
+BINARY_ENCODERS = {
+    'int4': _encode_int4,
+    'int8': _encode_int8,
+    'timestamptz': _encode_timestamptz,
+}
+
+class BinaryCopyWriter:
+    """Stream rows in PGCOPY binary format to a binary file object
+
+    Each row is packed into one reusable bytearray and handed to the
+    underlying (buffered) stream with a single write call.
+    """
+
+    def __init__(self, out, columns=COLUMNS, types=BINARY_TYPES):
+        self.out = out
+        self.rows = 0
+        self._field_count = _INT16.pack(len(columns))
+        self._columns = tuple(columns)
+        self._encoders = tuple(BINARY_ENCODERS.get(types.get(column)) for column in columns)
+        self._buffer = bytearray()
+        self._started = False
+
+    def begin(self):
+        # Signature, flags (no OIDs), header extension length
+        self.out.write(PGCOPY_SIGNATURE + _INT32.pack(0) + _INT32.pack(0))
+        self._started = True
+
+    def write_row(self, values):
+        """Encode and write one row; raises ValueError (writing nothing) on a bad value"""
+        if not self._started:
+            self.begin()
+        buf = self._buffer
+        del buf[:]
+        buf += self._field_count
+        for column, encoder, value in zip(self._columns, self._encoders, values):
+            if value is None or (encoder is not None and value == ''):
+                buf += _NULL_FIELD
+            elif encoder is not None:
+                try:
+                    buf += encoder(value)
+                except (TypeError, ValueError, struct.error) as e:
+                    raise ValueError(f"{column}: {e}") from None
+            else:
+                data = str(value).encode('utf-8')
+                buf += _INT32.pack(len(data))
+                buf += data
+        self.out.write(buf)
+        self.rows += 1
+
+    def finish(self):
+        if not self._started:
+            self.begin()
+        self.out.write(_INT16.pack(-1))
+        return self.rows
+
+def _decode_field(type_name, data):
+    if type_name == 'int4':
+        return _INT32.unpack(data)[0]
+    if type_name == 'int8':
+        return struct.unpack('!q', data)[0]
+    if type_name == 'timestamptz':
+        return PG_EPOCH + timedelta(microseconds=struct.unpack('!q', data)[0])
+    return data.decode('utf-8')
+
+def iter_binary_copy_rows(stream, columns=COLUMNS, types=BINARY_TYPES):
+    """Decode a PGCOPY binary stream back into value tuples, the way the server reads it"""
+    header = stream.read(len(PGCOPY_SIGNATURE) + 8)
+    if header[:len(PGCOPY_SIGNATURE)] != PGCOPY_SIGNATURE:
+        raise ValueError("Not a PGCOPY binary stream")
+    extension_length = _INT32.unpack(header[-4:])[0]
+    stream.read(extension_length)
+    type_names = tuple(types.get(column) for column in columns)
+    while True:
+        field_count = _INT16.unpack(stream.read(2))[0]
+        if field_count == -1:
+            return
+        if field_count != len(columns):
+            raise ValueError(f"Expected {len(columns)} fields, got {field_count}")
+        row = []
+        for type_name in type_names:
+            length = _INT32.unpack(stream.read(4))[0]
+            row.append(None if length == -1 else _decode_field(type_name, stream.read(length)))
+        yield tuple(row)
+
+if __name__ == '__main__':
+    # Decode a binary COPY file into text-format lines for inspection
+    with open(sys.argv[1], 'rb') as f:
+        for values in iter_binary_copy_rows(f):
+            sys.stdout.write(copy_text_line(values))
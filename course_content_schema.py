@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Declarative course_content column schema
+Each column's name, Postgres type, nullability and quoting is declared once; the
+INSERT header, COPY types and the row formatter are derived from it. The formatter and
+row builder are compiled into straight-line functions at import, so rendering a row
+does no per-column lookups, and export rows are held in compact __slots__ records.
+
+Usage:
+    python3 course_content_schema.py              # print the schema and the compiled formatter
+"""
+import operator
+import re
+import sys
+from collections import namedtuple
+
+# quoting is 'raw' (bare literal) or 'dollar' ($$...$$ or the shortest free $q$ tag, NULL for None)
+Column = namedtuple('Column', 'name type nullable quoting', defaults=('text', True, 'dollar'))
+
+def _raw(name, kind):
+    return Column(name, kind, nullable=False, quoting='raw')
+
+# course_content columns, grouped the way the INSERT header prints them
+SCHEMA_GROUPS = (
+    (_raw('id', 'int8'), Column('lesson_id'), _raw('course_id', 'int8'),
+     _raw('chapter_number', 'int4'), _raw('lesson_number', 'int4'), Column('lesson_title')),
+    (Column('the_hook'), Column('key_terms_1'), Column('key_terms_1_def'),
+     Column('key_terms_2'), Column('key_terms_2_def')),
+    (Column('core_concepts_1'), Column('core_concepts_1_def'),
+     Column('core_concepts_2'), Column('core_concepts_2_def')),
+    (Column('synthesis'), Column('connect_to_your_life'), Column('key_takeaways_1'), Column('key_takeaways_2')),
+    (Column('attached_to_chapter'), Column('attached_to_course'), Column('chapter_id'),
+     Column('created_at', 'timestamptz'), Column('updated_at', 'timestamptz')),
+)
+SCHEMA = tuple(column for group in SCHEMA_GROUPS for column in group)
+
+COLUMN_GROUPS = tuple(tuple(column.name for column in group) for group in SCHEMA_GROUPS)
+COLUMNS = tuple(column.name for column in SCHEMA)
+RAW_COLUMNS = frozenset(column.name for column in SCHEMA if column.quoting == 'raw')
+# Non-text column types, as binary COPY and the stand-in table need them
+COLUMN_TYPES = {column.name: column.type for column in SCHEMA if column.type != 'text'}
+
+# Filled from the lesson resolver rather than the export row
+LOCATION_COLUMNS = ('course_id', 'chapter_number', 'lesson_number')
+
+# Fields of a content export row (CSV header / JSON keys), in export order
+ENTRY_FIELDS = (
+    'id', 'lesson_id', 'lesson_title', 'the_hook',
+    'key_terms_1', 'key_terms_1_def', 'key_terms_2', 'key_terms_2_def',
+    'core_concepts_1', 'core_concepts_1_def', 'core_concepts_2', 'core_concepts_2_def',
+    'synthesis', 'connect_to_your_life', 'key_takeaways_1', 'key_takeaways_2',
+    'attached_to_chapter', 'attached_to_course', 'created_at', 'updated_at', 'chapter_id'
+)
+
+class ContentEntry:
+    """One export row as a __slots__ record; .get() and [] read it like the old entry dict"""
+
+    __slots__ = ENTRY_FIELDS
+
+    def get(self, field, default=None):
+        return getattr(self, field, default)
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __repr__(self):
+        return f"ContentEntry(id={self.id!r}, lesson_title={self.lesson_title!r})"
+
+# A '$' (plus q and digits) that would end a $$, $q$ or $qN$ quote early: followed by '$' or
+# at the very end, where the closing tag's own '$' would complete it
+_TAG_CLASH = re.compile(r'\$(?:q([0-9]*))?(?=\$|\Z)')
+
+def dollar_tag(text):
+    """Shortest of $$, $q$, $q1$, $q2$... that quotes text without changing it, found in one scan"""
+    if '$' not in text:
+        return '$$'
+    clashes = {m.group(1) for m in _TAG_CLASH.finditer(text)}
+    if None not in clashes:
+        return '$$'
+    if '' not in clashes:
+        return '$q$'
+    n = 1
+    while str(n) in clashes:
+        n += 1
+    return f'$q{n}$'
+
+def _quoting(column):
+    """Statements setting <name>_tag and turning <name> into its quoted body ('NULL' with no tag for None)"""
+    name = column.name
+    return (
+        f"    if {name} is None:\n"
+        f"        {name}_tag, {name} = '', 'NULL'\n"
+        f"    else:\n"
+        f"        if type({name}) is not str:\n"
+        f"            {name} = str({name})\n"
+        f"        {name}_tag = '$$' if '$' not in {name} else dollar_tag({name})\n"
+    )
+
+def _rendered(column):
+    """f-string fields for one column; the value goes into the row string in a single copy"""
+    name = column.name
+    if column.quoting == 'raw':
+        return "{" + name + "}"
+    return f"{{{name}_tag}}{{{name}}}{{{name}_tag}}"
+
+def _compile():
+    """Source of the specialized functions, generated from SCHEMA"""
+    fields = ", ".join(ENTRY_FIELDS)
+    record_init = "\n".join(f"    self.{field} = {field}" for field in ENTRY_FIELDS)
+    from_row = ", ".join(f"get({field!r})" for field in ENTRY_FIELDS)
+    located = ", ".join(
+        column.name if column.name in LOCATION_COLUMNS else f"entry.{column.name}" for column in SCHEMA
+    )
+    quoting = "".join(_quoting(column) for column in SCHEMA if column.quoting == 'dollar')
+    rendered = ", ".join(_rendered(column) for column in SCHEMA)
+    return (
+        f"def __init__(self, {fields}):\n{record_init}\n"
+        f"\n"
+        f"def normalize_entry(row):\n"
+        f"    try:\n"
+        f"        {fields} = _export_fields(row)\n"
+        f"    except KeyError:\n"
+        f"        get = row.get\n"
+        f"        {fields} = {from_row}\n"
+        f"    return ContentEntry(int(id), {fields.split(', ', 1)[1]})\n"
+        f"\n"
+        f"def as_record(entry):\n"
+        f"    if type(entry) is ContentEntry:\n"
+        f"        return entry\n"
+        f"    get = entry.get\n"
+        f"    return ContentEntry({from_row})\n"
+        f"\n"
+        f"def located_values(entry, location):\n"
+        f"    course_id, chapter_number, lesson_number = location\n"
+        f"    return ({located})\n"
+        f"\n"
+        f"def format_values(values):\n"
+        f"    {', '.join(COLUMNS)} = values\n"
+        f"{quoting}"
+        f"    return f'({rendered})'\n"
+    )
+
+SOURCE = _compile()
+_namespace = {'ContentEntry': ContentEntry, 'dollar_tag': dollar_tag, '_export_fields': operator.itemgetter(*ENTRY_FIELDS)}
+exec(compile(SOURCE, '<course_content_schema>', 'exec'), _namespace)
+ContentEntry.__init__ = _namespace['__init__']
+
+normalize_entry = _namespace['normalize_entry']
+normalize_entry.__doc__ = "ContentEntry for a CSV/JSON export row (missing fields are None); id is converted to int"
+as_record = _namespace['as_record']
+as_record.__doc__ = "ContentEntry for an entry dict (fields copied as-is), or the record itself"
+located_values = _namespace['located_values']
+located_values.__doc__ = "Column values in COLUMNS order for a ContentEntry resolved to a location"
+format_values = _namespace['format_values']
+format_values.__doc__ = "Render a COLUMNS-ordered value tuple as one SQL VALUES entry"
+
+def main(argv=None):
+    for column in SCHEMA:
+        null = "" if column.nullable else " NOT NULL"
+        print(f"-- {column.name} {column.type}{null} ({column.quoting})")
+    print(SOURCE)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,7 +7,7 @@ import json
 
 # Import the generation function
 sys.path.insert(0, '.')
-from generate_migration_batch import generate_sql_entry
+from generate_migration_batch import generate_sql_entry, normalize_entry
 
 # Read CSV from stdin - user should pipe the full CSV data
 csv_data = sys.stdin.read()
@@ -51,29 +51,7 @@ if batch3:
 sql_entries = []
 for entry in batch3:
     try:
-        entry_dict = {
-            'id': int(entry['id']),
-            'lesson_id': entry['lesson_id'],
-            'lesson_title': entry['lesson_title'],
-            'the_hook': entry['the_hook'],
-            'key_terms_1': entry['key_terms_1'],
-            'key_terms_1_def': entry['key_terms_1_def'],
-            'key_terms_2': entry['key_terms_2'],
-            'key_terms_2_def': entry['key_terms_2_def'],
-            'core_concepts_1': entry['core_concepts_1'],
-            'core_concepts_1_def': entry['core_concepts_1_def'],
-            'core_concepts_2': entry['core_concepts_2'],
-            'core_concepts_2_def': entry['core_concepts_2_def'],
-            'synthesis': entry['synthesis'],
-            'connect_to_your_life': entry['connect_to_your_life'],
-            'key_takeaways_1': entry['key_takeaways_1'],
-            'key_takeaways_2': entry['key_takeaways_2'],
-            'attached_to_chapter': entry['attached_to_chapter'],
-            'attached_to_course': entry['attached_to_course'],
-            'created_at': entry['created_at'],
-            'updated_at': entry['updated_at'],
-            'chapter_id': entry['chapter_id']
-        }
+        entry_dict = normalize_entry(entry)
         
         sql_entry = generate_sql_entry(entry_dict)
         if sql_entry:
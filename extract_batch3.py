@@ -1,30 +1,24 @@
 #!/usr/bin/env python3
 """Extract batch 3 entries (40-59) from CSV data"""
 import csv
+import itertools
 import sys
-import io
 
-# Read CSV from stdin
-csv_data = sys.stdin.read()
+sys.path.insert(0, '.')
+from migrate_course_content import iter_csv_rows
 
-# Parse CSV
-reader = csv.DictReader(io.StringIO(csv_data))
-all_entries = list(reader)
-
-print(f"Total entries: {len(all_entries)}", file=sys.stderr)
+# Stream CSV from stdin, stopping as soon as entry 59 has been read
+batch3 = list(itertools.islice(iter_csv_rows(sys.stdin.buffer), 40, 60))
 
 # Extract batch 3 (entries 40-59)
-if len(all_entries) >= 60:
-    batch3 = all_entries[40:60]
+if len(batch3) == 20:
     print(f"Extracted batch 3: {len(batch3)} entries", file=sys.stderr)
     print(f"First ID: {batch3[0]['id']}, Last ID: {batch3[-1]['id']}", file=sys.stderr)
     
     # Output as CSV
-    if batch3:
-        writer = csv.DictWriter(sys.stdout, fieldnames=batch3[0].keys())
-        writer.writeheader()
-        writer.writerows(batch3)
+    writer = csv.DictWriter(sys.stdout, fieldnames=batch3[0].keys())
+    writer.writeheader()
+    writer.writerows(batch3)
 else:
-    print(f"Error: Need at least 60 entries, got {len(all_entries)}", file=sys.stderr)
+    print(f"Error: Need at least 60 entries, input ends after entry {39 + len(batch3)}", file=sys.stderr)
     sys.exit(1)
-
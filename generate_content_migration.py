@@ -3,17 +3,11 @@
 Generate complete MIGRATE_COURSE_CONTENT_DATA.sql with all 71 entries
 """
 import re
+import sys
 
 # Course ID mappings
-COURSE_IDS = {
-    'Introduction to Computer Science': 33,
-    'Media Ecology and the Transformation of Public Discourse in America': 2043436001,
-    'The Foundations and Practice of Hermetic Philosophy: An Analytical Study of The Kybalion': -1048589509,
-    'The Mindful Path to Self-Compassion: Integrating Mindfulness, Acceptance, and Loving-Kindness for Emotional Healing': -211735735,
-    'The Politics of Ecstasy: Psychedelics, Consciousness, and Society': -1211732545,
-    "The Power of Assumption: Consciousness, Imagination, and Manifestation in Neville Goddard's Teachings": -744437687,
-    'The Shock Doctrine: The Rise of Disaster Capitalism': 498493852
-}
+sys.path.insert(0, '.')
+from generate_migration_batch import COURSE_MAP as COURSE_IDS
 
 print("-- This script will generate all 71 entries")
 print("-- Due to complexity, manual mapping is required")
@@ -3,9 +3,17 @@
 Generate SQL migration for course_content in batches of 20
 Processes JSON data and matches lessons to course_structure
 """
-import json
+import itertools
 import sys
 
+# Column schema and compiled row formatter; re-exported for the scripts that import them from here
+from course_content_schema import (
+    COLUMN_GROUPS, COLUMNS, ENTRY_FIELDS, LOCATION_COLUMNS, RAW_COLUMNS, ContentEntry, as_record, dollar_tag,
+    format_values, normalize_entry,
+)
+from course_content_schema import located_values as _located_values
+from json_stream import iter_json_array
+
 # Course ID mappings
 COURSE_MAP = {
     'Introduction to Computer Science': 33,
@@ -112,51 +120,94 @@ LESSON_MAP = {
     'Disaster as Opportunity: Reconstruction, Apartheid, and Policy Exploitation in the 21st Century': (498493852, 3, 3),
 }
 
+def insert_header():
+    """Return the INSERT INTO course_content (...) VALUES header"""
+    lines = ["INSERT INTO course_content ("]
+    for i, group in enumerate(COLUMN_GROUPS):
+        suffix = "," if i < len(COLUMN_GROUPS) - 1 else ""
+        lines.append("    " + ", ".join(group) + suffix)
+    lines.append(") VALUES")
+    return "\n".join(lines)
+
 def dollar_quote(text):
     """Escape text for dollar-quoted strings"""
     if text is None:
         return 'NULL'
     text_str = str(text)
-    # Replace $$ with $TAG$ to avoid conflicts
-    return f"$${text_str.replace('$$', '$TAG$')}$$"
+    # $$ inside the text picks a longer tag ($q$, $q1$...) rather than rewriting the text
+    tag = dollar_tag(text_str)
+    return f"{tag}{text_str}{tag}"
 
-def generate_sql_entry(entry):
-    """Generate a single SQL INSERT value entry"""
+# Optional lesson_resolver.LessonIndex; LESSON_MAP below is used when unset
+RESOLVER = None
+# Opt-in: place unmatched lessons of a known course at chapter 1 / lesson 1 instead of skipping them
+DEFAULT_LOCATION = False
+
+def resolve_lesson(entry):
+    """Return (course_id, chapter_number, lesson_number) for an entry, or None"""
+    if RESOLVER is not None:
+        return RESOLVER.resolve(entry)
+    
     lesson_title = entry.get('lesson_title', '')
     
     # Get chapter_number and lesson_number from LESSON_MAP
     if lesson_title in LESSON_MAP:
-        course_id, chapter_number, lesson_number = LESSON_MAP[lesson_title]
-    else:
-        # Fallback: try to get from course_map
-        course_name = entry.get('attached_to_course', '').strip()
-        course_id = COURSE_MAP.get(course_name)
-        if course_id is None:
-            print(f"-- WARNING: Could not map lesson '{lesson_title}'", file=sys.stderr)
-            return None
-        # Default to chapter 1, lesson 1 if not found
-        chapter_number = 1
-        lesson_number = 1
-        print(f"-- WARNING: Using default chapter/lesson for '{lesson_title}'", file=sys.stderr)
-    
-    # Generate SQL values
-    values = f"""({entry.get('id')}, {dollar_quote(entry.get('lesson_id'))}, {course_id}, {chapter_number}, {lesson_number}, {dollar_quote(entry.get('lesson_title'))}, {dollar_quote(entry.get('the_hook'))}, {dollar_quote(entry.get('key_terms_1'))}, {dollar_quote(entry.get('key_terms_1_def'))}, {dollar_quote(entry.get('key_terms_2'))}, {dollar_quote(entry.get('key_terms_2_def'))}, {dollar_quote(entry.get('core_concepts_1'))}, {dollar_quote(entry.get('core_concepts_1_def'))}, {dollar_quote(entry.get('core_concepts_2'))}, {dollar_quote(entry.get('core_concepts_2_def'))}, {dollar_quote(entry.get('synthesis'))}, {dollar_quote(entry.get('connect_to_your_life'))}, {dollar_quote(entry.get('key_takeaways_1'))}, {dollar_quote(entry.get('key_takeaways_2'))}, {dollar_quote(entry.get('attached_to_chapter'))}, {dollar_quote(entry.get('attached_to_course'))}, {dollar_quote(entry.get('chapter_id'))}, {dollar_quote(entry.get('created_at'))}, {dollar_quote(entry.get('updated_at'))})"""
-    
-    return values
+        return LESSON_MAP[lesson_title]
+    
+    # Fallback: try to get from course_map
+    course_name = entry.get('attached_to_course', '').strip()
+    course_id = COURSE_MAP.get(course_name)
+    if course_id is None:
+        print(f"-- WARNING: Could not map lesson '{lesson_title}'", file=sys.stderr)
+        return None
+    if not DEFAULT_LOCATION:
+        print(f"-- WARNING: Skipping unmatched lesson '{lesson_title}' of course {course_id}", file=sys.stderr)
+        return None
+    print(f"-- WARNING: Using default chapter/lesson for '{lesson_title}'", file=sys.stderr)
+    return course_id, 1, 1
+
+def entry_values(entry):
+    """Return the entry's column values in COLUMNS order, or None if it cannot be mapped"""
+    location = resolve_lesson(entry)
+    if location is None:
+        return None
+    return located_values(entry, location)
+
+def located_values(entry, location):
+    """Column values in COLUMNS order for an entry already resolved to a location
+
+    normalize_entry records go straight to the compiled row builder; plain
+    entry dicts from the older batch scripts are copied into a record first.
+    """
+    return _located_values(as_record(entry), location)
+
+def generate_sql_entry(entry):
+    """Generate a single SQL INSERT value entry"""
+    values = entry_values(entry)
+    if values is None:
+        return None
+    return format_values(values)
+
+def upsert_clause():
+    """ON CONFLICT clause turning the INSERT into an update of every non-key column"""
+    updates = [f"{column} = EXCLUDED.{column}" for column in COLUMNS if column != 'id']
+    return "ON CONFLICT (id) DO UPDATE SET\n    " + ",\n    ".join(updates)
 
 if __name__ == '__main__':
     import sys
     
+    # --default-location puts unmatched lessons at chapter 1 / lesson 1 instead of skipping them
+    if '--default-location' in sys.argv:
+        sys.argv.remove('--default-location')
+        DEFAULT_LOCATION = True
+
     # Determine batch number from command line or default to 2
     batch_num = int(sys.argv[1]) if len(sys.argv) > 1 else 2
     start_idx = (batch_num - 1) * 20
     end_idx = batch_num * 20
     
-    # Read JSON from stdin
-    data = json.load(sys.stdin)
-    
-    # Process entries for this batch
-    batch = data[start_idx:end_idx]
+    # Stream the JSON array from stdin, keeping only this batch's entries
+    batch = list(itertools.islice(iter_json_array(sys.stdin), start_idx, end_idx))
     
     print(f"-- Processing entries {start_idx}-{end_idx-1} (batch {batch_num} of 20)")
     print(f"-- Generating SQL INSERT statements...")
@@ -169,13 +220,7 @@ if __name__ == '__main__':
     
     # Output SQL
     if sql_entries:
-        print("INSERT INTO course_content (")
-        print("    id, lesson_id, course_id, chapter_number, lesson_number, lesson_title,")
-        print("    the_hook, key_terms_1, key_terms_1_def, key_terms_2, key_terms_2_def,")
-        print("    core_concepts_1, core_concepts_1_def, core_concepts_2, core_concepts_2_def,")
-        print("    synthesis, connect_to_your_life, key_takeaways_1, key_takeaways_2,")
-        print("    attached_to_chapter, attached_to_course, chapter_id, created_at, updated_at")
-        print(") VALUES")
+        print(insert_header())
         print(",\n".join(sql_entries) + ";")
     
     print(f"\n-- Generated {len(sql_entries)} entries")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Incremental reader for top-level JSON arrays
+Decodes one element at a time with JSONDecoder.raw_decode over a sliding buffer,
+so a lesson export of any size (file or pipe) is read in constant memory
+
+Usage:
+    python3 json_stream.py temp_content_data.json        # count elements
+"""
+import io
+import json
+import sys
+
+CHUNK_SIZE = 1 << 16
+_WHITESPACE = ' \t\n\r'
+
+class _Buffer:
+    def __init__(self, stream, chunk_size):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size=None):
+        chunk = self.stream.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def next_char(self):
+        """Skip whitespace and return the next character ('' at EOF) without consuming it"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos:self.pos + 1]
+            self.fill()
+
+    def error(self, message):
+        return json.JSONDecodeError(message, self.buf, self.pos)
+
+def iter_json_array(stream, chunk_size=CHUNK_SIZE):
+    """Yield the elements of the JSON array in a text (or binary UTF-8) stream, one at a time"""
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig')
+    decoder = json.JSONDecoder()
+    reader = _Buffer(stream, chunk_size)
+    if reader.next_char() != '[':
+        raise reader.error("Expected a JSON array")
+    reader.pos += 1
+    first = True
+    while True:
+        char = reader.next_char()
+        if char == ']':
+            return
+        if not first:
+            if char != ',':
+                raise reader.error("Expected ',' or ']' between array elements")
+            reader.pos += 1
+            reader.next_char()
+        first = False
+        while True:
+            try:
+                element, end = decoder.raw_decode(reader.buf, reader.pos)
+            except json.JSONDecodeError:
+                if reader.eof:
+                    raise
+                end = None
+            # A number or literal touching the end of the buffer may continue in the next read
+            if end is not None and (end < len(reader.buf) or reader.eof):
+                break
+            # Read at least as much again as is pending, so one huge element is re-scanned O(log n) times
+            reader.fill(max(reader.chunk_size, len(reader.buf) - reader.pos))
+        reader.pos = end
+        yield element
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else '-'
+    with (open(path, 'rb') if path != '-' else sys.stdin.buffer) as stream:
+        count = sum(1 for _ in iter_json_array(stream))
+    print(f"{count} elements")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
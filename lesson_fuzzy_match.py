@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Trigram title matching for lessons the exact lesson index cannot resolve
+Candidates are ranked within the entry's course (and chapter, when known); confident
+matches resolve automatically, the rest go to a review report instead of chapter 1 / lesson 1
+
+Usage:
+    python3 lesson_fuzzy_match.py "Hardware & Software" --course "Introduction to Computer Science"
+"""
+import argparse
+import csv
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import generate_migration_batch
+from lesson_resolver import CACHE_DIR, load_index, normalize_title
+
+DEFAULT_THRESHOLD = 0.75
+REVIEW_CANDIDATES = 3
+
+REVIEW_FIELDS = ['id', 'lesson_id', 'lesson_title', 'attached_to_course', 'attached_to_chapter', 'reason']
+for _n in range(1, REVIEW_CANDIDATES + 1):
+    REVIEW_FIELDS += [f'candidate_{_n}', f'score_{_n}', f'location_{_n}']
+
+def trigrams(title):
+    """Set of character trigrams of a normalized, space-padded title"""
+    text = f"  {normalize_title(title)} "
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+class TrigramIndex:
+    """Inverted trigram index over one scope (a course) of lesson titles"""
+
+    def __init__(self):
+        self.locations = []
+        self.sizes = []
+        self.postings = {}
+
+    def add(self, location, title):
+        doc = len(self.locations)
+        grams = trigrams(title)
+        self.locations.append(location)
+        self.sizes.append(len(grams))
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(doc)
+
+    def search(self, title, limit=REVIEW_CANDIDATES, chapter_number=None):
+        """Return [(score, location)] best first; score is the Dice coefficient"""
+        grams = trigrams(title)
+        shared = Counter()
+        for gram in grams:
+            docs = self.postings.get(gram)
+            if docs:
+                shared.update(docs)
+        query_size = len(grams)
+        scored = []
+        for doc, common in shared.items():
+            location = self.locations[doc]
+            if chapter_number is not None and location[1] != chapter_number:
+                continue
+            scored.append((2.0 * common / (query_size + self.sizes[doc]), location))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored[:limit]
+
+class ReviewReport:
+    """CSV of lessons the fuzzy matcher could not resolve, opened on the first row"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._writer = None
+
+    def write(self, row):
+        if self._writer is None:
+            self._file = open(self.path, 'w', encoding='utf-8', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=REVIEW_FIELDS)
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+class FuzzyResolver:
+    """Exact LessonIndex lookups first, then trigram matching scoped by course and chapter
+
+    Drop-in for generate_migration_batch.RESOLVER. Entries below the threshold
+    are written to the review report and skipped rather than guessed. The report
+    is a path, or any object with write(row) such as a ReviewReport.
+    """
+
+    def __init__(self, index, threshold=DEFAULT_THRESHOLD, report=None):
+        self.index = index
+        self.threshold = threshold
+        self.report = ReviewReport(report) if isinstance(report, str) else report
+        self.matched = 0
+        self.reviewed = 0
+        self._global = None
+        self._courses = {}
+        for location, title in index.lesson_titles.items():
+            self._courses.setdefault(location[0], TrigramIndex()).add(location, title)
+
+    def _global_scope(self):
+        # Only entries whose course is unknown search across courses, so build lazily
+        if self._global is None:
+            self._global = TrigramIndex()
+            for location, title in self.index.lesson_titles.items():
+                self._global.add(location, title)
+        return self._global
+
+    def candidates(self, entry, limit=REVIEW_CANDIDATES):
+        """Ranked (score, location) candidates for an entry, within its chapter when known"""
+        title = entry.get('lesson_title') or ''
+        course_id, chapter_number = self.index.entry_scope(entry)
+        scope = self._courses.get(course_id) if course_id is not None else self._global_scope()
+        if scope is None:
+            return []
+        if chapter_number is not None:
+            ranked = scope.search(title, limit, chapter_number)
+            if ranked and ranked[0][0] >= self.threshold:
+                return ranked
+        return scope.search(title, limit)
+
+    def resolve(self, entry):
+        location = self.index.match(entry)
+        if location is not None:
+            return location
+
+        ranked = self.candidates(entry)
+        if ranked and ranked[0][0] >= self.threshold:
+            tied = len(ranked) > 1 and ranked[1][0] == ranked[0][0]
+            if not tied:
+                self.matched += 1
+                print(
+                    f"-- NOTE: Matched '{entry.get('lesson_title')}' to "
+                    f"'{self.index.lesson_titles.get(ranked[0][1])}' ({ranked[0][0]:.2f})",
+                    file=sys.stderr,
+                )
+                return ranked[0][1]
+            reason = 'tie'
+        else:
+            reason = 'below threshold' if ranked else 'no candidates'
+
+        self.review(entry, ranked, reason)
+        return None
+
+    def review(self, entry, ranked, reason):
+        """Append an unresolved entry and its best candidates to the review report"""
+        self.reviewed += 1
+        print(f"-- WARNING: Could not map lesson '{entry.get('lesson_title')}' ({reason}), sent to review",
+              file=sys.stderr)
+        if self.report is None:
+            return
+        row = {field: entry.get(field) for field in REVIEW_FIELDS[:5]}
+        row['reason'] = reason
+        for n, (score, location) in enumerate(ranked, 1):
+            row[f'candidate_{n}'] = self.index.lesson_titles.get(location)
+            row[f'score_{n}'] = f"{score:.3f}"
+            row[f'location_{n}'] = '/'.join(str(part) for part in location)
+        self.report.write(row)
+
+    def close(self):
+        if self.report is not None and hasattr(self.report, 'close'):
+            self.report.close()
+
+def install_resolver(structure=None, courses=None, cache_dir=CACHE_DIR, fuzzy_threshold=None, report=None,
+                     default_location=False):
+    """Point generate_migration_batch.RESOLVER at the configured resolver and return it
+
+    Without a structure source the index is built from LESSON_MAP. Unmatched
+    lessons are skipped unless default_location puts them at chapter 1 / lesson 1
+    (the fuzzy resolver sends them to review either way).
+    """
+    if fuzzy_threshold is not None:
+        resolver = FuzzyResolver(load_index(structure, courses, cache_dir=cache_dir), fuzzy_threshold, report)
+    else:
+        resolver = load_index(structure, courses, cache_dir=cache_dir)
+        resolver.default_location = default_location
+    generate_migration_batch.RESOLVER = resolver
+    generate_migration_batch.DEFAULT_LOCATION = default_location
+    return resolver
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('title', help="lesson title to match")
+    parser.add_argument('--course', help="attached_to_course of the lesson")
+    parser.add_argument('--chapter', help="attached_to_chapter of the lesson")
+    parser.add_argument('--structure', help="course_structure export or sqlite:///path.db (default: LESSON_MAP)")
+    parser.add_argument('--courses', help="course_metadata export with course_id, course_title")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--limit', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    resolver = FuzzyResolver(load_index(args.structure, args.courses, cache_dir=args.cache_dir), args.threshold)
+    entry = {'lesson_title': args.title, 'attached_to_course': args.course, 'attached_to_chapter': args.chapter}
+    for score, location in resolver.candidates(entry, args.limit):
+        marker = '*' if score >= args.threshold else ' '
+        print(f"{marker} {score:.3f}  {location}  {resolver.index.lesson_titles.get(location)}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
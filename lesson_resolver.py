@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Indexed lesson resolver built from the course_structure data
+Replaces the hand-maintained LESSON_MAP: lesson titles, lesson ids and chapter ids
+are indexed once from a course_structure export and cached on disk by content hash
+
+Usage:
+    python3 lesson_resolver.py course_structure.csv --courses course_metadata.csv
+    python3 lesson_resolver.py sqlite:///standin.db --lookup "What is a Computer?"
+"""
+import argparse
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate_migration_batch import COURSE_MAP, LESSON_MAP
+
+CACHE_DIR = '.migration_cache'
+INDEX_VERSION = 2
+
+# course_structure is denormalized: chapter_title_N / chapter_id_N and lesson_N_M columns
+MAX_CHAPTERS = 5
+MAX_LESSONS = 4
+
+_QUOTES = str.maketrans({'‘': "'", '’': "'", '“': '"', '”': '"'})
+
+def normalize_title(title):
+    """Case-fold, unify curly quotes and collapse whitespace so exports compare equal"""
+    if not title:
+        return ''
+    return ' '.join(str(title).translate(_QUOTES).casefold().split())
+
+class LessonIndex:
+    """O(1) lookups from lesson title, lesson_id or chapter_id to a course_content location"""
+
+    # Opt-in: place unmatched lessons of a known course at chapter 1 / lesson 1 instead of skipping them
+    default_location = False
+
+    def __init__(self):
+        self.courses = {}            # normalized course title -> course_id
+        self.lessons = {}            # (course_id, normalized lesson title) -> location
+        self.titles = {}             # normalized lesson title -> location (unique titles only)
+        self.lesson_titles = {}      # location -> lesson title as written in the source
+        self.lesson_ids = {}         # lesson_id -> location
+        self.chapter_ids = {}        # chapter_id -> (course_id, chapter_number)
+        self.chapter_titles = {}     # (course_id, normalized chapter title) -> chapter_number
+        self._ambiguous = set()
+
+    def add_course(self, title, course_id):
+        self.courses[normalize_title(title)] = course_id
+
+    def add_lesson(self, course_id, chapter_number, lesson_number, title, lesson_id=None):
+        location = (course_id, chapter_number, lesson_number)
+        key = normalize_title(title)
+        self.lessons[(course_id, key)] = location
+        self.lesson_titles.setdefault(location, title)
+        if key in self.titles and self.titles[key] != location:
+            # Same title in two courses: only resolvable with the course in scope
+            del self.titles[key]
+            self._ambiguous.add(key)
+        elif key not in self._ambiguous:
+            self.titles[key] = location
+        if lesson_id:
+            self.lesson_ids[str(lesson_id)] = location
+
+    def add_chapter(self, course_id, chapter_number, title=None, chapter_id=None):
+        if chapter_id:
+            self.chapter_ids[str(chapter_id)] = (course_id, chapter_number)
+        if title:
+            self.chapter_titles[(course_id, normalize_title(title))] = chapter_number
+
+    def add_structure_row(self, row):
+        """Index one course_structure row (one course, up to 5 chapters of 4 lessons)"""
+        course_id = int(row['course_id'])
+        if row.get('course_title'):
+            self.add_course(row['course_title'], course_id)
+        for i in range(1, MAX_CHAPTERS + 1):
+            chapter_title = row.get(f'chapter_title_{i}')
+            if not chapter_title:
+                continue
+            self.add_chapter(course_id, i, chapter_title, row.get(f'chapter_id_{i}'))
+            for j in range(1, MAX_LESSONS + 1):
+                lesson_title = row.get(f'lesson_{i}_{j}')
+                if lesson_title and lesson_title.strip():
+                    self.add_lesson(course_id, i, j, lesson_title)
+
+    def add_content_row(self, row):
+        """Index a course_content row that already carries its location columns"""
+        try:
+            course_id = int(row['course_id'])
+            chapter_number = int(row['chapter_number'])
+            lesson_number = int(row['lesson_number'])
+        except (KeyError, TypeError, ValueError):
+            return
+        self.add_lesson(course_id, chapter_number, lesson_number, row.get('lesson_title'), row.get('lesson_id'))
+        self.add_chapter(course_id, chapter_number, row.get('attached_to_chapter'), row.get('chapter_id'))
+        if row.get('attached_to_course'):
+            self.add_course(row['attached_to_course'], course_id)
+
+    def course_id(self, course_title):
+        return self.courses.get(normalize_title(course_title))
+
+    def lookup(self, title, course_id=None):
+        """Location for a lesson title, scoped to a course when one is given"""
+        key = normalize_title(title)
+        if course_id is not None:
+            return self.lessons.get((course_id, key))
+        return self.titles.get(key)
+
+    def entry_scope(self, entry):
+        """(course_id, chapter_number) an entry is attached to; either may be None"""
+        course_id = self.course_id(entry.get('attached_to_course'))
+        chapter = self.chapter_ids.get(str(entry.get('chapter_id'))) if entry.get('chapter_id') else None
+        if chapter and course_id in (None, chapter[0]):
+            return chapter
+        chapter_number = None
+        if course_id is not None and entry.get('attached_to_chapter'):
+            chapter_number = self.chapter_titles.get((course_id, normalize_title(entry['attached_to_chapter'])))
+        return course_id, chapter_number
+
+    def match(self, entry):
+        """Exact location for a content entry, or None; never guesses"""
+        lesson_id = entry.get('lesson_id')
+        if lesson_id and str(lesson_id) in self.lesson_ids:
+            return self.lesson_ids[str(lesson_id)]
+        lesson_title = entry.get('lesson_title') or ''
+        course_id = self.entry_scope(entry)[0]
+        location = self.lookup(lesson_title, course_id) if course_id is not None else None
+        if location is None:
+            location = self.lookup(lesson_title)
+        return location
+
+    def resolve(self, entry):
+        """Return (course_id, chapter_number, lesson_number) for a content entry, or None
+
+        Tries lesson_id, then the title within the entry's course, then the title
+        alone. Unmatched lessons are skipped with a warning; with default_location
+        set, those of a known course go to chapter 1 / lesson 1 as LESSON_MAP did.
+        """
+        location = self.match(entry)
+        if location is not None:
+            return location
+
+        lesson_title = entry.get('lesson_title') or ''
+        course_id = self.entry_scope(entry)[0]
+        if course_id is None:
+            print(f"-- WARNING: Could not map lesson '{lesson_title}'", file=sys.stderr)
+            return None
+        if not self.default_location:
+            print(f"-- WARNING: Skipping unmatched lesson '{lesson_title}' of course {course_id}", file=sys.stderr)
+            return None
+        print(f"-- WARNING: Using default chapter/lesson for '{lesson_title}'", file=sys.stderr)
+        return course_id, 1, 1
+
+    @classmethod
+    def from_lesson_map(cls, lesson_map=LESSON_MAP, course_map=COURSE_MAP):
+        """Build an index from the legacy LESSON_MAP / COURSE_MAP literals"""
+        index = cls()
+        for title, course_id in course_map.items():
+            index.add_course(title, course_id)
+        for title, (course_id, chapter_number, lesson_number) in lesson_map.items():
+            index.add_lesson(course_id, chapter_number, lesson_number, title)
+        return index
+
+def iter_source_rows(source, table='course_structure'):
+    """Yield rows from a CSV/JSON export, or from a table of a sqlite:/// stand-in"""
+    if source.startswith('sqlite:///'):
+        conn = sqlite3.connect(source[len('sqlite:///'):])
+        conn.row_factory = sqlite3.Row
+        try:
+            for row in conn.execute(f'SELECT * FROM "{table}"'):
+                yield dict(row)
+        finally:
+            conn.close()
+        return
+    from migrate_course_content import iter_rows
+    yield from iter_rows(source)
+
+def source_hash(*sources):
+    """Content hash of the index inputs (files are hashed in 1 MiB chunks)"""
+    digest = hashlib.sha256(f"lesson-index-v{INDEX_VERSION}".encode())
+    for source in sources:
+        if not source:
+            continue
+        path = source[len('sqlite:///'):] if source.startswith('sqlite:///') else source
+        digest.update(b'\0' + os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def build_index(structure_source, courses_source=None, content_source=None):
+    """Compile a LessonIndex from a course_structure export
+
+    courses_source adds course titles (course_metadata export) and content_source
+    adds lesson_id / chapter_id keys from an already-migrated course_content export.
+    """
+    index = LessonIndex()
+    # Course titles: course_metadata export if given, else the known COURSE_MAP
+    if courses_source:
+        for row in iter_source_rows(courses_source, 'course_metadata'):
+            if row.get('course_title') and row.get('course_id') not in (None, ''):
+                index.add_course(row['course_title'], int(row['course_id']))
+    else:
+        for title, course_id in COURSE_MAP.items():
+            index.add_course(title, course_id)
+    for row in iter_source_rows(structure_source, 'course_structure'):
+        index.add_structure_row(row)
+    if content_source:
+        for row in iter_source_rows(content_source, 'course_content'):
+            index.add_content_row(row)
+    return index
+
+def load_index(structure_source=None, courses_source=None, content_source=None, cache_dir=CACHE_DIR):
+    """Return the compiled index, rebuilding it only when the inputs' hash changed"""
+    if not structure_source:
+        return LessonIndex.from_lesson_map()
+
+    digest = source_hash(structure_source, courses_source, content_source)
+    cache_path = os.path.join(cache_dir, 'lesson_index.pickle') if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_digest, state = pickle.load(f)
+            if cached_digest == digest:
+                index = LessonIndex.__new__(LessonIndex)
+                index.__dict__.update(state)
+                return index
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            pass
+
+    index = build_index(structure_source, courses_source, content_source)
+    if cache_path:
+        # Only plain dicts are pickled, so the cache loads whichever script wrote it
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((digest, vars(index)), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    return index
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('structure', help="course_structure CSV/JSON export or sqlite:///path.db")
+    parser.add_argument('--courses', help="course_metadata export with course_id, course_title")
+    parser.add_argument('--content', help="migrated course_content export with location columns")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--lookup', action='append', default=[], help="lesson title to resolve")
+    args = parser.parse_args(argv)
+
+    index = load_index(args.structure, args.courses, args.content, args.cache_dir)
+    print(
+        f"Indexed {len(index.courses)} courses, {len(index.lessons)} lessons, "
+        f"{len(index.chapter_ids)} chapter ids, {len(index.lesson_ids)} lesson ids",
+        file=sys.stderr,
+    )
+    for title in args.lookup:
+        print(f"{title}\t{index.lookup(title)}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Stream course_content rows from CSV, JSON or INSERT dumps and write batched SQL migrations
+Replaces the per-batch scripts: one pass over the input, any number of batch files
+
+Usage:
+    python3 migrate_course_content.py all_course_content.csv --output-dir migrations/
+    cat batch3_entries.csv | python3 migrate_course_content.py --skip 40 --limit 20
+    python3 migrate_course_content.py all_course_content.csv --output-format copy | psql "$DATABASE_URL"
+    python3 migrate_course_content.py all_course_content.csv --output-format copy --output psql:"$DATABASE_URL"
+    python3 migrate_course_content.py all_course_content.csv --output migrations.sql.gz
+    python3 migrate_course_content.py all_course_content.csv --validate > /dev/null
+"""
+import argparse
+import csv
+import io
+import itertools
+import json
+import operator
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from content_manifest import ContentManifest, ManifestDiff, delete_statements
+from course_content_copy import BinaryCopyWriter, CopyWriter, copy_statement
+from generate_migration_batch import (
+    entry_values, format_values, generate_sql_entry, insert_header, normalize_entry, upsert_clause
+)
+from json_stream import iter_json_array
+from lesson_fuzzy_match import FuzzyResolver, install_resolver
+from lesson_resolver import CACHE_DIR
+from migrate_parallel import parallel_entries
+from migration_output import COMPRESSIONS, PSQL_PREFIX, OutputError, open_output
+from row_cache import cached_rows
+from sql_dump_reader import iter_sql_rows
+from standin_db import DEFAULT_TARGET, ContentValidator
+
+# Lesson bodies (synthesis, core_concepts_*_def) can exceed csv's 128 KiB default
+csv.field_size_limit(2 ** 31 - 1)
+
+BATCH_FILENAME = 'MIGRATE_COURSE_CONTENT_DATA_BATCH_{}.sql'
+# Earlier batches a batch preamble names one by one before switching to a range
+PREAMBLE_LISTED_BATCHES = 10
+COPY_FILENAME = 'MIGRATE_COURSE_CONTENT_DATA_COPY.sql'
+BINARY_COPY_FILENAME = 'MIGRATE_COURSE_CONTENT_DATA.pgcopy'
+DELETES_FILENAME = 'MIGRATE_COURSE_CONTENT_DATA_DELETES.sql'
+
+def detect_format(path, stream=None):
+    """Guess 'csv', 'json', 'jsonl' or 'sql' from the file extension or first bytes"""
+    if path and path != '-':
+        ext = os.path.splitext(path)[1].lower()
+        if ext in ('.jsonl', '.ndjson'):
+            return 'jsonl'
+        if ext == '.json':
+            return 'json'
+        if ext == '.csv':
+            return 'csv'
+        if ext == '.sql':
+            return 'sql'
+    if stream is not None and hasattr(stream, 'peek'):
+        head = stream.peek(64).lstrip()
+        if head.startswith(b'['):
+            return 'json'
+        if head.startswith(b'{'):
+            return 'jsonl'
+        if head[:6].upper() == b'INSERT':
+            return 'sql'
+    return 'csv'
+
+def open_input(path):
+    """Open a path (or '-' for stdin) as a binary buffered stream"""
+    if not path or path == '-':
+        return sys.stdin.buffer
+    return open(path, 'rb')
+
+def iter_csv_rows(stream):
+    """Yield CSV rows one at a time from a binary stream"""
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    yield from csv.DictReader(text)
+
+def iter_jsonl_rows(stream):
+    """Yield one JSON object per non-empty line"""
+    text = io.TextIOWrapper(stream, encoding='utf-8')
+    for line in text:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+def iter_json_rows(stream):
+    """Yield entries of a top-level JSON array one at a time"""
+    yield from iter_json_array(io.TextIOWrapper(stream, encoding='utf-8-sig'))
+
+READERS = {
+    'csv': iter_csv_rows,
+    'json': iter_json_rows,
+    'jsonl': iter_jsonl_rows,
+    'sql': iter_sql_rows,
+}
+
+def iter_rows(path=None, fmt='auto', cache_dir=None):
+    """Stream raw export rows from a CSV/JSON file, an INSERT dump or stdin
+
+    With cache_dir, rows of a file already seen with the same content are
+    read back from the row cache instead of being parsed again.
+    """
+    if cache_dir:
+        yield from cached_rows(path, fmt, lambda: iter_rows(path, fmt), cache_dir)
+        return
+    stream = open_input(path)
+    try:
+        if fmt == 'auto':
+            fmt = detect_format(path, stream)
+        yield from READERS[fmt](stream)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+def iter_entries(rows, stats=None, render=generate_sql_entry, on_skip=None):
+    """Normalize rows and render them (through generate_sql_entry by default)
+
+    on_skip, if given, is called with each entry that could not be rendered.
+    """
+    for row in rows:
+        if stats is not None:
+            stats['rows'] += 1
+        try:
+            entry = normalize_entry(row)
+        except (TypeError, ValueError) as e:
+            print(f"-- WARNING: Skipping row with invalid id {row.get('id')!r}: {e}", file=sys.stderr)
+            if stats is not None:
+                stats['skipped'] += 1
+            continue
+        sql_entry = render(entry)
+        if sql_entry is None:
+            if stats is not None:
+                stats['skipped'] += 1
+            if on_skip is not None:
+                on_skip(entry)
+            continue
+        yield sql_entry
+
+def batch_preamble(batch_num, first_entry, last_entry, batch_size):
+    """Header comment block for a batch file, in the style of the existing batches"""
+    lines = [
+        "-- =====================================================",
+        f"-- MIGRATE COURSE CONTENT DATA - BATCH {batch_num} (Entries {first_entry}-{last_entry})",
+        "-- =====================================================",
+        "-- Execute AFTER running:",
+        "-- 1. CORRECT_COURSE_SCHEMA_MIGRATION.sql",
+        "-- 2. MIGRATE_COURSE_STRUCTURE_DATA.sql",
+        "-- 3. MIGRATE_COURSE_DESCRIPTION_DATA.sql",
+    ]
+    if batch_num - 1 > PREAMBLE_LISTED_BATCHES:
+        # Listing every earlier batch would make each preamble grow with the run
+        lines.append(f"-- 4. {BATCH_FILENAME.format(1)} through {BATCH_FILENAME.format(batch_num - 1)}")
+    else:
+        for prev in range(1, batch_num):
+            lines.append(f"-- {prev + 3}. {BATCH_FILENAME.format(prev)}")
+    lines += [
+        "--",
+        f"-- This imports batch {batch_num} of up to {batch_size} lesson content entries",
+        "-- Dollar-quoted strings ($$...$$) are used to avoid apostrophe escaping issues.",
+        "-- =====================================================",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
+
+def write_batch(out, batch_num, first_entry, sql_entries, batch_size, upsert=False):
+    """Write one complete batch statement to an open text stream"""
+    out.write(batch_preamble(batch_num, first_entry, first_entry + len(sql_entries) - 1, batch_size))
+    out.write(insert_header() + "\n")
+    out.write(",\n".join(sql_entries))
+    if upsert:
+        out.write("\n" + upsert_clause())
+    out.write(";\n")
+    out.write(f"\n-- Generated {len(sql_entries)} entries\n")
+
+def statement_overhead(upsert=False):
+    """Bytes of a batch statement that do not depend on its rows"""
+    overhead = len(insert_header().encode('utf-8')) + len(";\n") + 1
+    if upsert:
+        overhead += len(("\n" + upsert_clause()).encode('utf-8'))
+    return overhead
+
+def pack_statements(sql_entries, max_rows=20, max_bytes=None, overhead=0):
+    """Group rendered entries into statements of at most max_rows rows and max_bytes bytes
+
+    Yields (entries, statement_bytes). A single row larger than the budget still
+    gets a statement of its own, with a warning, since it cannot be split.
+    """
+    batch = []
+    size = overhead
+    for sql_entry in sql_entries:
+        entry_bytes = len(sql_entry.encode('utf-8'))
+        added = entry_bytes + (2 if batch else 0)
+        if batch and (len(batch) >= max_rows or (max_bytes is not None and size + added > max_bytes)):
+            yield batch, size
+            batch = []
+            size = overhead
+            added = entry_bytes
+        if max_bytes is not None and not batch and overhead + entry_bytes > max_bytes:
+            print(f"-- WARNING: Row {sql_entry[1:sql_entry.find(',')]} alone is {overhead + entry_bytes} bytes, "
+                  f"over the {max_bytes} byte budget", file=sys.stderr)
+        batch.append(sql_entry)
+        size += added
+    if batch:
+        yield batch, size
+
+def size_report(sizes, rows):
+    """One-line summary of statement count and byte size distribution"""
+    if not sizes:
+        return "0 statements"
+    ordered = sorted(sizes)
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+    return (
+        f"{len(sizes)} statements, {sum(rows) / len(rows):.1f} rows/statement avg, bytes "
+        f"min {ordered[0]:,} / p50 {pct(0.5):,} / p95 {pct(0.95):,} / max {ordered[-1]:,}"
+    )
+
+def write_batches(sql_entries, batch_size=20, output_dir=None, first_batch=1, first_entry=0, upsert=False,
+                  max_bytes=None, report=None, out=None):
+    """Group rendered entries into batches and write each as soon as it is full
+
+    Batches hold at most batch_size rows and, with max_bytes, at most that many
+    bytes of SQL per statement. Only one batch is held in memory at a time.
+    Returns the number of batches written. With upsert, every batch ends in
+    ON CONFLICT (id) DO UPDATE. If report is a dict, statement byte sizes and
+    row counts are appended to its 'sizes' and 'rows' lists. Without output_dir
+    batches go to `out` (default: stdout).
+    """
+    out = out or sys.stdout
+    batch_num = first_batch
+    batches = 0
+    overhead = statement_overhead(upsert)
+    for batch, size in pack_statements(sql_entries, batch_size, max_bytes, overhead):
+        if output_dir:
+            path = os.path.join(output_dir, BATCH_FILENAME.format(batch_num))
+            with open(path, 'w', encoding='utf-8') as out:
+                write_batch(out, batch_num, first_entry, batch, batch_size, upsert)
+        else:
+            write_batch(out, batch_num, first_entry, batch, batch_size, upsert)
+            out.write("\n")
+        if report is not None:
+            report.setdefault('sizes', []).append(size)
+            report.setdefault('rows', []).append(len(batch))
+        first_entry += len(batch)
+        batch_num += 1
+        batches += 1
+    return batches
+
+def write_copy(values, fmt='text', output_dir=None, out=None, stats=None):
+    """Write all rows as a single COPY ... FROM STDIN block; returns the row count"""
+    if output_dir:
+        with open(os.path.join(output_dir, COPY_FILENAME), 'w', encoding='utf-8', newline='') as f:
+            return _write_copy(f, values, fmt, stats)
+    return _write_copy(out or sys.stdout, values, fmt, stats)
+
+def write_binary_copy(values, output_dir=None, out=None, stats=None):
+    """Write all rows as a PGCOPY binary stream; returns the row count"""
+    if output_dir:
+        path = os.path.join(output_dir, BINARY_COPY_FILENAME)
+        with open(path, 'wb', buffering=1 << 20) as out:
+            written = _write_copy(out, values, 'binary', stats)
+        print(f"Load with: psql -c \"\\copy {copy_statement('binary')[5:-1].replace('STDIN', repr(path))}\"",
+              file=sys.stderr)
+        return written
+    if out is not None:
+        return _write_copy(out, values, 'binary', stats)
+    written = _write_copy(sys.stdout.buffer, values, 'binary', stats)
+    sys.stdout.buffer.flush()
+    return written
+
+def _write_copy(out, values, fmt, stats=None):
+    writer = BinaryCopyWriter(out) if fmt == 'binary' else CopyWriter(out, fmt=fmt)
+    for row in values:
+        try:
+            writer.write_row(row)
+        except ValueError as e:
+            print(f"-- WARNING: Skipping row {row[0]}: {e}", file=sys.stderr)
+            if stats is not None:
+                stats['skipped'] += 1
+    return writer.finish()
+
+def write_deletes(ids, output_dir=None, out=None):
+    """Write DELETE statements for ids removed since the last manifest"""
+    if not ids:
+        return
+    statements = "\n".join(delete_statements(ids)) + "\n"
+    header = f"-- Remove {len(ids)} course_content rows no longer present in the source\n"
+    if output_dir:
+        with open(os.path.join(output_dir, DELETES_FILENAME), 'w', encoding='utf-8') as out:
+            out.write(header + statements)
+    else:
+        (out or sys.stdout).write(header + statements)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('input', nargs='?', default='-', help="CSV/JSON/JSONL export (default: stdin)")
+    parser.add_argument('--format', choices=['auto'] + sorted(READERS), default='auto')
+    parser.add_argument('--output-format', choices=['insert', 'copy', 'copy-csv', 'copy-binary'],
+                        default='insert',
+                        help="batched INSERTs (default), one COPY FROM STDIN block in text/CSV format "
+                             "for psql, or a PGCOPY binary file")
+    parser.add_argument('--batch-size', type=int, default=20, help="max rows per INSERT batch (default: 20)")
+    parser.add_argument('--max-bytes', type=int,
+                        help="also cap each INSERT statement at this many bytes of SQL, "
+                             "packing short rows together and splitting long ones")
+    parser.add_argument('--output-dir', help="write one file per batch here instead of stdout")
+    parser.add_argument('--output', metavar='TARGET',
+                        help="write everything to one file instead of stdout (.gz / .zst compress it), "
+                             "or stream it into psql with psql or psql:postgresql://...")
+    parser.add_argument('--compress', choices=COMPRESSIONS,
+                        help="compress the output (default: from the --output suffix)")
+    parser.add_argument('--first-batch', type=int, default=1, help="number of the first batch written")
+    parser.add_argument('--structure', help="course_structure export or sqlite:///path.db to resolve lessons "
+                                            "from (default: the built-in LESSON_MAP)")
+    parser.add_argument('--courses', help="course_metadata export with course_id, course_title")
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help="where the compiled lesson index (and, with --row-cache, parsed rows) are cached")
+    parser.add_argument('--row-cache', action='store_true',
+                        help="cache parsed input rows by file hash so later runs skip parsing")
+    parser.add_argument('--fuzzy-threshold', type=float,
+                        help="match unknown titles by trigram similarity at or above this score (0-1); "
+                             "lessons below it go to --review-report")
+    parser.add_argument('--default-location', action='store_true',
+                        help="put lessons no resolver matches at chapter 1 / lesson 1 of their course "
+                             "instead of skipping them")
+    parser.add_argument('--review-report', help="CSV of lessons the fuzzy matcher could not resolve")
+    parser.add_argument('--manifest', help="per-row content hash manifest to write after the run")
+    parser.add_argument('--incremental', action='store_true',
+                        help="diff against --manifest: emit only new/changed rows as upserts and "
+                             "DELETEs for removed ids")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="render in this many processes, sharded by course (output is identical)")
+    parser.add_argument('--chunk-size', type=int, default=500, help="rows per course shard sent to a worker")
+    parser.add_argument('--validate', nargs='?', const=DEFAULT_TARGET, metavar='TARGET',
+                        help="bulk-load the generated rows into a local stand-in (in-memory SQLite by default, "
+                             "or sqlite:///path.db / postgresql://...) and check id and lesson location "
+                             "uniqueness; exits 1 if the batch would fail")
+    parser.add_argument('--skip', type=int, default=0, help="skip this many input rows first")
+    parser.add_argument('--limit', type=int, help="process at most this many input rows")
+    args = parser.parse_args(argv)
+
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.max_bytes is not None and args.max_bytes < 1:
+        parser.error("--max-bytes must be positive")
+    if args.incremental:
+        if not args.manifest:
+            parser.error("--incremental needs --manifest")
+        if args.output_format != 'insert':
+            parser.error("--incremental only supports --output-format insert (COPY cannot upsert)")
+        if args.skip or args.limit is not None:
+            parser.error("--incremental needs the whole input; drop --skip/--limit")
+    if args.output_dir and (args.output or args.compress):
+        parser.error("--output and --compress write a single stream; drop --output-dir")
+    if args.output and args.output.split(':', 1)[0] == PSQL_PREFIX and args.output_format == 'copy-binary':
+        parser.error("psql reads COPY data inline as text; use --output-format copy with psql")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    sink = None
+    out = None
+    if args.output or args.compress:
+        try:
+            sink = open_output(args.output or '-', args.compress)
+        except (OSError, OutputError) as e:
+            parser.error(str(e))
+        out = sink.binary if args.output_format == 'copy-binary' else sink.text()
+
+    stats = {'rows': 0, 'skipped': 0}
+    start = time.perf_counter()
+
+    resolver_config = {
+        'structure': args.structure,
+        'courses': args.courses,
+        'cache_dir': args.cache_dir,
+        'fuzzy_threshold': args.fuzzy_threshold,
+        'default_location': args.default_location,
+    }
+    resolver = install_resolver(report=args.review_report, **resolver_config)
+    if not isinstance(resolver, FuzzyResolver):
+        resolver = None
+
+    rows = iter_rows(args.input, args.format, cache_dir=args.cache_dir if args.row_cache else None)
+    stop = args.skip + args.limit if args.limit is not None else None
+    rows = itertools.islice(rows, args.skip, stop)
+
+    diff = None
+    on_skip = None
+    if args.manifest:
+        diff = ManifestDiff(ContentManifest.load(args.manifest) if args.incremental else ContentManifest())
+        on_skip = diff.keep
+    validator = ContentValidator(args.validate, upsert=args.incremental) if args.validate else None
+    pre_format = False
+    values_of = None
+    if args.workers > 1:
+        # Workers also pre-render INSERT values; items are (values, sql) pairs then
+        pre_format = args.output_format == 'insert'
+        items = parallel_entries(rows, args.workers, resolver_config, resolver, stats, on_skip,
+                                 pre_format=pre_format, chunk_size=args.chunk_size)
+        values_of = operator.itemgetter(0) if pre_format else None
+    else:
+        items = iter_entries(rows, stats, render=entry_values, on_skip=on_skip)
+    if diff is not None:
+        items = diff.filter(items, values_of)
+    if validator is not None:
+        items = validator.tap(items, values_of)
+    values = items
+    if pre_format:
+        sql_entries = map(operator.itemgetter(1), items)
+    else:
+        sql_entries = map(format_values, values) if args.output_format == 'insert' else None
+
+    try:
+        if args.output_format == 'insert':
+            report = {}
+            batches = write_batches(
+                sql_entries,
+                batch_size=args.batch_size,
+                output_dir=args.output_dir,
+                first_batch=args.first_batch,
+                first_entry=args.skip,
+                upsert=args.incremental,
+                max_bytes=args.max_bytes,
+                report=report,
+                out=out,
+            )
+            summary = f"{batches} batches"
+            print(size_report(report.get('sizes', []), report.get('rows', [])), file=sys.stderr)
+        elif args.output_format == 'copy-binary':
+            written = write_binary_copy(values, args.output_dir, out=out, stats=stats)
+            summary = f"a binary COPY stream of {written} rows"
+        else:
+            fmt = 'csv' if args.output_format == 'copy-csv' else 'text'
+            written = write_copy(values, fmt, args.output_dir, out=out, stats=stats)
+            summary = f"a COPY block of {written} rows"
+
+        if diff is not None and args.incremental:
+            removed = diff.removed_ids()
+            write_deletes(removed, args.output_dir, out=out)
+            print(f"Incremental: {diff.new} new, {diff.changed} changed, {diff.unchanged} unchanged, "
+                  f"{len(removed)} removed", file=sys.stderr)
+    except BrokenPipeError:
+        # psql stopped reading (it reports its own error); close() below reports its status
+        summary = "an interrupted stream"
+    if sink is not None:
+        try:
+            sink.close()
+        except OutputError as e:
+            print(f"-- ERROR: {e}; the manifest was not updated", file=sys.stderr)
+            return 1
+        size = sink.size()
+        if size is not None:
+            summary += f" ({size:,} bytes in {sink.label})"
+
+    if diff is not None:
+        diff.current.save(args.manifest)
+
+    if resolver is not None:
+        resolver.close()
+        print(f"Fuzzy matched {resolver.matched} lessons, {resolver.reviewed} sent to review", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    rate = stats['rows'] / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Processed {stats['rows']} rows ({stats['skipped']} skipped) into {summary} "
+        f"in {elapsed:.2f}s ({rate:,.0f} rows/sec)",
+        file=sys.stderr,
+    )
+    if validator is not None:
+        valid = validator.report()
+        validator.close()
+        if not valid:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
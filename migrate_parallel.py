@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Multi-process rendering of course_content rows, sharded by course
+Rows are bucketed by attached_to_course into chunks, resolved and rendered in a
+process pool, and handed back in input order so the output matches the serial path byte for byte
+"""
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate_migration_batch import entry_values, format_values, normalize_entry
+from lesson_fuzzy_match import install_resolver
+
+# Marks a row that was skipped, so the reorder buffer can move past it
+_SKIPPED = object()
+
+class _ReviewCollector:
+    """Stands in for the review report inside a worker; rows go back to the parent"""
+
+    def __init__(self):
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+
+_worker = {}
+
+def _init_worker(resolver_config):
+    _worker['collector'] = _ReviewCollector()
+    _worker['resolver'] = install_resolver(report=_worker['collector'], **resolver_config)
+
+def _render_row(row, pre_format):
+    """Rendered item for one row, or None if it is skipped (with the skipped id, if any)"""
+    try:
+        entry = normalize_entry(row)
+    except (TypeError, ValueError) as e:
+        print(f"-- WARNING: Skipping row with invalid id {row.get('id')!r}: {e}", file=sys.stderr)
+        return None, None
+    values = entry_values(entry)
+    if values is None:
+        return None, entry['id']
+    return ((values, format_values(values)) if pre_format else values), None
+
+def _render_chunk(chunk, pre_format):
+    """Resolve and render one shard; returns results plus counters for the parent
+
+    Review rows come back as (seq, row) pairs so the parent can write them in
+    input order.
+    """
+    resolver = _worker.get('resolver')
+    collector = _worker['collector']
+    matched_before = getattr(resolver, 'matched', 0)
+    results = []
+    skipped_ids = []
+    reviews = []
+    for seq, row in chunk:
+        item, skipped_id = _render_row(row, pre_format)
+        results.append((seq, item))
+        if skipped_id is not None:
+            skipped_ids.append(skipped_id)
+        reviews.extend((seq, review) for review in collector.rows)
+        collector.rows = []
+    return results, skipped_ids, getattr(resolver, 'matched', 0) - matched_before, reviews
+
+def _course_key(row):
+    return (row.get('attached_to_course') or '').strip()
+
+def parallel_entries(rows, workers, resolver_config, resolver=None, stats=None, on_skip=None,
+                     pre_format=False, chunk_size=500, max_buffered=None):
+    """Yield rendered rows in input order, rendering course shards in `workers` processes
+
+    Yields value tuples, or (values, sql) pairs with pre_format. At most
+    max_buffered rows (default 8 chunks per worker) wait in shards or in the
+    reorder buffer; past that the shard holding the oldest row is sent early.
+    `resolver` is the parent's FuzzyResolver, if any, which receives the
+    workers' match counts and review rows.
+    """
+    if max_buffered is None:
+        max_buffered = chunk_size * workers * 8
+    max_inflight = workers * 2
+
+    buckets = {}      # course -> [(seq, row)]
+    first_seq = {}    # course -> seq of the oldest row in its bucket
+    buffered = 0
+    ready = {}        # seq -> rendered item or _SKIPPED
+    reviews_of = {}   # seq -> review rows, written when the reorder buffer reaches seq
+    next_seq = 0
+    inflight = set()
+
+    def collect(done):
+        for future in done:
+            results, skipped_ids, matched, reviews = future.result()
+            for seq, item in results:
+                ready[seq] = _SKIPPED if item is None else item
+            if stats is not None:
+                stats['skipped'] += len(results) - sum(1 for _, item in results if item is not None)
+            if on_skip is not None:
+                for row_id in skipped_ids:
+                    on_skip({'id': row_id})
+            if resolver is not None:
+                resolver.matched += matched
+                resolver.reviewed += len(reviews)
+                if resolver.report is not None:
+                    for seq, row in reviews:
+                        reviews_of.setdefault(seq, []).append(row)
+
+    def submit(course):
+        nonlocal buffered
+        chunk = buckets.pop(course)
+        del first_seq[course]
+        buffered -= len(chunk)
+        inflight.add(pool.submit(_render_chunk, chunk, pre_format))
+
+    def drain():
+        nonlocal next_seq
+        while next_seq in ready:
+            item = ready.pop(next_seq)
+            for row in reviews_of.pop(next_seq, ()):
+                resolver.report.write(row)
+            next_seq += 1
+            if item is not _SKIPPED:
+                yield item
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(resolver_config,)) as pool:
+        for seq, row in enumerate(rows):
+            if stats is not None:
+                stats['rows'] += 1
+            course = _course_key(row)
+            bucket = buckets.get(course)
+            if bucket is None:
+                bucket = buckets[course] = []
+                first_seq[course] = seq
+            bucket.append((seq, row))
+            buffered += 1
+            if len(bucket) >= chunk_size:
+                submit(course)
+            elif buffered + len(ready) > max_buffered:
+                submit(min(first_seq, key=first_seq.get))
+
+            while len(inflight) >= max_inflight:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                inflight.difference_update(done)
+                collect(done)
+            yield from drain()
+
+        for course in sorted(first_seq, key=first_seq.get):
+            submit(course)
+        while inflight:
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            inflight.difference_update(done)
+            collect(done)
+            yield from drain()
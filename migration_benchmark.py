@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the CSV -> generate_sql_entry -> SQL batch path on synthetic catalogs
+Catalogs are generated deterministically with field lengths sampled from the real exports;
+each size runs in its own process so peak RSS is measured per size
+
+Usage:
+    python3 migration_benchmark.py                       # 1k, 10k, 100k against the baseline
+    python3 migration_benchmark.py --modes cold,warm     # row cache only
+    python3 migration_benchmark.py --sizes 1m
+    python3 migration_benchmark.py --update-baseline
+    python3 migration_benchmark.py --formatter           # compiled row formatter vs the pre-compiled one
+"""
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate_migration_batch import (
+    COLUMNS, COURSE_MAP, ENTRY_FIELDS, LESSON_MAP, RAW_COLUMNS, format_values, located_values,
+    normalize_entry, resolve_lesson
+)
+from lesson_resolver import CACHE_DIR
+from migrate_course_content import iter_rows, pack_statements, statement_overhead, write_batch
+
+PROFILE_SOURCES = ('all_course_content.csv', 'batch3_final.csv')
+BASELINE_FILE = 'migration_benchmark_baseline.json'
+BENCH_DIR = os.path.join(CACHE_DIR, 'bench')
+CATALOG_VERSION = 1
+
+DEFAULT_SIZES = '1k,10k,100k'
+# A run slower (or bigger) than the baseline by more than this fraction fails
+DEFAULT_TOLERANCE = 0.25
+STAGES = ('parse', 'resolve', 'quote', 'write')
+MODES = ('csv', 'cold', 'warm')
+# Rows per stage step; stage timers run once per chunk rather than once per row
+STAGE_CHUNK = 1000
+BATCH_SIZE = 20
+
+# Rows timed by --formatter. It reports the compiled formatter's speedup over the pre-compiled
+# generate_sql_entry path but does not gate on it: the target was 3x, but on ~2.8 KB rows joining the
+# values alone costs ~4.5 of the legacy path's ~21 us/row, and runs measure 1.8-4.1x (typically ~2.5x).
+FORMATTER_ROWS = 10000
+
+# Share of generated lessons whose titles are not in LESSON_MAP (skipped with a warning)
+UNKNOWN_TITLE_RATE = 0.05
+# Generated text is sliced out of one shuffled corpus of words from the exports
+CORPUS_WORDS = 200000
+
+PLACEHOLDER_FIELDS = ('id', 'lesson_id', 'lesson_title', 'attached_to_course', 'created_at', 'updated_at', 'chapter_id')
+TEXT_FIELDS = tuple(field for field in ENTRY_FIELDS if field not in PLACEHOLDER_FIELDS)
+
+def parse_size(text):
+    """'10k' -> 10000, '1m' -> 1000000"""
+    text = text.strip().lower()
+    scale = {'k': 1000, 'm': 1000000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * scale)
+
+def size_label(rows):
+    for scale, suffix in ((1000000, 'm'), (1000, 'k')):
+        if rows >= scale and rows % scale == 0:
+            return f"{rows // scale}{suffix}"
+    return str(rows)
+
+class FieldProfile:
+    """Observed length of every text field, and the words they are written in"""
+
+    def __init__(self, lengths, words):
+        self.lengths = lengths
+        self.words = words
+
+    @classmethod
+    def from_exports(cls, sources=PROFILE_SOURCES):
+        lengths = {field: [] for field in TEXT_FIELDS}
+        words = set()
+        for source in sources:
+            if not os.path.exists(source):
+                continue
+            for row in iter_rows(source, 'csv'):
+                for field in TEXT_FIELDS:
+                    value = row.get(field)
+                    if not isinstance(value, str):
+                        continue
+                    lengths[field].append(len(value))
+                    words.update(value.split())
+        if not words:
+            raise FileNotFoundError(f"No profile source found among {', '.join(sources)}")
+        for field, observed in lengths.items():
+            if not observed:
+                lengths[field] = [0]
+        return cls(lengths, sorted(words))
+
+class SyntheticCatalog:
+    """Deterministic course_content rows; the first N rows are the same for every size"""
+
+    def __init__(self, profile, seed=0):
+        self.profile = profile
+        self.seed = seed
+        rng = random.Random(f"corpus:{seed}")
+        self.corpus = ' '.join(rng.choice(profile.words) for _ in range(CORPUS_WORDS))
+        course_titles = {course_id: title for title, course_id in COURSE_MAP.items()}
+        self.lessons = sorted((title, course_titles[location[0]]) for title, location in LESSON_MAP.items())
+        self.courses = sorted(COURSE_MAP)
+
+    def _text(self, rng, length):
+        if length <= 0:
+            return ''
+        start = rng.randrange(0, len(self.corpus) - length) if length < len(self.corpus) else 0
+        return self.corpus[start:start + length].strip()
+
+    def rows(self, count):
+        rng = random.Random(self.seed)
+        lengths = self.profile.lengths
+        for row_id in range(1, count + 1):
+            if rng.random() < UNKNOWN_TITLE_RATE:
+                title, course = self._text(rng, rng.randint(20, 90)), rng.choice(self.courses)
+            else:
+                title, course = rng.choice(self.lessons)
+            row = {
+                'id': row_id,
+                'lesson_id': f"{rng.getrandbits(32):08x}",
+                'lesson_title': title,
+                'attached_to_course': course,
+                'created_at': f"2025-09-{rng.randint(1, 28):02d} 0{rng.randint(0, 9)}:46:12.{rng.randint(0, 999999):06d}+00",
+                'chapter_id': f"{rng.getrandbits(32):08x}",
+            }
+            row['updated_at'] = row['created_at']
+            for field in TEXT_FIELDS:
+                # Jitter sampled lengths so a small profile still gives a spread of sizes
+                row[field] = self._text(rng, int(rng.choice(lengths[field]) * rng.uniform(0.8, 1.2)))
+            yield row
+
+def catalog_path(rows, seed=0, bench_dir=BENCH_DIR):
+    return os.path.join(bench_dir, f"catalog_v{CATALOG_VERSION}_{size_label(rows)}_seed{seed}.csv")
+
+def ensure_catalog(rows, seed=0, bench_dir=BENCH_DIR, profile_sources=PROFILE_SOURCES):
+    """Path of the synthetic catalog CSV for a size, generating it on first use"""
+    path = catalog_path(rows, seed, bench_dir)
+    if os.path.exists(path):
+        return path
+    os.makedirs(bench_dir, exist_ok=True)
+    catalog = SyntheticCatalog(FieldProfile.from_exports(profile_sources), seed)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=ENTRY_FIELDS)
+        writer.writeheader()
+        writer.writerows(catalog.rows(rows))
+    os.replace(tmp_path, path)
+    return path
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def run_pipeline(path, output_path, cache_dir=None):
+    """Push a catalog through parse -> resolve -> quote -> write and time each stage
+
+    With cache_dir the rows come through the row cache: the first run over a
+    catalog parses and writes it (cold), later runs read it back (warm).
+    """
+    timings = dict.fromkeys(STAGES, 0.0)
+    rows = skipped = batches = 0
+    overhead = statement_overhead()
+    clock = time.perf_counter
+    started = clock()
+    source = iter_rows(path, 'csv', cache_dir=cache_dir)
+    # Resolver warnings are still printed (that is part of the cost) but not shown
+    with open(output_path, 'w', encoding='utf-8') as out, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stderr(devnull):
+        while True:
+            t0 = clock()
+            entries = [normalize_entry(row) for row in itertools.islice(source, STAGE_CHUNK)]
+            t1 = clock()
+            if not entries:
+                break
+            locations = [resolve_lesson(entry) for entry in entries]
+            t2 = clock()
+            sql_entries = [
+                format_values(located_values(entry, location))
+                for entry, location in zip(entries, locations) if location is not None
+            ]
+            t3 = clock()
+            for batch, _ in pack_statements(sql_entries, BATCH_SIZE, None, overhead):
+                batches += 1
+                write_batch(out, batches, rows, batch, BATCH_SIZE)
+            t4 = clock()
+            timings['parse'] += t1 - t0
+            timings['resolve'] += t2 - t1
+            timings['quote'] += t3 - t2
+            timings['write'] += t4 - t3
+            rows += len(entries)
+            skipped += len(entries) - len(sql_entries)
+    seconds = clock() - started
+    input_bytes = os.path.getsize(path)
+    return {
+        'rows': rows,
+        'skipped': skipped,
+        'batches': batches,
+        'input_bytes': input_bytes,
+        'output_bytes': os.path.getsize(output_path),
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds if seconds else 0.0,
+        'bytes_per_sec': input_bytes / seconds if seconds else 0.0,
+        'stages': timings,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+def _measure_once(path, row_cache=None):
+    command = [sys.executable, os.path.abspath(__file__), '--measure', path]
+    if row_cache:
+        command += ['--row-cache', row_cache]
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout)
+
+def measure(rows, seed=0, bench_dir=BENCH_DIR, modes=MODES):
+    """Benchmark one size, each mode in a fresh interpreter; returns one result per mode
+
+    'csv' parses the catalog directly; 'cold' parses it while writing a fresh
+    row cache and 'warm' then reads that cache back.
+    """
+    path = ensure_catalog(rows, seed, bench_dir)
+    results = []
+    with tempfile.TemporaryDirectory() as row_cache:
+        for mode in modes:
+            if mode == 'warm' and 'cold' not in modes:
+                _measure_once(path, row_cache)
+            result = _measure_once(path, row_cache if mode != 'csv' else None)
+            result['size'] = size_label(rows)
+            result['mode'] = mode
+            results.append(result)
+    return results
+
+def legacy_dollar_quote(text):
+    """dollar_quote before the compiled schema: always $$, with any $$ in the text rewritten"""
+    if text is None:
+        return 'NULL'
+    text_str = str(text)
+    return f"$${text_str.replace('$$', '$TAG$')}$$"
+
+def legacy_entry_sql(row, location):
+    """generate_sql_entry before the compiled schema (normalize_entry, located_values,
+    format_values and dollar_quote as of 1422fb2^), with the lesson lookup already done"""
+    entry = {field: row.get(field) for field in ENTRY_FIELDS}
+    entry['id'] = int(entry['id'])
+    resolved = dict(zip(('course_id', 'chapter_number', 'lesson_number'), location))
+    values = tuple(resolved[column] if column in resolved else entry.get(column) for column in COLUMNS)
+    return "(" + ", ".join(
+        str(value) if column in RAW_COLUMNS else legacy_dollar_quote(value)
+        for column, value in zip(COLUMNS, values)
+    ) + ")"
+
+def compiled_entry_sql(row, location):
+    return format_values(located_values(normalize_entry(row), location))
+
+def formatter_benchmark(rows=FORMATTER_ROWS, seed=0, bench_dir=BENCH_DIR, repeat=5):
+    """Best-of-`repeat` seconds to render `rows` catalog rows with each formatter
+
+    Locations are resolved up front so only normalizing and quoting are timed;
+    both formatters must produce the same SQL on rows without '$$' (the legacy
+    one rewrote '$$' instead of picking a tag).
+    """
+    path = ensure_catalog(rows, seed, bench_dir)
+    with contextlib.redirect_stderr(open(os.devnull, 'w')):
+        source = list(iter_rows(path, 'csv'))
+        pairs = [(row, resolve_lesson(normalize_entry(row))) for row in source]
+    pairs = [(row, location) for row, location in pairs if location is not None]
+    checked = [(row, location) for row, location in pairs[:1000] if '$$' not in ''.join(filter(None, row.values()))]
+    for row, location in checked:
+        if legacy_entry_sql(row, location) != compiled_entry_sql(row, location):
+            raise AssertionError(f"Formatters disagree on row {row.get('id')}")
+    timings = {}
+    for name, render in (('legacy', legacy_entry_sql), ('compiled', compiled_entry_sql)):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for row, location in pairs:
+                render(row, location)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+    return {
+        'rows': len(pairs),
+        'legacy_seconds': timings['legacy'],
+        'compiled_seconds': timings['compiled'],
+        'speedup': timings['legacy'] / timings['compiled'] if timings['compiled'] else 0.0,
+    }
+
+def result_key(result):
+    """Baseline key: the size alone for plain CSV runs, else size and mode"""
+    return result['size'] if result['mode'] == 'csv' else f"{result['size']} {result['mode']}"
+
+def compare(result, baseline, tolerance):
+    """Regression messages for a result against its stored baseline, empty if none"""
+    if not baseline:
+        return []
+    problems = []
+    floor = baseline['rows_per_sec'] * (1 - tolerance)
+    if result['rows_per_sec'] < floor:
+        problems.append(
+            f"{result_key(result)}: {result['rows_per_sec']:,.0f} rows/sec is below "
+            f"{floor:,.0f} (baseline {baseline['rows_per_sec']:,.0f})"
+        )
+    ceiling = baseline['peak_rss_mb'] * (1 + tolerance)
+    if result['peak_rss_mb'] > ceiling:
+        problems.append(
+            f"{result_key(result)}: peak RSS {result['peak_rss_mb']:.1f} MB is above "
+            f"{ceiling:.1f} MB (baseline {baseline['peak_rss_mb']:.1f} MB)"
+        )
+    return problems
+
+def load_baselines(path=BASELINE_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baselines(baselines, path=BASELINE_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def format_result(result):
+    stages = ' '.join(f"{stage} {result['stages'][stage]:.2f}s" for stage in STAGES)
+    return (
+        f"{result_key(result):>10}: {result['seconds']:7.2f}s  {result['rows_per_sec']:>9,.0f} rows/s  "
+        f"{result['bytes_per_sec'] / 1e6:6.1f} MB/s  peak RSS {result['peak_rss_mb']:6.1f} MB  [{stages}]"
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="comma-separated row counts, e.g. 1k,10k,100k,1m")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--bench-dir', default=BENCH_DIR, help="where generated catalogs are kept")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--update-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help="csv (parse every run), cold (parse and fill the row cache), warm (read the cache)")
+    parser.add_argument('--formatter', action='store_true',
+                        help=f"time the compiled row formatter against the pre-compiled one on {FORMATTER_ROWS:,} rows")
+    parser.add_argument('--measure', metavar='CATALOG', help=argparse.SUPPRESS)
+    parser.add_argument('--row-cache', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.measure:
+        # Child process: one size, result as JSON on stdout
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run_pipeline(args.measure, os.path.join(tmp, 'out.sql'), args.row_cache)
+        json.dump(result, sys.stdout)
+        return 0
+
+    if args.formatter:
+        result = formatter_benchmark(seed=args.seed, bench_dir=args.bench_dir)
+        print(
+            f"{result['rows']:,} rows: legacy {result['legacy_seconds'] * 1e6 / result['rows']:.2f} us/row, "
+            f"compiled {result['compiled_seconds'] * 1e6 / result['rows']:.2f} us/row ({result['speedup']:.1f}x)"
+        )
+        return 0
+
+    baselines = load_baselines(args.baseline)
+    results = []
+    problems = []
+    modes = tuple(mode for mode in args.modes.split(',') if mode)
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(sorted(unknown))}")
+    for rows in (parse_size(size) for size in args.sizes.split(',') if size.strip()):
+        for result in measure(rows, args.seed, args.bench_dir, modes):
+            results.append(result)
+            if not args.json:
+                print(format_result(result))
+            if not args.update_baseline:
+                problems += compare(result, baselines.get(result_key(result)), args.tolerance)
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    if args.update_baseline:
+        for result in results:
+            baselines[result_key(result)] = {
+                key: round(result[key], 1) for key in ('rows_per_sec', 'bytes_per_sec', 'peak_rss_mb')
+            }
+        save_baselines(baselines, args.baseline)
+        print(f"Baseline updated: {args.baseline}", file=sys.stderr)
+        return 0
+    for problem in problems:
+        print(f"REGRESSION: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Run the course migration files as a dependency graph against a local stand-in database
+CORRECT_COURSE_SCHEMA_MIGRATION -> MIGRATE_COURSE_STRUCTURE_DATA -> MIGRATE_COURSE_DESCRIPTION_DATA
+-> content batches; batches that share no row ids run concurrently over a connection pool.
+Completed steps are checkpointed per target so an interrupted run resumes where it stopped.
+
+Usage:
+    python3 migration_dag.py migrations/ --target sqlite:///standin.db --pool 4
+    python3 migration_dag.py migrations/ --target postgresql://localhost/catalyst --dry-run
+"""
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from migrate_course_content import BATCH_FILENAME, DELETES_FILENAME
+from sql_dump_reader import SQLDumpError, iter_dump_inserts, split_statements
+from standin_db import StandIn
+
+# The manual order spelled out in every batch header; each runs after the one before it
+SETUP_STEPS = (
+    'CORRECT_COURSE_SCHEMA_MIGRATION.sql',
+    'MIGRATE_COURSE_STRUCTURE_DATA.sql',
+    'MIGRATE_COURSE_DESCRIPTION_DATA.sql',
+)
+CHECKPOINT_FILENAME = '.migration_dag_checkpoint.json'
+# Rows per executemany when replaying INSERTs into SQLite
+REPLAY_BATCH = 500
+
+_BATCH_NUMBER = re.compile(re.escape(BATCH_FILENAME).replace(r'\{\}', r'(\d+)') + '$')
+
+class Step:
+    """One migration file and the steps that must have committed before it"""
+
+    def __init__(self, name, path, deps=()):
+        self.name = name
+        self.path = path
+        self.deps = set(deps)
+        self.seconds = None
+        self.skipped = []
+
+    def digest(self):
+        digest = hashlib.blake2b(digest_size=16)
+        with open(self.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+def _inserted_ids(path):
+    """Ids a batch file inserts, or None when the file cannot be parsed"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return {row['id'] for _, row in iter_dump_inserts(f) if row.get('id') is not None}
+    except SQLDumpError as e:
+        print(f"-- WARNING: Cannot read ids from {os.path.basename(path)} ({e}); running it after every "
+              f"earlier batch", file=sys.stderr)
+        return None
+
+def build_dag(migrations_dir):
+    """Steps found in migrations_dir, keyed by file name, with their dependency edges
+
+    Setup files form a chain. Content batches depend on the last setup step and
+    on any earlier batch that writes one of the same ids; the deletes file runs last.
+    """
+    steps = {}
+    previous = None
+    for name in SETUP_STEPS:
+        path = os.path.join(migrations_dir, name)
+        if os.path.exists(path):
+            steps[name] = Step(name, path, [previous] if previous else [])
+            previous = name
+
+    batches = []
+    for path in glob.glob(os.path.join(migrations_dir, BATCH_FILENAME.format('*'))):
+        m = _BATCH_NUMBER.search(os.path.basename(path))
+        if m:
+            batches.append((int(m.group(1)), path))
+    batches.sort()
+    last_writer = {}   # id -> latest batch inserting it; ordering after it covers the earlier ones too
+    batch_names = []
+    for _, path in batches:
+        name = os.path.basename(path)
+        ids = _inserted_ids(path)
+        if ids is None:
+            deps = set(batch_names)
+        else:
+            deps = {last_writer[row_id] for row_id in ids if row_id in last_writer}
+            last_writer.update(dict.fromkeys(ids, name))
+        if previous:
+            deps.add(previous)
+        steps[name] = Step(name, path, deps)
+        batch_names.append(name)
+
+    deletes = os.path.join(migrations_dir, DELETES_FILENAME)
+    if os.path.exists(deletes):
+        steps[DELETES_FILENAME] = Step(DELETES_FILENAME, deletes, batch_names or ([previous] if previous else []))
+    return steps
+
+class CheckpointMismatch(Exception):
+    """The checkpoint was written for a different target database"""
+
+class Checkpoint:
+    """Completed steps and their file hashes for one target, rewritten atomically after every step"""
+
+    def __init__(self, path, target):
+        self.path = path
+        self.target = target
+        self.done = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('target') != target:
+                raise CheckpointMismatch(
+                    f"{path} records steps run against {saved.get('target') or 'an unrecorded target'}, "
+                    f"not {target}; use --restart"
+                )
+            self.done = saved.get('done', {})
+
+    def completed(self, step, digest):
+        record = self.done.get(step.name)
+        return record is not None and record['hash'] == digest
+
+    def record(self, step, digest):
+        with self._lock:
+            self.done[step.name] = {
+                'hash': digest,
+                'seconds': round(step.seconds, 4),
+                'finished_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            }
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'target': self.target, 'done': self.done}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+class ConnectionPool:
+    """Fixed set of stand-in connections, checked out one step at a time"""
+
+    def __init__(self, target, size):
+        self.size = size
+        self._free = queue.Queue()
+        self._all = [StandIn(target) for _ in range(size)]
+        for db in self._all:
+            if db.is_sqlite:
+                db.execute("PRAGMA journal_mode = WAL")
+            self._free.put(db)
+
+    def acquire(self):
+        return self._free.get()
+
+    def release(self, db):
+        self._free.put(db)
+
+    def close(self):
+        for db in self._all:
+            db.close()
+
+# Comments and whitespace ahead of a statement's first keyword
+_LEADING = re.compile(r'(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/)*', re.S)
+# An INSERT's trailing ON CONFLICT clause; it holds no quoted text, so a value cannot end in one
+_CONFLICT = re.compile(r'\)\s*(ON\s+CONFLICT\b[^\'"$]*)$', re.I)
+# Transaction control is the step's own; these are dropped without being reported
+_TRANSACTION = ('BEGIN', 'COMMIT', 'END', 'START')
+
+def _replay_inserts(db, path):
+    """SQLite cannot parse Postgres dollar quotes, so INSERT rows are replayed as parameters
+
+    Tables are created untyped on first use, keyed by id when there is one. Each INSERT is
+    replayed as written: a plain INSERT fails on an existing id as it would on Postgres, and
+    an ON CONFLICT clause is passed through. Returns the statements that were not run.
+    """
+    created = set()
+    batch = []
+    key = None
+    skipped = []
+
+    def flush():
+        if batch:
+            table, columns, conflict = key
+            db.executemany(
+                f'INSERT INTO "{table}" ({", ".join(columns)}) VALUES ({db.placeholders(len(columns))})'
+                + (f' {conflict}' if conflict else ''),
+                batch,
+            )
+            batch.clear()
+
+    with open(path, encoding='utf-8') as f:
+        statements = split_statements(f.read())
+    for statement in statements:
+        body = statement[_LEADING.match(statement).end():].rstrip()
+        if not body:
+            continue
+        keyword = body.split(None, 1)[0].upper()
+        if keyword != 'INSERT':
+            if keyword not in _TRANSACTION:
+                skipped.append(body)
+            continue
+        conflict = _CONFLICT.search(body)
+        conflict = ' '.join(conflict.group(1).split()) if conflict else None
+        try:
+            rows = list(iter_dump_inserts(io.StringIO(body)))
+        except SQLDumpError:
+            # INSERT ... SELECT and other forms without a VALUES list
+            skipped.append(body)
+            continue
+        for table, row in rows:
+            columns = tuple(row)
+            if (table, columns, conflict) != key:
+                flush()
+                key = (table, columns, conflict)
+            if table not in created:
+                primary = ", PRIMARY KEY (id)" if 'id' in columns else ""
+                db.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({", ".join(columns)}{primary})')
+                created.add(table)
+            batch.append(tuple(row.values()))
+            if len(batch) >= REPLAY_BATCH:
+                flush()
+    flush()
+    return skipped
+
+def _summary(statement, width=80):
+    line = ' '.join(statement.split())
+    return line if len(line) <= width else line[:width - 3] + '...'
+
+def run_step(pool, step):
+    """Execute one migration file in its own transaction; returns its duration
+
+    On SQLite, step.skipped lists the statements the replay could not run.
+    """
+    db = pool.acquire()
+    started = time.perf_counter()
+    try:
+        if db.is_sqlite:
+            step.skipped = _replay_inserts(db, step.path)
+        else:
+            with open(step.path, encoding='utf-8') as f:
+                db.execute(f.read())
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        pool.release(db)
+    return time.perf_counter() - started
+
+def critical_path(steps):
+    """(seconds, [step names]) of the longest dependency chain by step duration
+
+    steps must be in dependency order, as build_dag returns them.
+    """
+    best = {}   # name -> (seconds to finish, predecessor on the longest chain)
+    for name, step in steps.items():
+        before = max(step.deps, key=lambda dep: best[dep][0], default=None)
+        best[name] = ((best[before][0] if before else 0.0) + (step.seconds or 0.0), before)
+    if not best:
+        return 0.0, []
+    name = max(best, key=lambda n: best[n][0])
+    seconds = best[name][0]
+    path = []
+    while name is not None:
+        path.append(name)
+        name = best[name][1]
+    return seconds, path[::-1]
+
+def run_dag(steps, pool, checkpoint, out=sys.stderr):
+    """Run every step once its dependencies are done, up to one step per pooled connection
+
+    Returns the names of failed steps; steps that depend on them are not started.
+    """
+    pending = {}      # name -> file hash, for steps still to run
+    digests = {}
+    done = set()
+    for name, step in steps.items():
+        digest = step.digest()
+        if checkpoint.completed(step, digest):
+            step.seconds = checkpoint.done[name]['seconds']
+            done.add(name)
+            print(f"-- skip {name} (checkpointed)", file=out)
+        else:
+            pending[name] = digests[name] = digest
+
+    failed = []
+    running = {}
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        while pending or running:
+            if not failed:
+                for name in [n for n in pending if steps[n].deps <= done]:
+                    running[executor.submit(run_step, pool, steps[name])] = name
+                    del pending[name]
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                step = steps[name]
+                try:
+                    step.seconds = future.result()
+                except Exception as e:
+                    failed.append(name)
+                    print(f"-- FAILED {name}: {e}", file=out)
+                    continue
+                checkpoint.record(step, digests[name])
+                done.add(name)
+                print(f"-- done {name} in {step.seconds:.2f}s", file=out)
+                if step.skipped:
+                    print(f"-- WARNING: {len(step.skipped)} statement(s) in {name} could not be replayed "
+                          f"on the SQLite stand-in:", file=out)
+                    for statement in step.skipped:
+                        print(f"--   {_summary(statement)}", file=out)
+    return failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('migrations_dir', help="directory holding the migration .sql files")
+    parser.add_argument('--target', default='sqlite:///migration_standin.db',
+                        help="stand-in database: sqlite:///path.db or postgresql://...")
+    parser.add_argument('--pool', type=int, default=4, help="connections, i.e. steps run at once")
+    parser.add_argument('--checkpoint', help=f"checkpoint file (default: <migrations_dir>/{CHECKPOINT_FILENAME})")
+    parser.add_argument('--restart', action='store_true', help="ignore the checkpoint and run every step")
+    parser.add_argument('--dry-run', action='store_true', help="print the graph without running it")
+    args = parser.parse_args(argv)
+
+    if args.pool < 1:
+        parser.error("--pool must be at least 1")
+    if args.target.startswith('sqlite://') and not args.target.startswith('sqlite:///'):
+        parser.error("an in-memory SQLite database cannot be shared by a pool; use sqlite:///path.db")
+
+    steps = build_dag(args.migrations_dir)
+    if not steps:
+        print(f"No migration files found in {args.migrations_dir}", file=sys.stderr)
+        return 1
+    if args.dry_run:
+        for name, step in steps.items():
+            print(f"{name} <- {', '.join(sorted(step.deps)) or '(start)'}")
+        return 0
+
+    checkpoint_path = args.checkpoint or os.path.join(args.migrations_dir, CHECKPOINT_FILENAME)
+    if args.restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    try:
+        checkpoint = Checkpoint(checkpoint_path, args.target)
+    except CheckpointMismatch as e:
+        print(f"-- ERROR: {e}", file=sys.stderr)
+        return 1
+
+    pool = ConnectionPool(args.target, args.pool)
+    started = time.perf_counter()
+    try:
+        failed = run_dag(steps, pool, checkpoint)
+    finally:
+        pool.close()
+    wall = time.perf_counter() - started
+
+    total = sum(step.seconds or 0.0 for step in steps.values())
+    path_seconds, path = critical_path(steps)
+    print(
+        f"{len(steps)} steps: wall {wall:.2f}s, step total {total:.2f}s, "
+        f"critical path {path_seconds:.2f}s ({' -> '.join(path)})",
+        file=sys.stderr,
+    )
+    skipped = sum(len(step.skipped) for step in steps.values())
+    if skipped:
+        print(f"{skipped} statement(s) were not run on the SQLite stand-in (listed above)", file=sys.stderr)
+    if failed:
+        print(f"{len(failed)} step(s) failed; rerun to resume from the checkpoint", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
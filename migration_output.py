@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Buffered output for generated migrations: plain, gzip- or zstd-compressed, or piped into psql
+Output is collected into 1 MiB blocks before it reaches the file, compressor or pipe, so
+tens of MB of SQL go out in a few dozen writes instead of one per row
+
+Usage:
+    python3 migrate_course_content.py all_course_content.csv --output migrations.sql.gz
+    python3 migrate_course_content.py all_course_content.csv --output migrations.sql.zst
+    python3 migrate_course_content.py all_course_content.csv --output-format copy --output psql:postgresql://localhost/catalyst
+    python3 migration_output.py migrations.sql.gz           # decompress to stdout
+"""
+import gzip
+import io
+import os
+import shutil
+import subprocess
+import sys
+
+BUFFER_SIZE = 1 << 20
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+COMPRESSIONS = ('gzip', 'zstd')
+SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+PSQL_PREFIX = 'psql'
+
+class OutputError(Exception):
+    """The output could not be opened or a pipe (psql, zstd) did not finish cleanly"""
+
+def compression_for(path):
+    """'gzip' or 'zstd' from a file suffix, else None"""
+    return SUFFIXES.get(os.path.splitext(path)[1].lower())
+
+class OutputSink:
+    """A buffered binary stream over a file, stdout or pipe, with the layers to finish on close"""
+
+    def __init__(self, raw, label, owns_raw=True):
+        self.label = label
+        self._layers = [raw] if owns_raw else []   # closed innermost last
+        self._raw = raw
+        self._owns_raw = owns_raw
+        self._processes = []
+        self._text = None
+        self.binary = raw
+
+    def _push(self, layer):
+        self._layers.append(layer)
+        self.binary = layer
+
+    def _buffer(self):
+        self._push(io.BufferedWriter(_Unclosed(self.binary), BUFFER_SIZE))
+
+    def text(self):
+        """UTF-8 text view of the stream (created once)"""
+        if self._text is None:
+            self._text = io.TextIOWrapper(_Unclosed(self.binary), encoding='utf-8', newline='')
+        return self._text
+
+    def close(self):
+        """Flush and close every layer, then wait for any pipe; raises OutputError if one failed"""
+        problems = []
+        broken = False
+        for layer in ([self._text] if self._text is not None else []) + self._layers[::-1]:
+            try:
+                if not broken:
+                    layer.flush()
+                layer.close()
+            except BrokenPipeError:
+                broken = True
+            except (OSError, ValueError):
+                # Closing what is left after a broken pipe; the pipe's status is reported below
+                if not broken:
+                    raise
+        if broken:
+            problems.append(f"{self.label} closed its input early")
+        if not self._owns_raw and not broken:
+            self._raw.flush()
+        for name, process in self._processes:
+            if process.wait() != 0:
+                problems.append(f"{name} exited with status {process.returncode}")
+        if problems:
+            raise OutputError("; ".join(problems))
+
+    def size(self):
+        """Bytes written to the output file, when the output is a file"""
+        name = getattr(self._raw, 'name', None)
+        return os.path.getsize(name) if isinstance(name, str) and os.path.exists(name) else None
+
+class _Unclosed(io.RawIOBase):
+    """Passes writes to a stream without closing it, so each layer is closed exactly once by OutputSink"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.stream.write(data)
+        return len(data)
+
+    def flush(self):
+        if not self.stream.closed:
+            self.stream.flush()
+
+def _compress(sink, compression, level=None):
+    if compression == 'gzip':
+        # mtime=0 keeps the artifact byte-identical across runs of the same input
+        sink._push(gzip.GzipFile(fileobj=_Unclosed(sink.binary), mode='wb',
+                                 compresslevel=level or GZIP_LEVEL, mtime=0))
+        return
+    try:
+        import zstandard
+    except ImportError:
+        zstandard = None
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=level or ZSTD_LEVEL)
+        sink._push(compressor.stream_writer(_Unclosed(sink.binary), closefd=False))
+        return
+    binary = shutil.which('zstd')
+    if binary is None:
+        raise OutputError("zstd output needs the zstandard package (pip install zstandard) or a zstd binary on PATH")
+    # The zstd process writes to the sink's stream directly, so that stream must be a real file
+    sink.binary.flush()
+    process = subprocess.Popen([binary, '-q', '-c', f'-{level or ZSTD_LEVEL}'], stdin=subprocess.PIPE,
+                               stdout=sink.binary.fileno())
+    sink._processes.append(('zstd', process))
+    sink._push(process.stdin)
+
+def open_output(target='-', compression=None, level=None):
+    """OutputSink for '-' (stdout), a file path or 'psql[:URL]'
+
+    A .gz / .zst file suffix picks the compression when none is given; psql
+    output is never compressed. psql runs the whole stream as one transaction
+    and stops at the first error.
+    """
+    if compression not in (None,) + COMPRESSIONS:
+        raise OutputError(f"Unknown compression {compression!r}; use {' or '.join(COMPRESSIONS)}")
+    if target == PSQL_PREFIX or target.startswith(PSQL_PREFIX + ':'):
+        if compression:
+            raise OutputError("psql output cannot be compressed")
+        binary = shutil.which('psql')
+        if binary is None:
+            raise OutputError("psql is not on PATH")
+        url = target[len(PSQL_PREFIX) + 1:]
+        command = [binary, '-X', '-q', '-v', 'ON_ERROR_STOP=1', '--single-transaction'] + ([url] if url else [])
+        process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        sink = OutputSink(process.stdin, 'psql')
+        sink._processes.append(('psql', process))
+        sink._buffer()
+        return sink
+
+    if target == '-':
+        sink = OutputSink(sys.stdout.buffer, 'stdout', owns_raw=False)
+    else:
+        compression = compression or compression_for(target)
+        sink = OutputSink(open(target, 'wb'), target)
+    if compression:
+        _compress(sink, compression, level)
+    sink._buffer()
+    return sink
+
+def open_input(path):
+    """Binary stream for a possibly compressed file written by open_output"""
+    compression = compression_for(path)
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            zstandard = None
+        if zstandard is not None:
+            return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))
+        binary = shutil.which('zstd')
+        if binary is None:
+            raise OutputError("reading .zst needs the zstandard package or a zstd binary on PATH")
+        return subprocess.Popen([binary, '-q', '-d', '-c', path], stdout=subprocess.PIPE).stdout
+    return open(path, 'rb')
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    with open_input(argv[0]) as stream:
+        shutil.copyfileobj(stream, sys.stdout.buffer, BUFFER_SIZE)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
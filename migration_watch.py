@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Watch the content exports and the course-structure source, regenerating only what an edit touches
+Rows are kept rendered in memory between edits; a changed file is re-read and only rows whose
+hash is new are resolved and rendered again. Batch files whose contents did not change are not rewritten.
+The batch files match what migrate_course_content.py --output-dir writes for the same inputs.
+
+Usage:
+    python3 migration_watch.py all_course_content.csv batch3_final.csv --output-dir migrations/
+    python3 migration_watch.py all_course_content.csv --structure course_structure.csv --output-dir migrations/
+    python3 migration_watch.py all_course_content.csv --output-dir migrations/ --once
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from content_manifest import row_hash
+from generate_migration_batch import ENTRY_FIELDS, format_values, located_values, normalize_entry, resolve_lesson
+from lesson_fuzzy_match import install_resolver
+from lesson_resolver import CACHE_DIR
+from migrate_course_content import BATCH_FILENAME, iter_rows, write_batch
+from sql_dump_reader import SQLDumpError
+
+DEFAULT_INTERVAL = 0.5
+# A file still being written by an editor fails to parse; the previous rows are kept until it does
+READ_ERRORS = (OSError, ValueError, csv.Error, SQLDumpError, json.JSONDecodeError, UnicodeDecodeError)
+
+class _Row:
+    """One input row with its resolved location and rendered SQL (None when it cannot be mapped)"""
+
+    __slots__ = ('digest', 'entry', 'location', 'sql')
+
+    def __init__(self, digest, entry, location, sql):
+        self.digest = digest
+        self.entry = entry
+        self.location = location
+        self.sql = sql
+
+def _render(entry, location):
+    return format_values(located_values(entry, location)) if location is not None else None
+
+def _batch_number(path):
+    prefix, suffix = BATCH_FILENAME.split('{}')
+    number = os.path.basename(path)[len(prefix):-len(suffix)]
+    return int(number) if number.isdigit() else 0
+
+def _fingerprint(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+class ContentWatcher:
+    """Rendered rows per input file, kept warm so an edit only re-renders the rows it changed"""
+
+    def __init__(self, inputs, output_dir, batch_size=20, resolver_config=None, out=sys.stderr):
+        self.inputs = list(inputs)
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.resolver_config = resolver_config or {}
+        self.out = out
+        self.rows = {path: [] for path in self.inputs}
+        self.seen = {}        # watched path -> (size, mtime_ns) when last read
+        self.written = None   # per batch file: (first_entry, sql entries) last written
+        self.index_loaded = False
+
+    def structure_sources(self):
+        return [source for source in (self.resolver_config.get('structure'), self.resolver_config.get('courses'))
+                if source and not source.startswith('sqlite://')]
+
+    def changed_paths(self):
+        """Watched paths whose size or mtime moved since they were last read"""
+        return [path for path in self.inputs + self.structure_sources()
+                if _fingerprint(path) != self.seen.get(path)]
+
+    def load_file(self, path):
+        """Re-read one input; only rows with a new hash are resolved and rendered
+
+        Returns (rendered, reused) counts, or None when the file cannot be read yet.
+        """
+        seen = _fingerprint(path)
+        previous = {}
+        for row in self.rows[path]:
+            previous.setdefault(row.digest, []).append(row)
+        rows = []
+        rendered = reused = 0
+        try:
+            for raw in iter_rows(path):
+                digest = row_hash(tuple(raw.get(field) for field in ENTRY_FIELDS))
+                same = previous.get(digest)
+                if same:
+                    rows.append(same.pop())
+                    reused += 1
+                    continue
+                try:
+                    entry = normalize_entry(raw)
+                except (TypeError, ValueError) as e:
+                    print(f"-- WARNING: Skipping row with invalid id {raw.get('id')!r}: {e}", file=self.out)
+                    continue
+                location = resolve_lesson(entry)
+                rows.append(_Row(digest, entry, location, _render(entry, location)))
+                rendered += 1
+        except READ_ERRORS as e:
+            print(f"-- WARNING: Cannot read {path} yet ({e}); keeping its previous rows", file=self.out)
+            return None
+        self.rows[path] = rows
+        self.seen[path] = seen
+        return rendered, reused
+
+    def reload_structure(self):
+        """Rebuild the lesson index and re-render only loaded rows whose location moved"""
+        for source in self.structure_sources():
+            self.seen[source] = _fingerprint(source)
+        install_resolver(**self.resolver_config)
+        self.index_loaded = True
+        moved = 0
+        for rows in self.rows.values():
+            for row in rows:
+                location = resolve_lesson(row.entry)
+                if location != row.location:
+                    row.location = location
+                    row.sql = _render(row.entry, location)
+                    moved += 1
+        return moved
+
+    def write_outputs(self):
+        """Rewrite the batch files whose rows or numbering changed; returns their batch numbers"""
+        sql_entries = [row.sql for rows in self.rows.values() for row in rows if row.sql is not None]
+        batches = []
+        for start in range(0, len(sql_entries), self.batch_size):
+            batches.append((start, sql_entries[start:start + self.batch_size]))
+        previous = self.written or []
+        rewritten = []
+        for n, batch in enumerate(batches):
+            if n < len(previous) and previous[n] == batch:
+                continue
+            first_entry, entries = batch
+            path = os.path.join(self.output_dir, BATCH_FILENAME.format(n + 1))
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as out:
+                write_batch(out, n + 1, first_entry, entries, self.batch_size)
+            os.replace(tmp_path, path)
+            rewritten.append(n + 1)
+        if self.written is None:
+            # Higher-numbered batches left by an earlier, longer run
+            stale = [path for path in glob.glob(os.path.join(self.output_dir, BATCH_FILENAME.format('*')))
+                     if _batch_number(path) > len(batches)]
+        else:
+            stale = [os.path.join(self.output_dir, BATCH_FILENAME.format(n + 1))
+                     for n in range(len(batches), len(previous))]
+        for path in stale:
+            if os.path.exists(path):
+                os.remove(path)
+        self.written = batches
+        return rewritten
+
+    def sync(self, changed=None):
+        """Bring the outputs up to date with `changed` (default: the watched paths that moved); False if none did"""
+        started = time.perf_counter()
+        changed = self.changed_paths() if changed is None else changed
+        if not changed:
+            return False
+        notes = []
+        sources = self.structure_sources()
+        if not self.index_loaded or any(path in sources for path in changed):
+            moved = self.reload_structure()
+            if self.written is not None:
+                notes.append(f"structure: {moved} rows moved")
+        for path in changed:
+            if path in self.rows:
+                counts = self.load_file(path)
+                if counts is not None:
+                    notes.append(f"{os.path.basename(path)}: {counts[0]} rendered, {counts[1]} unchanged")
+        rewritten = self.write_outputs()
+        elapsed = (time.perf_counter() - started) * 1000
+        listed = ', '.join(str(n) for n in rewritten[:10]) + (' ...' if len(rewritten) > 10 else '')
+        print(f"-- {'; '.join(notes)}; rewrote {len(rewritten)} of {len(self.written)} batches"
+              f"{f' ({listed})' if rewritten else ''} in {elapsed:.1f} ms", file=self.out)
+        return True
+
+    def watch(self, interval=DEFAULT_INTERVAL):
+        """Poll the watched paths until interrupted"""
+        while True:
+            self.sync()
+            time.sleep(interval)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('inputs', nargs='+', help="CSV/JSON/JSONL content exports, rendered in this order")
+    parser.add_argument('--output-dir', required=True, help="where the batch files are kept")
+    parser.add_argument('--batch-size', type=int, default=20, help="rows per INSERT batch (default: 20)")
+    parser.add_argument('--structure', help="course_structure export or sqlite:///path.db (default: LESSON_MAP)")
+    parser.add_argument('--courses', help="course_metadata export with course_id, course_title")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="where the compiled lesson index is cached")
+    parser.add_argument('--fuzzy-threshold', type=float,
+                        help="match unknown titles by trigram similarity at or above this score (0-1)")
+    parser.add_argument('--default-location', action='store_true',
+                        help="put lessons no resolver matches at chapter 1 / lesson 1 of their course "
+                             "instead of skipping them")
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help="seconds between polls")
+    parser.add_argument('--once', action='store_true', help="generate the outputs once and exit")
+    args = parser.parse_args(argv)
+
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    resolver_config = {
+        'structure': args.structure,
+        'courses': args.courses,
+        'cache_dir': args.cache_dir,
+        'fuzzy_threshold': args.fuzzy_threshold,
+        'default_location': args.default_location,
+    }
+    watcher = ContentWatcher(args.inputs, args.output_dir, args.batch_size, resolver_config)
+    watcher.sync()
+    if args.once:
+        return 0
+    watched = len(watcher.inputs) + len(watcher.structure_sources())
+    print(f"-- Watching {watched} paths; Ctrl-C to stop", file=sys.stderr)
+    try:
+        watcher.watch(args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
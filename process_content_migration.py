@@ -2,40 +2,23 @@
 """
 Process JSON course content data and generate complete SQL migration
 """
-import json
 import sys
 
 # Course ID mappings
-COURSE_MAP = {
-    'Introduction to Computer Science': 33,
-    'Media Ecology and the Transformation of Public Discourse in America': 2043436001,
-    'The Foundations and Practice of Hermetic Philosophy: An Analytical Study of The Kybalion': -1048589509,
-    'The Mindful Path to Self-Compassion: Integrating Mindfulness, Acceptance, and Loving-Kindness for Emotional Healing': -211735735,
-    'The Politics of Ecstasy: Psychedelics, Consciousness, and Society': -1211732545,
-    "The Power of Assumption: Consciousness, Imagination, and Manifestation in Neville Goddard's Teachings": -744437687,
-    'The Shock Doctrine: The Rise of Disaster Capitalism': 498493852
-}
+sys.path.insert(0, '.')
+from generate_migration_batch import COURSE_MAP, dollar_quote
+from json_stream import iter_json_array
 
-def dollar_quote(text):
-    """Escape text for dollar-quoted strings"""
-    if text is None:
-        return 'NULL'
-    text_str = str(text)
-    # Replace $$ with $TAG$ to avoid conflicts
-    return f"$${text_str.replace('$$', '$TAG$')}$$"
+# Stream JSON entries from file or stdin
+source = open(sys.argv[1], 'r', encoding='utf-8') if len(sys.argv) > 1 else sys.stdin
 
-# Read JSON from file or stdin
-if len(sys.argv) > 1:
-    with open(sys.argv[1], 'r') as f:
-        data = json.load(f)
-else:
-    data = json.load(sys.stdin)
-
-print(f"-- Processing {len(data)} entries")
+print(f"-- Processing entries from {sys.argv[1] if len(sys.argv) > 1 else 'stdin'}")
 print(f"-- Generating SQL INSERT statements...")
 
 # Generate SQL
-for entry in data:
+count = 0
+for entry in iter_json_array(source):
+    count += 1
     course_name = entry.get('attached_to_course', '').strip()
     course_id = COURSE_MAP.get(course_name)
     
@@ -47,5 +30,6 @@ for entry in data:
     # This is a placeholder - actual matching would require course_structure data
     print(f"-- Entry {entry.get('id')}: {entry.get('lesson_title')}")
 
+print(f"-- Processed {count} entries")
 print("-- SQL generation complete")
 
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of parsed export rows, keyed by the source file's content hash
+The first run over a CSV/JSON/SQL export writes its rows into a SQLite file as it streams them;
+later runs over the same bytes stream the rows back from it instead of re-parsing
+
+Usage:
+    python3 row_cache.py all_course_content.csv          # build (or check) the cache
+    python3 row_cache.py --clear
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+
+CACHE_VERSION = 1
+STAT_INDEX = 'row_cache_stat.json'
+# Rows per executemany / fetchmany round trip
+FETCH_ROWS = 1000
+# A digest taken this soon after the file's last write is not reused: a same-size rewrite
+# within the filesystem's timestamp granularity would leave size, mtime and ctime unchanged
+RACY_NS = 2 * 10**9
+
+def file_digest(path, cache_dir):
+    """BLAKE2 hash of a file, reused while its size, mtime, ctime and inode are unchanged
+
+    ctime and the inode catch rewrites and copies that preserve the mtime; a
+    file written within RACY_NS of its last hashing is always re-hashed.
+    """
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    signature = [stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino]
+    index_path = os.path.join(cache_dir, STAT_INDEX)
+    try:
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    known = index.get(key)
+    if known and known[:4] == signature and known[4] - max(stat.st_mtime_ns, stat.st_ctime_ns) > RACY_NS:
+        return known[5]
+
+    hashed_at = time.time_ns()
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    index[key] = [*signature, hashed_at, digest.hexdigest()]
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path)
+    return index[key][5]
+
+def cache_prefix(path, fmt, cache_dir):
+    """Cache filename up to the content hash; the absolute path's hash keeps same-named inputs apart"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    location = hashlib.blake2b(os.path.abspath(path).encode('utf-8'), digest_size=4).hexdigest()
+    return os.path.join(cache_dir, f"rows_{stem}_{location}_{fmt}_v{CACHE_VERSION}")
+
+def cache_path(path, fmt, cache_dir):
+    """SQLite file holding the rows of path as parsed with fmt"""
+    return f"{cache_prefix(path, fmt, cache_dir)}_{file_digest(path, cache_dir)}.sqlite"
+
+def _stale_caches(db_path):
+    """Older caches of the same input and format: the same prefix and a different content hash"""
+    prefix, _, _ = db_path.rpartition('_')
+    stale = []
+    for old in glob.glob(glob.escape(prefix) + '_*.sqlite'):
+        digest = old[len(prefix) + 1:-len('.sqlite')]
+        if old != db_path and len(digest) == 32 and all(char in '0123456789abcdef' for char in digest):
+            stale.append(old)
+    return stale
+
+def _read(db_path):
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        columns = tuple(name for (name,) in conn.execute("SELECT name FROM columns ORDER BY position"))
+        cursor = conn.execute("SELECT * FROM rows ORDER BY seq")
+        while True:
+            batch = cursor.fetchmany(FETCH_ROWS)
+            if not batch:
+                break
+            for values in batch:
+                # values[0] is seq
+                yield dict(zip(columns, values[1:]))
+    finally:
+        conn.close()
+
+class _Writer:
+    """Streams rows into a new cache file; only a complete pass is kept"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.tmp_path = f"{db_path}.{os.getpid()}.tmp"
+        self.conn = None
+        self.columns = None
+        self.pending = []
+        self.seq = 0
+
+    def add(self, row):
+        """Queue a row; returns False once caching has been abandoned"""
+        if self.columns is None:
+            if not all(isinstance(column, str) for column in row):
+                # csv puts surplus fields of a ragged row under the None key
+                return False
+            self._start(tuple(row))
+        elif len(row) != len(self.columns) or any(column not in row for column in self.columns):
+            # Rows with differing keys (ragged JSON) are not cached
+            self.abort()
+            return False
+        self.seq += 1
+        self.pending.append((self.seq, *(row[column] for column in self.columns)))
+        if len(self.pending) >= FETCH_ROWS:
+            self._flush()
+        return True
+
+    def _start(self, columns):
+        self.columns = columns
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+        self.conn = sqlite3.connect(self.tmp_path)
+        self.conn.execute("PRAGMA journal_mode = OFF")
+        self.conn.execute("PRAGMA synchronous = OFF")
+        self.conn.execute("CREATE TABLE columns (position INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        self.conn.executemany("INSERT INTO columns VALUES (?, ?)", enumerate(columns))
+        # Untyped columns keep each value exactly as parsed ('257' stays text, JSON 257 stays integer)
+        column_list = ", ".join(f"c{i}" for i in range(len(columns)))
+        self.conn.execute(f"CREATE TABLE rows (seq INTEGER PRIMARY KEY, {column_list})")
+        self._insert = f"INSERT INTO rows VALUES ({', '.join('?' * (len(columns) + 1))})"
+
+    def _flush(self):
+        self.conn.executemany(self._insert, self.pending)
+        self.pending = []
+
+    def finish(self):
+        if self.conn is None:
+            return
+        self._flush()
+        self.conn.commit()
+        self.conn.close()
+        self.conn = None
+        stale = _stale_caches(self.db_path)
+        os.replace(self.tmp_path, self.db_path)
+        for old in stale:
+            os.remove(old)
+
+    def abort(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+def cached_rows(path, fmt, parse, cache_dir):
+    """Rows of path from its cache, or from parse() while the cache is written
+
+    parse is a zero-argument callable returning the row iterator. Stdin is
+    never cached. A pass that stops early (--limit, an error) leaves no cache.
+    """
+    if not cache_dir or not path or path == '-' or not os.path.isfile(path):
+        yield from parse()
+        return
+    db_path = cache_path(path, fmt, cache_dir)
+    if os.path.exists(db_path):
+        yield from _read(db_path)
+        return
+
+    writer = _Writer(db_path)
+    caching = True
+    complete = False
+    try:
+        for row in parse():
+            if caching:
+                caching = writer.add(row)
+            yield row
+        complete = True
+    finally:
+        if caching and complete:
+            writer.finish()
+        else:
+            writer.abort()
+
+def main(argv=None):
+    from lesson_resolver import CACHE_DIR
+    from migrate_course_content import iter_rows
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('inputs', nargs='*', help="exports to cache")
+    parser.add_argument('--format', default='auto')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--clear', action='store_true', help="delete every cached row file")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        for old in glob.glob(os.path.join(args.cache_dir, 'rows_*.sqlite')):
+            os.remove(old)
+        return 0
+    for path in args.inputs:
+        rows = sum(1 for _ in iter_rows(path, args.format, cache_dir=args.cache_dir))
+        print(f"{path}: {rows} rows -> {cache_path(path, args.format, args.cache_dir)}", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
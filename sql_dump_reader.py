@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for INSERT INTO ... VALUES dumps (Supabase dashboard exports, RAW_SQL literals)
+Tokenizes single-quoted strings with '' escapes, E'' strings, dollar-quoted strings,
+NULL, booleans and numbers without loading the whole dump, and yields one dict per row
+
+Usage:
+    python3 sql_dump_reader.py MIGRATE_COURSE_STRUCTURE_DATA.sql --to csv > course_structure.csv
+    python3 sql_dump_reader.py scripts/build_course_content.py --table course_content --to jsonl
+"""
+import argparse
+import csv
+import io
+import json
+import re
+import sys
+
+CHUNK_SIZE = 1 << 20
+# A match is only trusted when this much input follows it, so optional tails such as
+# '::timestamp with time zone' or a '' escape are never cut off at a read boundary
+LOOKAHEAD = 64
+
+# Anything before an INSERT (comments, SET/BEGIN, a Python `RAW_SQL = """` prefix) is skipped
+_INSERT = re.compile(r'INSERT\s+INTO\s+', re.I)
+_HEADER = re.compile(
+    r'(?P<table>(?:"[^"]+"|[A-Za-z_][\w$]*)(?:\s*\.\s*(?:"[^"]+"|[A-Za-z_][\w$]*))?)\s*'
+    r'(?:\((?P<columns>[^)]*)\))?\s*VALUES\s*',
+    re.I,
+)
+_SPACE = re.compile(r'\s*')
+_OPEN = re.compile(r'\s*\(')
+# (?!') stops the first quote of a '' escape from being read as the closing quote
+_STRING = re.compile(r"'([^']*(?:''[^']*)*)'(?!')")
+_ESTRING = re.compile(r"[Ee]'((?:[^'\\]|\\.|'')*)'(?!')", re.S)
+_DOLLAR = re.compile(r'(\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$)')
+_NUMBER = re.compile(r'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?![\w.])')
+_KEYWORD = re.compile(r'(NULL|TRUE|FALSE|DEFAULT)\b', re.I)
+_CAST = re.compile(r'(?:\s*::\s*[A-Za-z_][\w]*(?:\s+(?:with|without)\s+time\s+zone|\s+varying)?(?:\(\d+(?:,\s*\d+)?\))?(?:\[\])?)?', re.I)
+_SEPARATOR = re.compile(r'\s*([,)])')
+# Fast path for the common case: a plain quoted string or NULL, an optional cast and the separator
+_SIMPLE = re.compile(r"\s*(?:'([^']*(?:''[^']*)*)'(?!')|(NULL)\b)" + _CAST.pattern + r"\s*([,)])", re.I)
+_AFTER_ROW = re.compile(r'\s*([,;]?)')
+
+_KEYWORDS = {'null': None, 'true': True, 'false': False, 'default': None}
+_E_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', '\\': '\\', "'": "'"}
+
+class SQLDumpError(ValueError):
+    """The dump is malformed or ends in the middle of a statement"""
+
+def _unquote_identifier(name):
+    name = name.strip()
+    return name[1:-1].replace('""', '"') if name.startswith('"') else name.lower()
+
+def _table_name(raw):
+    """Bare table name without schema or quotes: "public"."course_content" -> course_content"""
+    return _unquote_identifier(re.split(r'\s*\.\s*(?=(?:[^"]*"[^"]*")*[^"]*$)', raw)[-1])
+
+def _unescape_e_string(body):
+    return re.sub(r"\\(.)|''", lambda m: _E_ESCAPES.get(m.group(1), m.group(1)) if m.group(1) else "'", body)
+
+class _Scanner:
+    """Regex matching over a sliding text buffer refilled from the stream on demand"""
+
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0
+
+    def fill(self):
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return
+        self.consumed += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def match(self, regex):
+        """Match at the cursor; a match near the end of the buffer is only trusted at EOF"""
+        while True:
+            m = regex.match(self.buf, self.pos)
+            if m is not None and (m.end() + LOOKAHEAD <= len(self.buf) or self.eof):
+                return m
+            if self.eof:
+                return None
+            self.fill()
+
+    def match_buffered(self, regex):
+        """Like match, but never reads more input; None when the match is not certain"""
+        m = regex.match(self.buf, self.pos)
+        if m is not None and (m.end() + LOOKAHEAD <= len(self.buf) or self.eof):
+            return m
+        return None
+
+    def peek(self):
+        """Skip whitespace and return the next character ('' at EOF)"""
+        while True:
+            m = _SPACE.match(self.buf, self.pos)
+            self.pos = m.end()
+            if self.pos < len(self.buf) - 1 or self.eof:
+                return self.buf[self.pos:self.pos + 1]
+            self.fill()
+
+    def search(self, regex):
+        while True:
+            m = regex.search(self.buf, self.pos)
+            if m is not None and (m.end() + LOOKAHEAD <= len(self.buf) or self.eof):
+                return m
+            if self.eof:
+                return None
+            if m is None:
+                # Keep a short tail so a keyword split across chunks is still found
+                self.pos = max(self.pos, len(self.buf) - LOOKAHEAD)
+            self.fill()
+
+    def find(self, text, start):
+        """Offset of text at or after start (relative to the cursor), refilling as needed"""
+        while True:
+            index = self.buf.find(text, self.pos + start)
+            if index != -1:
+                return index - self.pos
+            if self.eof:
+                return -1
+            self.fill()
+
+    def error(self, message):
+        offset = self.consumed + self.pos
+        snippet = self.buf[self.pos:self.pos + 40].replace('\n', ' ')
+        return SQLDumpError(f"{message} at character {offset}: {snippet!r}")
+
+def _read_value(scanner):
+    """Parse one value at the cursor, choosing the token type from its first character"""
+    first = scanner.peek()
+    if not first:
+        raise scanner.error("Unexpected end of dump (truncated?)")
+    if first == "'":
+        regex = _STRING
+    elif first == '$':
+        m = scanner.match(_DOLLAR)
+        if m is None:
+            raise scanner.error("Malformed dollar quote")
+        tag = m.group(1)
+        body_start = m.end() - scanner.pos
+        end = scanner.find(tag, body_start)
+        if end == -1:
+            raise scanner.error(f"Unterminated {tag} string (truncated dump?)")
+        value = scanner.buf[scanner.pos + body_start:scanner.pos + end]
+        scanner.pos += end + len(tag)
+        return value
+    elif first in 'Ee' and scanner.buf[scanner.pos + 1:scanner.pos + 2] == "'":
+        regex = _ESTRING
+    elif first.isalpha():
+        m = scanner.match(_KEYWORD)
+        if m is None:
+            raise scanner.error("Unrecognized value")
+        scanner.pos = m.end()
+        return _KEYWORDS[m.group(1).lower()]
+    else:
+        m = scanner.match(_NUMBER)
+        if m is None:
+            raise scanner.error("Unrecognized value")
+        scanner.pos = m.end()
+        text = m.group(1)
+        return float(text) if any(c in text for c in '.eE') else int(text)
+
+    # Quoted strings: a failed match can only mean the closing quote is not buffered yet
+    m = scanner.match(regex)
+    if m is None:
+        raise scanner.error("Unterminated quoted string (truncated dump?)")
+    scanner.pos = m.end()
+    value = m.group(1)
+    if regex is _ESTRING:
+        return _unescape_e_string(value)
+    return value.replace("''", "'") if "''" in value else value
+
+def iter_dump_rows(stream, table=None, chunk_size=CHUNK_SIZE):
+    """Yield one dict per VALUES tuple of every INSERT INTO in a text stream
+
+    With table, only rows inserted into that table (schema and quotes ignored)
+    are yielded. Statements without a column list get column_1, column_2, ... keys.
+    """
+    for _, row in iter_dump_inserts(stream, table, chunk_size):
+        yield row
+
+def iter_dump_inserts(stream, table=None, chunk_size=CHUNK_SIZE):
+    """Like iter_dump_rows, but yields (table name, row) pairs"""
+    scanner = _Scanner(stream, chunk_size)
+    wanted = table.lower() if table else None
+    while True:
+        m = scanner.search(_INSERT)
+        if m is None:
+            return
+        scanner.pos = m.end()
+        header = scanner.match(_HEADER)
+        if header is None:
+            raise scanner.error("Malformed INSERT header")
+        scanner.pos = header.end()
+        name = _table_name(header.group('table'))
+        skip = wanted is not None and name.lower() != wanted
+        columns = None
+        if header.group('columns') is not None:
+            columns = [_unquote_identifier(c) for c in header.group('columns').split(',')]
+
+        while True:
+            if scanner.match(_OPEN) is None:
+                raise scanner.error("Expected '(' to start a VALUES row")
+            scanner.pos = scanner.match(_OPEN).end()
+            values = []
+            while True:
+                m = scanner.match_buffered(_SIMPLE)
+                if m is not None:
+                    scanner.pos = m.end()
+                    value = m.group(1)
+                    if value is not None and "''" in value:
+                        value = value.replace("''", "'")
+                    values.append(value)
+                    if m.group(3) == ')':
+                        break
+                    continue
+                values.append(_read_value(scanner))
+                scanner.pos = scanner.match(_CAST).end()
+                m = scanner.match(_SEPARATOR)
+                if m is None:
+                    raise scanner.error("Expected ',' or ')' in VALUES row")
+                scanner.pos = m.end()
+                if m.group(1) == ')':
+                    break
+            if not skip:
+                keys = columns or [f'column_{i}' for i in range(1, len(values) + 1)]
+                if len(keys) != len(values):
+                    raise scanner.error(f"Row has {len(values)} values for {len(keys)} columns")
+                yield name, dict(zip(keys, values))
+            m = scanner.match(_AFTER_ROW)
+            scanner.pos = m.end()
+            if m.group(1) != ',':
+                # ';', ON CONFLICT ... or end of input: this statement's rows are done
+                break
+
+# Statement splitting: the tokens that can hide a ';' from the top level of a script
+_STATEMENT_TOKEN = re.compile(r"""[;'"$]|--|/\*""")
+_QUOTED_BODY = re.compile(r"[^']*(?:''[^']*)*'")
+_E_QUOTED_BODY = re.compile(r"(?:[^'\\]|\\.|'')*'", re.S)
+_IDENTIFIER_BODY = re.compile(r'[^"]*(?:""[^"]*)*"')
+_BLOCK_COMMENT_END = re.compile(r'\*/')
+
+def split_statements(script):
+    """Top-level statements of a SQL script, without their ';'
+
+    Quoted strings (including E'' strings), quoted identifiers, dollar-quoted
+    bodies and comments are skipped over, so a ';' inside them does not split.
+    """
+    statements = []
+    start = pos = 0
+    while True:
+        m = _STATEMENT_TOKEN.search(script, pos)
+        if m is None:
+            break
+        token, pos = m.group(), m.end()
+        if token == ';':
+            statements.append(script[start:m.start()])
+            start = pos
+            continue
+        if token == "'":
+            e_string = m.start() > 0 and script[m.start() - 1] in 'Ee' and (
+                m.start() == 1 or not (script[m.start() - 2].isalnum() or script[m.start() - 2] == '_'))
+            end = (_E_QUOTED_BODY if e_string else _QUOTED_BODY).match(script, pos)
+        elif token == '"':
+            end = _IDENTIFIER_BODY.match(script, pos)
+        elif token == '--':
+            newline = script.find('\n', pos)
+            pos = len(script) if newline == -1 else newline + 1
+            continue
+        elif token == '/*':
+            end = _BLOCK_COMMENT_END.search(script, pos)
+        else:
+            tag = _DOLLAR.match(script, m.start())
+            if tag is None:
+                # A positional parameter ($1) or a $ inside an identifier
+                continue
+            close = script.find(tag.group(1), tag.end())
+            if close == -1:
+                raise SQLDumpError(f"Unterminated {tag.group(1)} string at character {m.start()}")
+            pos = close + len(tag.group(1))
+            continue
+        if end is None:
+            raise SQLDumpError(f"Unterminated {token} at character {m.start()}")
+        pos = end.end()
+    if script[start:].strip():
+        statements.append(script[start:])
+    return statements
+
+def iter_sql_rows(stream, table=None):
+    """iter_dump_rows over a binary stream, for the migration CLI's input readers"""
+    yield from iter_dump_rows(io.TextIOWrapper(stream, encoding='utf-8'), table)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('input', nargs='?', default='-', help="SQL dump (default: stdin)")
+    parser.add_argument('--table', help="only rows inserted into this table")
+    parser.add_argument('--to', choices=['csv', 'json', 'jsonl'], default='csv')
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    out = sys.stdout
+    rows = 0
+    writer = None
+    try:
+        if args.to == 'json':
+            out.write('[')
+        for row in iter_dump_rows(source, args.table):
+            if args.to == 'csv':
+                if writer is None:
+                    writer = csv.DictWriter(out, fieldnames=list(row), lineterminator='\n')
+                    writer.writeheader()
+                writer.writerow(row)
+            elif args.to == 'json':
+                out.write((',\n' if rows else '\n') + json.dumps(row, ensure_ascii=False))
+            else:
+                out.write(json.dumps(row, ensure_ascii=False) + '\n')
+            rows += 1
+    except SQLDumpError as e:
+        print(f"Error: {e} (after {rows} complete rows)", file=sys.stderr)
+        return 1
+    finally:
+        if args.to == 'json':
+            out.write('\n]\n')
+        if source is not sys.stdin:
+            source.close()
+    print(f"Extracted {rows} rows", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
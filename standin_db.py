@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Supabase course_content table, and bulk validation of generated rows
+Rows are loaded with batched executemany into SQLite (in-process) or a local Postgres,
+then checked for duplicate ids, duplicate (course_id, chapter_number, lesson_number) and bad values
+
+Usage:
+    python3 migrate_course_content.py all_course_content.csv --validate > /dev/null
+    python3 migrate_course_content.py all_course_content.csv --validate sqlite:///standin.db
+    python3 migrate_course_content.py all_course_content.csv --validate postgresql://localhost/catalyst
+"""
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from course_content_copy import BINARY_TYPES, to_pg_timestamp
+from course_content_schema import COLUMNS, LOCATION_COLUMNS
+
+DEFAULT_TARGET = 'sqlite://:memory:'
+REQUIRED_COLUMNS = ('id',) + LOCATION_COLUMNS
+
+SQL_TYPES = {'int8': 'BIGINT', 'int4': 'INTEGER', 'timestamptz': 'TEXT'}
+# Rows per executemany call
+LOAD_BATCH = 1000
+# Offending keys listed per check before the report switches to a count
+REPORT_LIMIT = 10
+
+def column_ddl(columns=COLUMNS, types=BINARY_TYPES):
+    """Column definitions for course_content (timestamps stay text; values are checked client-side)"""
+    return ",\n    ".join(f"{column} {SQL_TYPES.get(types.get(column), 'TEXT')}" for column in columns)
+
+class StandIn:
+    """DB-API connection to a sqlite:/// file, in-memory SQLite or a postgresql:// database"""
+
+    def __init__(self, target=DEFAULT_TARGET):
+        self.target = target
+        if target.startswith(('postgresql://', 'postgres://')):
+            try:
+                import psycopg2
+            except ImportError:
+                raise SystemExit("A postgresql:// stand-in needs psycopg2 (pip install psycopg2-binary)")
+            self.conn = psycopg2.connect(target)
+            self.param = '%s'
+            self.is_sqlite = False
+        elif target.startswith('sqlite://'):
+            path = target[len('sqlite:///'):] if target.startswith('sqlite:///') else ':memory:'
+            # Pooled connections are handed between threads, one user at a time
+            self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+            self.param = '?'
+            self.is_sqlite = True
+        else:
+            raise ValueError(f"Unsupported stand-in {target!r}; use sqlite:///path.db, sqlite://:memory: "
+                             f"or postgresql://...")
+
+    def placeholders(self, count):
+        return ", ".join([self.param] * count)
+
+    def execute(self, sql, params=()):
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return cursor
+
+    def executemany(self, sql, rows):
+        cursor = self.conn.cursor()
+        cursor.executemany(sql, rows)
+        return cursor
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.conn.close()
+
+def row_problems(values):
+    """Type errors in one COLUMNS-ordered value tuple, as 'column: reason' strings"""
+    problems = []
+    for column, value in zip(COLUMNS, values):
+        kind = BINARY_TYPES.get(column)
+        if value is None or value == '':
+            if column in REQUIRED_COLUMNS:
+                problems.append(f"{column}: missing")
+            continue
+        try:
+            if kind in ('int8', 'int4'):
+                int(value)
+            elif kind == 'timestamptz':
+                to_pg_timestamp(value)
+        except (TypeError, ValueError):
+            problems.append(f"{column}: not a {kind} ({str(value)[:40]!r})")
+    return problems
+
+class ContentValidator:
+    """Loads rendered value tuples into a scratch table and checks them as a whole"""
+
+    table = 'course_content_check'
+
+    def __init__(self, target=DEFAULT_TARGET, upsert=False):
+        self.db = StandIn(target)
+        self.upsert = upsert
+        self.rows = 0
+        self.bad_rows = []
+        self.load_seconds = 0.0
+        self.db.execute(f"CREATE TEMPORARY TABLE {self.table} (\n    {column_ddl()}\n)")
+        self._insert = f"INSERT INTO {self.table} ({', '.join(COLUMNS)}) VALUES ({self.db.placeholders(len(COLUMNS))})"
+
+    def tap(self, items, values_of=None):
+        """Pass items through unchanged while loading their values in batches"""
+        batch = []
+        for item in items:
+            values = item if values_of is None else values_of(item)
+            problems = row_problems(values)
+            if problems:
+                self.bad_rows.append((values[0], problems))
+            batch.append(values)
+            if len(batch) >= LOAD_BATCH:
+                self._load(batch)
+                batch = []
+            yield item
+        if batch:
+            self._load(batch)
+
+    def _load(self, batch):
+        started = time.perf_counter()
+        if self.upsert:
+            # Mirror ON CONFLICT (id) DO UPDATE: a later row replaces an earlier one
+            ids = [values[0] for values in batch]
+            self.db.execute(f"DELETE FROM {self.table} WHERE id IN ({self.db.placeholders(len(ids))})", ids)
+        self.db.executemany(self._insert, batch)
+        self.rows += len(batch)
+        self.load_seconds += time.perf_counter() - started
+
+    def duplicate_ids(self):
+        return self.db.execute(
+            f"SELECT id, COUNT(*) FROM {self.table} GROUP BY id HAVING COUNT(*) > 1 ORDER BY id"
+        ).fetchall()
+
+    def duplicate_locations(self, limit=REPORT_LIMIT):
+        """[(course_id, chapter_number, lesson_number, count, ids)] shared by more than one row
+
+        ids (at most `limit`) are only looked up for the first `limit` locations.
+        """
+        location = ", ".join(LOCATION_COLUMNS)
+        groups = self.db.execute(
+            f"SELECT {location}, COUNT(*) FROM {self.table} GROUP BY {location} HAVING COUNT(*) > 1 "
+            f"ORDER BY {location}"
+        ).fetchall()
+        where = " AND ".join(f"{column} = {self.db.param}" for column in LOCATION_COLUMNS)
+        duplicates = []
+        for n, (*group, count) in enumerate(groups):
+            ids = []
+            if n < limit:
+                ids = [row_id for (row_id,) in self.db.execute(
+                    f"SELECT id FROM {self.table} WHERE {where} ORDER BY id LIMIT {limit}", group).fetchall()]
+            duplicates.append((*group, count, ids))
+        return duplicates
+
+    def check(self):
+        """Run the table-wide checks; returns a list of problem lines (empty when valid)"""
+        problems = []
+        for row_id, reasons in self.bad_rows[:REPORT_LIMIT]:
+            problems.append(f"row {row_id}: " + "; ".join(reasons))
+        if len(self.bad_rows) > REPORT_LIMIT:
+            problems.append(f"... {len(self.bad_rows) - REPORT_LIMIT} more rows with bad values")
+        duplicates = self.duplicate_ids()
+        for row_id, count in duplicates[:REPORT_LIMIT]:
+            problems.append(f"duplicate primary key id={row_id} ({count} rows)")
+        if len(duplicates) > REPORT_LIMIT:
+            problems.append(f"... {len(duplicates) - REPORT_LIMIT} more duplicate ids")
+        locations = self.duplicate_locations()
+        for course_id, chapter_number, lesson_number, count, ids in locations[:REPORT_LIMIT]:
+            listed = ', '.join(str(row_id) for row_id in ids)
+            if count > len(ids):
+                listed += f" and {count - len(ids)} more"
+            problems.append(f"duplicate lesson location ({course_id}, {chapter_number}, {lesson_number}) for ids {listed}")
+        if len(locations) > REPORT_LIMIT:
+            problems.append(f"... {len(locations) - REPORT_LIMIT} more duplicate locations")
+        return problems
+
+    def report(self, out=sys.stderr):
+        """Print the checks and load throughput; returns True when the rows are valid"""
+        started = time.perf_counter()
+        problems = self.check()
+        check_seconds = time.perf_counter() - started
+        rate = self.rows / self.load_seconds if self.load_seconds > 0 else 0.0
+        print(
+            f"Validated {self.rows} rows against {self.db.target}: loaded in {self.load_seconds:.2f}s "
+            f"({rate:,.0f} rows/sec), checked in {check_seconds:.2f}s",
+            file=out,
+        )
+        for problem in problems:
+            print(f"-- INVALID: {problem}", file=out)
+        if not problems:
+            print("-- OK: ids and (course_id, chapter_number, lesson_number) are unique", file=out)
+        return not problems
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,25 @@
+"""content_bundles: duplicate locations are reported, and an unchanged build leaves bundles.json alone"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from content_bundles import MANIFEST_FILENAME, collect_lessons, write_bundles
+from course_content_schema import COLUMNS
+
+def _values(row_id, chapter_number, lesson_number):
+    values = dict.fromkeys(COLUMNS, 'x')
+    values.update(id=row_id, course_id=5, chapter_number=chapter_number, lesson_number=lesson_number)
+    return tuple(values[column] for column in COLUMNS)
+
+def test_duplicate_locations_are_listed():
+    duplicates = []
+    collect_lessons([_values(1, 1, 1), _values(2, 1, 2), _values(3, 1, 1)], duplicates)
+    assert duplicates == [((5, 1, 1), 1, 3)]
+
+def test_unchanged_manifest_is_not_rewritten(tmp_path):
+    courses = collect_lessons([_values(1, 1, 1), _values(2, 1, 2)])
+    write_bundles(courses, str(tmp_path), brotli=False)
+    path = tmp_path / MANIFEST_FILENAME
+    os.utime(path, (0, 0))
+    write_bundles(courses, str(tmp_path), brotli=False)
+    assert path.stat().st_mtime == 0
@@ -0,0 +1,62 @@
+"""ContentLoader retries: a chunk whose connection drops is committed on a new one"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import content_loader
+from content_loader import ContentLoader
+from course_content_schema import COLUMNS
+
+class OperationalError(Exception):
+    """Named like psycopg2's: the server closed the connection"""
+
+class InterfaceError(Exception):
+    """Named like psycopg2's: the connection is already closed"""
+
+class DroppedConnection:
+    """A StandIn whose connection has gone away: every call fails, as a psycopg2 one does"""
+
+    def __init__(self):
+        self.closed = False
+
+    def executemany(self, sql, rows):
+        raise OperationalError("server closed the connection unexpectedly")
+
+    def rollback(self):
+        raise InterfaceError("connection already closed")
+
+    def close(self):
+        self.closed = True
+
+def _values(row_id):
+    values = dict.fromkeys(COLUMNS, 'x')
+    values.update(id=row_id, course_id=1, chapter_number=1, lesson_number=row_id,
+                  created_at=None, updated_at=None)
+    return tuple(values[column] for column in COLUMNS)
+
+def test_chunk_is_retried_on_a_new_connection(tmp_path, monkeypatch):
+    monkeypatch.setattr(content_loader, 'RETRY_DELAY', 0)
+    loader = ContentLoader(f"sqlite:///{tmp_path / 'standin.db'}", retries=2)
+    dropped = DroppedConnection()
+    loader.db = dropped
+
+    loader.load_chunk([_values(1), _values(2)])
+
+    assert dropped.closed
+    assert loader.db is not dropped
+    assert loader.db.execute("SELECT id FROM course_content ORDER BY id").fetchall() == [(1,), (2,)]
+    loader.close()
+
+def test_dropped_connection_raises_after_the_last_retry(tmp_path, monkeypatch):
+    monkeypatch.setattr(content_loader, 'RETRY_DELAY', 0)
+    target = f"sqlite:///{tmp_path / 'standin.db'}"
+    loader = ContentLoader(target, retries=1)
+    monkeypatch.setattr(content_loader, 'StandIn', lambda target: DroppedConnection())
+    loader.db = DroppedConnection()
+
+    with pytest.raises(OperationalError):
+        loader.load_chunk([_values(1)])
+    assert loader.db is None
+    loader.close()
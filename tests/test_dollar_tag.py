@@ -0,0 +1,36 @@
+"""dollar_tag picks the shortest tag that quotes a text unchanged, and rendered rows parse back"""
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from course_content_schema import COLUMNS, RAW_COLUMNS, dollar_tag, format_values
+from sql_dump_reader import iter_dump_rows
+
+CASES = [
+    ('no dollars at all', '$$'),
+    ('costs $5 or $ 6', '$$'),
+    ('ends in $q', '$$'),
+    ('a $$ in the middle', '$q$'),
+    ('ends in a single $', '$q$'),
+    ('$$ and $q$ both', '$q1$'),
+    ('$$, $q$, $q1$ and $q3$', '$q2$'),
+    ('$q$ alone', '$$'),
+    ('$$$$$', '$q$'),
+]
+
+def _parsed(tag, text):
+    return next(iter_dump_rows(io.StringIO(f"INSERT INTO t (a) VALUES ({tag}{text}{tag});")))['a']
+
+@pytest.mark.parametrize('text, tag', CASES)
+def test_shortest_tag_that_round_trips(text, tag):
+    assert dollar_tag(text) == tag
+    assert _parsed(tag, text) == text
+
+def test_formatted_row_parses_back_to_its_values():
+    texts = iter(text for text, _ in CASES)
+    values = tuple(n if column in RAW_COLUMNS else next(texts, None) for n, column in enumerate(COLUMNS, 1))
+    sql = f"INSERT INTO course_content ({', '.join(COLUMNS)}) VALUES {format_values(values)};"
+    assert tuple(next(iter_dump_rows(io.StringIO(sql))).values()) == values
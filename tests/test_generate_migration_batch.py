@@ -0,0 +1,25 @@
+"""resolve_lesson without an installed resolver: LESSON_MAP lookups, and unmatched titles skipped by default"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import generate_migration_batch
+from generate_migration_batch import generate_sql_entry, resolve_lesson
+
+UNMATCHED = {'id': '9', 'lesson_title': 'A title no export has', 'attached_to_course': 'The Shock Doctrine: The Rise of Disaster Capitalism'}
+
+def test_lesson_map_titles_resolve(monkeypatch):
+    monkeypatch.setattr(generate_migration_batch, 'RESOLVER', None)
+    entry = {'lesson_title': 'Persistence, Faith, and Overcoming Failure'}
+    assert resolve_lesson(entry) == (-744437687, 2, 4)
+
+def test_unmatched_title_is_skipped_and_reported(monkeypatch, capsys):
+    monkeypatch.setattr(generate_migration_batch, 'RESOLVER', None)
+    assert resolve_lesson(UNMATCHED) is None
+    assert generate_sql_entry(dict(UNMATCHED)) is None
+    assert "Skipping unmatched lesson 'A title no export has'" in capsys.readouterr().err
+
+def test_default_location_is_opt_in(monkeypatch):
+    monkeypatch.setattr(generate_migration_batch, 'RESOLVER', None)
+    monkeypatch.setattr(generate_migration_batch, 'DEFAULT_LOCATION', True)
+    assert resolve_lesson(UNMATCHED) == (498493852, 1, 1)
@@ -0,0 +1,43 @@
+"""iter_json_array yields what json.loads would, one element at a time, at any read size"""
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from json_stream import iter_json_array
+
+ELEMENTS = [
+    {'id': 1, 'lesson_title': 'Nested [brackets], "quotes" and \\ in text',
+     'key_terms': [['a', ['b', []]], {'c': [1, 2.5e3, -0.25]}]},
+    [[], [[[]]], {}],
+    12345678901234567890,
+    -3.25,
+    'café — \U0001f600',
+    None, True, False,
+]
+TEXT = ' [\n' + ',\n  '.join(json.dumps(element, ensure_ascii=False) for element in ELEMENTS) + '\n] '
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 16, 1 << 16])
+def test_nested_elements_match_json_loads(chunk_size):
+    assert list(iter_json_array(io.StringIO(TEXT), chunk_size)) == json.loads(TEXT)
+
+def test_binary_stream_with_bom_and_empty_array():
+    stream = io.BufferedReader(io.BytesIO(b'\xef\xbb\xbf' + TEXT.encode('utf-8')))
+    assert list(iter_json_array(stream, 7)) == ELEMENTS
+    assert list(iter_json_array(io.StringIO(' [ ] '))) == []
+
+def test_elements_are_yielded_before_the_stream_is_read_through():
+    text = '[' + ', '.join(json.dumps({'id': n, 'body': 'x' * 100}) for n in range(1000)) + ']'
+    stream = io.StringIO(text)
+    elements = iter_json_array(stream, 256)
+    assert next(elements) == {'id': 0, 'body': 'x' * 100}
+    assert stream.tell() < 1024
+    assert sum(1 for _ in elements) == 999
+
+@pytest.mark.parametrize('text', ['{"id": 1}', '[1 2]', '[{"id": 1}, {"id": ', '[1, 2'])
+def test_malformed_input_raises(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(text), 4))
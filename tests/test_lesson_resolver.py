@@ -0,0 +1,69 @@
+"""LessonIndex is built from course_structure rows, and resolve skips unmatched lessons unless the
+chapter 1 / lesson 1 default is asked for"""
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lesson_resolver import LessonIndex, load_index
+
+def _index():
+    index = LessonIndex()
+    index.add_course('Shock Doctrine', 498493852)
+    index.add_lesson(498493852, 1, 2, 'The Rise of Neoliberalism')
+    return index
+
+def test_unmatched_lesson_is_skipped_by_default():
+    entry = {'lesson_title': 'A title no export has', 'attached_to_course': 'Shock Doctrine'}
+    assert _index().resolve(entry) is None
+
+def test_default_location_is_opt_in():
+    index = _index()
+    index.default_location = True
+    assert index.resolve({'lesson_title': 'A title no export has', 'attached_to_course': 'Shock Doctrine'}) == \
+        (498493852, 1, 1)
+    assert index.resolve({'lesson_title': 'the rise of neoliberalism'}) == (498493852, 1, 2)
+
+STRUCTURE = [
+    {'course_id': '33', 'course_title': 'Introduction to Computer Science',
+     'chapter_title_1': 'Foundations', 'chapter_id_1': 'ch-33-1',
+     'lesson_1_1': 'What is a Computer?', 'lesson_1_2': 'Getting Started',
+     'chapter_title_2': 'Programming', 'chapter_id_2': 'ch-33-2',
+     'lesson_2_1': 'Introduction to Programming', 'lesson_2_2': ' '},
+    {'course_id': '41', 'course_title': 'The Kybalion',
+     'chapter_title_1': 'Principles', 'lesson_1_1': 'Getting Started', 'lesson_1_3': 'The Principle of “Mentalism”'},
+]
+
+def _structure_csv(tmp_path, rows=STRUCTURE):
+    path = tmp_path / 'course_structure.csv'
+    fields = sorted({field for row in rows for field in row})
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+def test_structure_rows_index_lessons_by_title_and_chapter(tmp_path):
+    index = load_index(_structure_csv(tmp_path), cache_dir=None)
+    assert index.resolve({'lesson_title': 'what is a  computer?'}) == (33, 1, 1)
+    assert index.resolve({'lesson_title': 'Introduction to Programming'}) == (33, 2, 1)
+    assert index.resolve({'lesson_title': 'the principle of "mentalism"'}) == (41, 1, 3)
+    # A title two courses share only resolves with the course in scope
+    assert index.lookup('Getting Started') is None
+    assert index.resolve({'lesson_title': 'Getting Started', 'attached_to_course': 'The Kybalion'}) == (41, 1, 1)
+    assert index.resolve({'lesson_title': 'Getting Started', 'chapter_id': 'ch-33-1'}) == (33, 1, 2)
+    assert index.entry_scope({'attached_to_course': 'Introduction to Computer Science',
+                              'attached_to_chapter': 'programming'}) == (33, 2)
+    # Blank lesson cells are not indexed
+    assert (33, 2, 2) not in index.lesson_titles
+
+def test_compiled_index_is_rebuilt_when_the_structure_changes(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    path = _structure_csv(tmp_path)
+    assert load_index(path, cache_dir=cache_dir).lookup('What is a Computer?') == (33, 1, 1)
+    assert os.path.exists(os.path.join(cache_dir, 'lesson_index.pickle'))
+    assert load_index(path, cache_dir=cache_dir).lookup('Introduction to Programming') == (33, 2, 1)
+
+    moved = [dict(STRUCTURE[0], lesson_1_1='Introduction to Programming', lesson_2_1='What is a Computer?')]
+    _structure_csv(tmp_path, moved)
+    assert load_index(path, cache_dir=cache_dir).lookup('What is a Computer?') == (33, 2, 1)
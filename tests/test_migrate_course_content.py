@@ -0,0 +1,61 @@
+"""migrate_course_content.py streams CSV, JSON and JSONL exports into the same numbered batch files"""
+import csv
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from generate_migration_batch import ENTRY_FIELDS
+from migrate_course_content import BATCH_FILENAME, main
+
+COURSE = 'Introduction to Computer Science'
+TITLES = ('What is a Computer?', 'Hardware and Software', 'Introduction to Programming',
+          'Variables and Data Types', 'Networking Fundamentals')
+
+def _rows():
+    # Every field is filled: a CSV cannot tell a missing field from an empty one, JSON can
+    rows = []
+    for n, title in enumerate(TITLES, 1):
+        row = {field: f"{field} {n}" for field in ENTRY_FIELDS}
+        row.update(id=str(n), lesson_title=title, attached_to_course=COURSE, the_hook=f"Hook's {n}",
+                   created_at='2024-03-01T12:30:00+00:00', updated_at='2024-03-02T08:00:00+00:00')
+        rows.append(row)
+    return rows
+
+def _export(tmp_path, fmt):
+    path = tmp_path / f"export.{fmt}"
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            writer = csv.DictWriter(f, fieldnames=ENTRY_FIELDS)
+            writer.writeheader()
+            writer.writerows(_rows())
+        elif fmt == 'json':
+            json.dump(_rows(), f)
+        else:
+            f.writelines(json.dumps(row) + '\n' for row in _rows())
+    return str(path)
+
+def _batches(tmp_path, name, *args):
+    output_dir = tmp_path / name
+    output_dir.mkdir()
+    assert main([*args, '--output-dir', str(output_dir), '--cache-dir', str(tmp_path / 'cache')]) == 0
+    return {path.name: path.read_text(encoding='utf-8') for path in sorted(output_dir.iterdir())}
+
+def test_every_input_format_renders_the_same_batches(tmp_path):
+    batches = [_batches(tmp_path, fmt, _export(tmp_path, fmt), '--batch-size', '2')
+               for fmt in ('csv', 'json', 'jsonl')]
+    assert batches[0] == batches[1] == batches[2]
+    assert sorted(batches[0]) == [BATCH_FILENAME.format(n) for n in (1, 2, 3)]
+    third = batches[0][BATCH_FILENAME.format(3)]
+    assert "BATCH 3 (Entries 4-4)" in third
+    assert "$$Hook's 5$$" in third
+    assert third.count("$$Networking Fundamentals$$") == 1
+
+def test_skip_and_limit_select_a_slice_of_the_input(tmp_path):
+    batches = _batches(tmp_path, 'slice', _export(tmp_path, 'csv'), '--skip', '1', '--limit', '3',
+                       '--first-batch', '4')
+    assert list(batches) == [BATCH_FILENAME.format(4)]
+    batch = batches[BATCH_FILENAME.format(4)]
+    assert "BATCH 4 (Entries 1-3)" in batch
+    assert "-- Generated 3 entries" in batch
+    assert "$$What is a Computer?$$" not in batch and "$$Networking Fundamentals$$" not in batch
@@ -0,0 +1,49 @@
+"""--workers writes the same review report as the serial run, in input order"""
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from generate_migration_batch import ENTRY_FIELDS, LESSON_MAP
+import migrate_course_content
+
+COURSES = {
+    33: 'Introduction to Computer Science',
+    2043436001: 'Media Ecology and the Transformation of Public Discourse in America',
+    -1048589509: 'The Foundations and Practice of Hermetic Philosophy: An Analytical Study of The Kybalion',
+}
+
+def _write_export(path, rows=90):
+    titles = {course_id: [title for title, location in LESSON_MAP.items() if location[0] == course_id]
+              for course_id in COURSES}
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=ENTRY_FIELDS)
+        writer.writeheader()
+        for n in range(rows):
+            course_id = list(COURSES)[n % len(COURSES)]
+            known = titles[course_id]
+            # Every other row is a title the fuzzy matcher cannot place, so it goes to review
+            title = known[n % len(known)] if n % 2 else f"Unmapped lesson {n}"
+            writer.writerow({'id': n + 1, 'lesson_title': title, 'attached_to_course': COURSES[course_id]})
+
+def _run(tmp_path, name, *extra):
+    report = str(tmp_path / f"{name}_review.csv")
+    output = str(tmp_path / f"{name}.sql")
+    assert migrate_course_content.main([
+        str(tmp_path / 'export.csv'), '--output', output, '--cache-dir', str(tmp_path / 'cache'),
+        '--fuzzy-threshold', '0.9', '--review-report', report, *extra,
+    ]) in (0, None)
+    with open(report, encoding='utf-8') as f:
+        review = f.read()
+    with open(output, encoding='utf-8') as f:
+        return review, f.read()
+
+def test_parallel_review_report_matches_serial(tmp_path):
+    _write_export(tmp_path / 'export.csv')
+    serial_review, serial_sql = _run(tmp_path, 'serial')
+    parallel_review, parallel_sql = _run(tmp_path, 'parallel', '--workers', '3', '--chunk-size', '4')
+
+    ids = [row['id'] for row in csv.DictReader(serial_review.splitlines())]
+    assert ids == [str(n + 1) for n in range(0, 90, 2)]
+    assert parallel_review == serial_review
+    assert parallel_sql == serial_sql
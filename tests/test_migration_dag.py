@@ -0,0 +1,81 @@
+"""migration_dag's SQLite replay runs INSERTs as written and reports the statements it cannot run;
+its checkpoint only resumes runs against the target it was written for"""
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from migration_dag import CHECKPOINT_FILENAME, SETUP_STEPS, _replay_inserts, main
+from sql_dump_reader import split_statements
+from standin_db import StandIn
+
+SETUP = """BEGIN;
+-- The ';' in comments, strings and dollar quotes does not end a statement
+ALTER TABLE lessons ADD COLUMN note text; /* ; */
+INSERT INTO lessons (id, title) VALUES (1, 'semi;colon'), (2, $$dollar;quoted$$);
+COMMIT;
+"""
+UPSERT = """INSERT INTO lessons (id, title) VALUES (2, 'updated')
+ON CONFLICT (id) DO UPDATE SET
+    title = EXCLUDED.title;
+"""
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def test_split_statements_skips_quoted_semicolons():
+    statements = [' '.join(statement.split()) for statement in split_statements(SETUP)]
+    assert statements[1:] == [
+        "-- The ';' in comments, strings and dollar quotes does not end a statement ALTER TABLE lessons "
+        "ADD COLUMN note text",
+        "/* ; */ INSERT INTO lessons (id, title) VALUES (1, 'semi;colon'), (2, $$dollar;quoted$$)",
+        "COMMIT",
+    ]
+
+def test_replay_reports_skipped_statements_and_keeps_insert_semantics(tmp_path):
+    db = StandIn(f"sqlite:///{tmp_path / 'standin.db'}")
+    skipped = _replay_inserts(db, _write(tmp_path, 'setup.sql', SETUP))
+    assert skipped == ["ALTER TABLE lessons ADD COLUMN note text"]
+
+    _replay_inserts(db, _write(tmp_path, 'upsert.sql', UPSERT))
+    assert db.execute("SELECT id, title FROM lessons ORDER BY id").fetchall() == [(1, 'semi;colon'), (2, 'updated')]
+
+    # A plain INSERT of an existing id fails, as it would on Postgres
+    with pytest.raises(sqlite3.IntegrityError):
+        _replay_inserts(db, _write(tmp_path, 'again.sql', "INSERT INTO lessons (id, title) VALUES (1, 'again');"))
+    db.close()
+
+def _rows(target):
+    db = StandIn(target)
+    try:
+        return db.execute("SELECT id, title FROM lessons ORDER BY id").fetchall()
+    except sqlite3.OperationalError:
+        return []
+    finally:
+        db.close()
+
+def test_checkpoint_is_refused_for_a_different_target(tmp_path, capsys):
+    migrations = tmp_path / 'migrations'
+    migrations.mkdir()
+    _write(migrations, SETUP_STEPS[0], "INSERT INTO lessons (id, title) VALUES (1, 'first');")
+    first, second = f"sqlite:///{tmp_path / 'first.db'}", f"sqlite:///{tmp_path / 'second.db'}"
+
+    assert main([str(migrations), '--target', first, '--pool', '1']) == 0
+    assert _rows(first) == [(1, 'first')]
+
+    # Resuming against another database would skip steps that never ran there
+    assert main([str(migrations), '--target', second, '--pool', '1']) == 1
+    assert f"not {second}; use --restart" in capsys.readouterr().err
+    assert _rows(second) == []
+
+    assert main([str(migrations), '--target', second, '--pool', '1', '--restart']) == 0
+    assert _rows(second) == [(1, 'first')]
+    # Replaying the plain INSERT would fail, so this run must resume from the checkpoint
+    assert main([str(migrations), '--target', second, '--pool', '1']) == 0
+    with open(migrations / CHECKPOINT_FILENAME, encoding='utf-8') as f:
+        assert json.load(f)['target'] == second
@@ -0,0 +1,57 @@
+"""open_output compresses reproducibly, reads back through open_input and reports a failing psql"""
+import os
+import shutil
+import stat
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from migration_output import OutputError, open_input, open_output
+
+SQL = "INSERT INTO course_content (id, the_hook) VALUES (1, $$Café$$);\n" * 5000
+
+def _write(target, compression=None, text=SQL):
+    sink = open_output(target, compression)
+    sink.text().write(text)
+    sink.close()
+    return sink
+
+@pytest.mark.parametrize('suffix', ['.sql', '.sql.gz', '.sql.zst'])
+def test_compressed_output_reads_back_and_is_reproducible(tmp_path, suffix):
+    if suffix == '.sql.zst' and shutil.which('zstd') is None:
+        pytest.importorskip('zstandard')
+    first, second = str(tmp_path / f"first{suffix}"), str(tmp_path / f"second{suffix}")
+    sink = _write(first)
+    _write(second)
+    with open_input(first) as stream:
+        assert stream.read().decode('utf-8') == SQL
+    with open(first, 'rb') as a, open(second, 'rb') as b:
+        assert a.read() == b.read()
+    if suffix != '.sql':
+        assert sink.size() < len(SQL.encode('utf-8')) // 10
+
+def _fake_psql(tmp_path, monkeypatch, status):
+    """A psql on PATH that copies its input to psql_input.sql and exits with status"""
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    script = bin_dir / 'psql'
+    script.write_text(f"#!/bin/sh\ncat > '{tmp_path / 'psql_input.sql'}'\nexit {status}\n", encoding='utf-8')
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="uses a shell script as psql")
+def test_psql_receives_the_whole_stream(tmp_path, monkeypatch):
+    _fake_psql(tmp_path, monkeypatch, 0)
+    _write('psql:postgresql://localhost/catalyst')
+    assert (tmp_path / 'psql_input.sql').read_text(encoding='utf-8') == SQL
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="uses a shell script as psql")
+def test_failing_psql_is_reported(tmp_path, monkeypatch):
+    _fake_psql(tmp_path, monkeypatch, 3)
+    with pytest.raises(OutputError, match="psql exited with status 3"):
+        _write('psql')
+
+def test_psql_output_cannot_be_compressed():
+    with pytest.raises(OutputError, match="cannot be compressed"):
+        open_output('psql', 'gzip')
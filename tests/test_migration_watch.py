@@ -0,0 +1,65 @@
+"""ContentWatcher re-renders only the edited rows and rewrites only the batch files they land in"""
+import csv
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from generate_migration_batch import ENTRY_FIELDS
+from migrate_course_content import BATCH_FILENAME, main
+from migration_watch import ContentWatcher
+
+COURSE = 'Introduction to Computer Science'
+TITLES = ('What is a Computer?', 'Hardware and Software', 'Introduction to Programming',
+          'Variables and Data Types', 'Networking Fundamentals')
+
+def _write_export(path, hooks):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=ENTRY_FIELDS)
+        writer.writeheader()
+        writer.writerows({'id': str(n), 'lesson_title': title, 'attached_to_course': COURSE, 'the_hook': hook}
+                         for n, (title, hook) in enumerate(zip(TITLES, hooks), 1))
+
+def _read_dir(path):
+    return {name: (path / name).read_text(encoding='utf-8') for name in sorted(os.listdir(path))}
+
+def test_watch_outputs_match_the_cli_and_an_edit_rewrites_one_batch(tmp_path):
+    export = tmp_path / 'export.csv'
+    _write_export(export, ['a', 'b', 'c', 'd', 'e'])
+    watched, cli = tmp_path / 'watched', tmp_path / 'cli'
+    watched.mkdir()
+    cli.mkdir()
+
+    watcher = ContentWatcher([str(export)], str(watched), batch_size=2, out=io.StringIO())
+    assert watcher.sync()
+    assert main([str(export), '--output-dir', str(cli), '--batch-size', '2',
+                 '--cache-dir', str(tmp_path / 'cache')]) == 0
+    assert _read_dir(watched) == _read_dir(cli)
+    assert not watcher.sync(changed=[])
+
+    _write_export(export, ['a', 'b', 'C', 'd', 'e'])
+    assert watcher.load_file(str(export)) == (1, 4)
+    assert watcher.write_outputs() == [2]
+    assert '$$C$$' in (watched / BATCH_FILENAME.format(2)).read_text(encoding='utf-8')
+
+def test_unreadable_edit_keeps_rows_and_shrinking_input_removes_stale_batches(tmp_path):
+    export = tmp_path / 'export.json'
+    export.write_text('[' + ', '.join(
+        f'{{"id": {n}, "lesson_title": "{title}", "attached_to_course": "{COURSE}"}}'
+        for n, title in enumerate(TITLES, 1)) + ']', encoding='utf-8')
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+    watcher = ContentWatcher([str(export)], str(output_dir), batch_size=2, out=io.StringIO())
+    watcher.sync()
+    assert sorted(os.listdir(output_dir)) == [BATCH_FILENAME.format(n) for n in (1, 2, 3)]
+
+    # Half-saved by an editor: the previous rows stay until the file parses again
+    export.write_text('[{"id": 1, "lesson_title": ', encoding='utf-8')
+    assert watcher.load_file(str(export)) is None
+    assert len(watcher.rows[str(export)]) == 5
+
+    export.write_text(f'[{{"id": 1, "lesson_title": "{TITLES[0]}", "attached_to_course": "{COURSE}"}}]',
+                      encoding='utf-8')
+    assert watcher.load_file(str(export)) == (0, 1)
+    assert watcher.write_outputs() == [1]
+    assert os.listdir(output_dir) == [BATCH_FILENAME.format(1)]
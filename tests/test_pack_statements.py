@@ -0,0 +1,44 @@
+"""pack_statements caps INSERT statements by row count and by bytes of SQL"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from migrate_course_content import pack_statements, statement_overhead, write_batch
+
+def _entry(row_id, size):
+    """A rendered row of exactly `size` UTF-8 bytes"""
+    head = f"({row_id}, $$"
+    return head + 'é' * ((size - len(head) - 3) // 2) + 'x' * ((size - len(head) - 3) % 2) + "$$)"
+
+def test_short_rows_pack_up_to_the_byte_budget():
+    entries = [_entry(n, 100) for n in range(1, 8)]
+    # Each statement: 10 bytes of overhead, rows of 100 bytes joined by ',\n'
+    packed = list(pack_statements(entries, max_rows=20, max_bytes=320, overhead=10))
+    assert [len(batch) for batch, _ in packed] == [3, 3, 1]
+    assert [size for _, size in packed] == [314, 314, 110]
+    assert [entry for batch, _ in packed for entry in batch] == entries
+
+def test_row_limit_still_applies_and_no_budget_means_rows_only():
+    entries = [_entry(n, 50) for n in range(1, 6)]
+    assert [len(batch) for batch, _ in pack_statements(entries, max_rows=2, max_bytes=10000)] == [2, 2, 1]
+    assert [len(batch) for batch, _ in pack_statements(entries, max_rows=20)] == [5]
+
+def test_oversized_row_gets_a_statement_of_its_own(capsys):
+    entries = [_entry(1, 100), _entry(2, 500), _entry(3, 100)]
+    packed = list(pack_statements(entries, max_rows=20, max_bytes=300, overhead=10))
+    assert [len(batch) for batch, _ in packed] == [1, 1, 1]
+    assert packed[1][1] == 510
+    assert "Row 2 alone is 510 bytes, over the 300 byte budget" in capsys.readouterr().err
+
+def test_reported_size_is_the_written_statement(tmp_path):
+    entries = [_entry(n, 120) for n in range(1, 5)]
+    overhead = statement_overhead(upsert=True)
+    packed = list(pack_statements(entries, max_rows=20, max_bytes=overhead + 250, overhead=overhead))
+    assert [len(batch) for batch, _ in packed] == [2, 2]
+    for batch, size in packed:
+        path = tmp_path / 'batch.sql'
+        with open(path, 'w', encoding='utf-8') as out:
+            write_batch(out, 1, 0, batch, 20, upsert=True)
+        text = path.read_text(encoding='utf-8')
+        statement = text[text.index('INSERT INTO'):text.index(';\n') + 2]
+        assert len(statement.encode('utf-8')) == size <= overhead + 250
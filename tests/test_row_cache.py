@@ -0,0 +1,62 @@
+"""row_cache keeps one cache per input path and only replaces that input's older caches"""
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from row_cache import RACY_NS, STAT_INDEX, cache_path, cached_rows, file_digest
+
+def _parse(rows):
+    return lambda: iter(rows)
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def test_same_named_inputs_keep_their_own_caches(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    first, second = tmp_path / 'a' / 'export.csv', tmp_path / 'b' / 'export.csv'
+    for path in (first, second):
+        os.makedirs(path.parent)
+        _write(path, f"id\n{path.parent.name}\n")
+        list(cached_rows(str(path), 'csv', _parse([{'id': path.parent.name}]), cache_dir))
+    assert cache_path(str(first), 'csv', cache_dir) != cache_path(str(second), 'csv', cache_dir)
+    assert len(glob.glob(os.path.join(cache_dir, '*.sqlite'))) == 2
+
+    # A new version of one input replaces its own cache and leaves the other's alone
+    _write(first, "id\nchanged\n")
+    list(cached_rows(str(first), 'csv', _parse([{'id': 'changed'}]), cache_dir))
+    assert sorted(glob.glob(os.path.join(cache_dir, '*.sqlite'))) == sorted(
+        [cache_path(str(first), 'csv', cache_dir), cache_path(str(second), 'csv', cache_dir)])
+    assert list(cached_rows(str(second), 'csv', _parse([]), cache_dir)) == [{'id': 'b'}]
+
+def test_digest_is_reused_only_for_files_settled_before_hashing(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'cache')
+    path = tmp_path / 'export.csv'
+    _write(path, "id\n1\n")
+    # Rewritten with the same size and mtime right after hashing: still re-hashed
+    first = file_digest(str(path), cache_dir)
+    mtime = os.stat(path).st_mtime_ns
+    _write(path, "id\n2\n")
+    os.utime(path, ns=(mtime, mtime))
+    assert file_digest(str(path), cache_dir) != first
+
+    # Once the last write is older than RACY_NS, the stored digest stands in for the file
+    index_path = os.path.join(cache_dir, STAT_INDEX)
+    monkeypatch.setattr('time.time_ns', lambda: os.stat(path).st_ctime_ns + RACY_NS + 1)
+    settled = file_digest(str(path), cache_dir)
+    with open(index_path, encoding='utf-8') as f:
+        index = json.load(f)
+    index[str(path)][-1] = 'f' * 32
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    assert file_digest(str(path), cache_dir) == 'f' * 32
+
+    # An mtime-preserving rewrite changes the ctime, so it is re-hashed
+    mtime = os.stat(path).st_mtime_ns
+    time.sleep(0.01)
+    _write(path, "id\n2\n")
+    os.utime(path, ns=(mtime, mtime))
+    assert file_digest(str(path), cache_dir) == settled
@@ -0,0 +1,18 @@
+"""shard_runner.py plans shards on a machine without playwright"""
+import os
+import subprocess
+import sys
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testsprite_tests')
+
+def test_plan_runs_without_playwright(tmp_path):
+    # A 'playwright' package that fails to import hides any installed one
+    blocker = tmp_path / 'playwright'
+    blocker.mkdir()
+    (blocker / '__init__.py').write_text("raise ImportError('playwright is not installed')\n", encoding='utf-8')
+    result = subprocess.run(
+        [sys.executable, os.path.join(TESTS_DIR, 'shard_runner.py'), '--shards', '2', '--plan'],
+        env={**os.environ, 'PYTHONPATH': str(tmp_path)}, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert '-- shard 2:' in result.stdout + result.stderr
@@ -0,0 +1,51 @@
+"""sql_dump_reader parses every value form of an INSERT dump, whatever the read boundaries"""
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sql_dump_reader import SQLDumpError, iter_dump_inserts, iter_dump_rows
+
+DUMP = r"""RAW_SQL = '''
+SET statement_timeout = 0;
+INSERT INTO "public"."course_content" ("id", "lesson_title", "the_hook", "created_at", "chapter_number") VALUES
+  (1, 'It''s here', E'line\none\\two ''quoted''', '2024-03-01 12:30:00+00'::timestamp with time zone, 2),
+  (-2, $$plain $ dollar$$, $q$has $$ inside$q$, NULL, 3.5),
+  (3e2, 'x', 'semi;colon', DEFAULT, TRUE);
+INSERT INTO other_table VALUES (10, 'skip me', FALSE)
+ON CONFLICT (id) DO NOTHING;
+'''
+"""
+
+ROWS = [
+    ('course_content', {'id': 1, 'lesson_title': "It's here", 'the_hook': "line\none\\two 'quoted'",
+                        'created_at': '2024-03-01 12:30:00+00', 'chapter_number': 2}),
+    ('course_content', {'id': -2, 'lesson_title': 'plain $ dollar', 'the_hook': 'has $$ inside',
+                        'created_at': None, 'chapter_number': 3.5}),
+    ('course_content', {'id': 300.0, 'lesson_title': 'x', 'the_hook': 'semi;colon',
+                        'created_at': None, 'chapter_number': True}),
+    ('other_table', {'column_1': 10, 'column_2': 'skip me', 'column_3': False}),
+]
+
+def test_every_value_form_is_decoded():
+    assert list(iter_dump_inserts(io.StringIO(DUMP))) == ROWS
+
+def test_rows_do_not_depend_on_read_boundaries():
+    expected = list(iter_dump_inserts(io.StringIO(DUMP)))
+    for chunk_size in (1, 2, 3, 7, 16, 64):
+        assert list(iter_dump_inserts(io.StringIO(DUMP), chunk_size=chunk_size)) == expected
+
+def test_table_filter_ignores_schema_and_quotes():
+    assert [row['id'] for row in iter_dump_rows(io.StringIO(DUMP), table='COURSE_CONTENT')] == [1, -2, 300.0]
+    assert list(iter_dump_rows(io.StringIO(DUMP), table='other_table')) == [ROWS[3][1]]
+
+@pytest.mark.parametrize('dump', [
+    "INSERT INTO t (a, b) VALUES (1, 'unterminated",
+    "INSERT INTO t (a, b) VALUES (1, $x$never closed",
+    "INSERT INTO t (a, b) VALUES (1, 2, 3);",
+])
+def test_malformed_dumps_raise(dump):
+    with pytest.raises(SQLDumpError):
+        list(iter_dump_rows(io.StringIO(dump)))
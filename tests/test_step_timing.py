@@ -0,0 +1,28 @@
+"""step_timing.regressions windows each test's own runs, as shard_runner.py records one run per shard"""
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testsprite_tests'))
+from step_timing import StepTimer, connect, record_run, regressions
+
+def _run(title, seconds):
+    timer = StepTimer()
+    timer.steps.append(("goto http://localhost:3000/login", seconds, True))
+    return SimpleNamespace(title=title, timer=timer)
+
+def test_sharded_runs_are_windowed_per_test(tmp_path):
+    history = str(tmp_path / 'history.sqlite')
+    # Four suite runs of two shards each: TC001 in one shard, TC002 in the other
+    for suite in range(4):
+        record_run([_run('TC001-Login', 1.0)], [], 1.0, 1, 1, history)
+        record_run([_run('TC002-Signup', 1.0 if suite < 3 else 3.0)], [], 1.0, 1, 1, history)
+    # Then the first shard alone is run again, e.g. a CI matrix job retried
+    record_run([_run('TC001-Login', 1.0)], [], 1.0, 1, 1, history)
+
+    conn = connect(history)
+    try:
+        flagged = regressions(conn, threshold=20, recent=1, baseline=3)
+    finally:
+        conn.close()
+    assert [(test, old, new) for test, _, old, new, _ in flagged] == [('TC002-Signup', 1.0, 3.0)]
@@ -0,0 +1,128 @@
+"""suite_runner runs unchanged TC modules on a pool of shared browsers, without their asyncio.run line"""
+import asyncio
+import io
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testsprite_tests'))
+import suite_runner
+from step_timing import TIMER_NAME
+from suite_runner import SuiteRunner, discover, load_test
+
+# The shape of a generated test, minus the playwright import the runner replaces anyway
+TEST_SOURCE = '''import asyncio
+async_api = None
+
+async def run_test():
+    pw = None
+    browser = None
+    context = None
+    try:
+        pw = await async_api.async_playwright().start()
+        browser = await pw.chromium.launch(headless=True, args=["--single-process"])
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.goto("http://localhost:3000/{name}", wait_until="commit", timeout=10000)
+        {extra}
+    finally:
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+asyncio.run(run_test())
+'''
+
+class _Page:
+    def __init__(self, visits):
+        self.visits = visits
+
+    async def goto(self, url, **options):
+        await asyncio.sleep(0.01)
+        self.visits.append(url)
+
+class _Context:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self):
+        return _Page(self.browser.visits)
+
+    async def close(self):
+        self.closed = True
+
+class _Browser:
+    def __init__(self):
+        self.visits = []
+        self.contexts = []
+        self.closed = False
+
+    async def new_context(self, **options):
+        self.contexts.append(_Context(self))
+        return self.contexts[-1]
+
+    async def close(self):
+        self.closed = True
+
+class _Playwright:
+    def __init__(self, browsers):
+        self.browsers = browsers
+        self.chromium = self
+
+    async def launch(self, **options):
+        self.browsers.append(_Browser())
+        return self.browsers[-1]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+def _fake_async_api(browsers):
+    return SimpleNamespace(async_playwright=lambda: _Playwright(browsers), Error=RuntimeError)
+
+def _write_test(tests_dir, filename, extra='pass'):
+    path = tests_dir / filename
+    name = filename.split('_', 1)[0].lower()
+    path.write_text(TEST_SOURCE.replace('{name}', name).replace('{extra}', extra), encoding='utf-8')
+    return str(path)
+
+def test_discover_and_titles(tmp_path):
+    for filename in ('TC002_User_Login_Success.py', 'TC001_User_Registration_Success.py', 'helper.py'):
+        _write_test(tmp_path, filename)
+    assert [os.path.basename(path) for path in discover(tests_dir=str(tmp_path))] == [
+        'TC001_User_Registration_Success.py', 'TC002_User_Login_Success.py']
+    assert discover(['TC002'], tests_dir=str(tmp_path)) == [str(tmp_path / 'TC002_User_Login_Success.py')]
+    # Called through the module so pytest does not collect it as a test
+    assert suite_runner.test_title('TC002_User_Login_Success.py') == 'TC002-User Login Success'
+
+def test_loaded_test_does_not_run_on_import(tmp_path):
+    code, role = load_test(_write_test(tmp_path, 'TC001_Example.py'))
+    namespace = {TIMER_NAME: None}
+    exec(code, namespace)
+    assert role is None and asyncio.iscoroutinefunction(namespace['run_test'])
+
+def test_tests_share_the_workers_browsers(tmp_path, monkeypatch):
+    browsers = []
+    monkeypatch.setattr(suite_runner, 'async_api', _fake_async_api(browsers))
+    paths = [_write_test(tmp_path, f"TC00{n}_Passes.py") for n in range(1, 5)]
+    paths.append(_write_test(tmp_path, 'TC005_Fails.py', 'raise ValueError("button not found\\nmore")'))
+    paths.append(_write_test(tmp_path, 'TC006_Hangs.py', 'await asyncio.sleep(5)'))
+
+    runner = SuiteRunner(workers=2, concurrency=3, timeout=0.5, out=io.StringIO())
+    runs = asyncio.run(runner.run(paths))
+
+    assert [run.status for run in runs] == ['PASSED'] * 4 + ['FAILED', 'FAILED']
+    assert runs[4].error == 'ValueError: button not found'
+    assert runs[5].error == 'timed out after 0.5s'
+    # Six tests, two launched browsers: each test only opened a context, and every context was closed
+    assert len(browsers) == 2 and all(browser.closed for browser in browsers)
+    assert sorted(url for browser in browsers for url in browser.visits) == [
+        f"http://localhost:3000/tc00{n}" for n in range(1, 7)]
+    assert all(context.closed for browser in browsers for context in browser.contexts)
+    assert [step for step, _, _ in runs[0].timer.steps][-1].startswith('goto')
@@ -0,0 +1,37 @@
+"""wait_policy.migrate_source rewrites the generated tests' fixed sleeps"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testsprite_tests'))
+from wait_policy import migrate_source, remaining_sleeps
+
+SOURCE = """import asyncio
+from playwright.async_api import expect
+
+async def run_test():
+    try:
+        await page.goto('http://localhost:3000/login', timeout=10000)
+        await asyncio.sleep(3)
+
+        frame = context.pages[-1]
+        elem = frame.locator('xpath=html/body/div/form/div[3]/button').nth(0)
+        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await asyncio.sleep(3)
+        await expect(frame.locator('text=Dashboard').first).to_be_visible(timeout=3000)
+        await asyncio.sleep(5)
+    
+    finally:
+        pass
+"""
+
+def test_sleeps_are_replaced_or_dropped():
+    migrated, removed, ms = migrate_source(SOURCE)
+    assert removed == 3
+    assert ms == 11000
+    assert "        await wait_policy.settle(page)\n\n" in migrated
+    assert "        await wait_policy.click(elem, timeout=5000)\n" in migrated
+    assert "import wait_policy\n" in migrated
+    # Only the sleep after a goto is a load wait; one after a click is left for a person to judge
+    assert remaining_sleeps(migrated) == 1
+    assert "asyncio.sleep(5)" not in migrated
+    assert migrate_source(migrated)[1] == 0
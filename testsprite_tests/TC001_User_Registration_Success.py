@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,43 +51,43 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click dismiss button to close error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Use go_to_url action to navigate directly to the registration page as no clickable element is found
         await page.goto('http://localhost:3000/register', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Navigate directly to registration page URL to proceed with registration
         await page.goto('http://localhost:3000/register', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Use go_to_url action to navigate directly to the registration page as no clickable element is found
         await page.goto('http://localhost:3000/register', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Navigate directly to registration page URL to proceed with registration
         await page.goto('http://localhost:3000/register', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Navigate directly to registration page URL to proceed with registration
         await page.goto('http://localhost:3000/register', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Dismiss the error overlay by clicking the dismiss button to clear the screen and then try direct URL navigation to registration page again
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click dismiss button to close error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         await page.goto('http://localhost:3000/register', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # --> Assertions to verify final state
@@ -94,7 +95,6 @@ async def run_test():
             await expect(page.locator('text=Registration Successful! Welcome to your Free Dashboard').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: User registration did not complete successfully or user was not assigned the default Free role as expected.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
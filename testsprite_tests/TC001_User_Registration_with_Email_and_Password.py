@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,109 +51,109 @@ async def run_test():
         # -> Click on 'create a new account' link to navigate to signup page.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/div/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Fill in the signup form with valid full name, email, password, confirm password, and check the agree to terms checkbox.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Human Catalyst')
+        await wait_policy.fill(elem, 'Human Catalyst')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456Aa')
+        await wait_policy.fill(elem, '123456Aa')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456Aa')
+        await wait_policy.fill(elem, '123456Aa')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[5]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Create account' button to submit the registration form.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input the registered email and password to login and verify user role assignment.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456Aa')
+        await wait_policy.fill(elem, '123456Aa')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Navigate back to signup page to retry registration or check for issues.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/div/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Fill in the signup form again with valid full name, email, password, confirm password, and agree to terms checkbox.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Human Catalyst')
+        await wait_policy.fill(elem, 'Human Catalyst')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456Aa')
+        await wait_policy.fill(elem, '123456Aa')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456Aa')
+        await wait_policy.fill(elem, '123456Aa')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[5]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Create account' button to submit the registration form again.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Attempt to login again with the registered email and password to verify if registration was successful this time.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456Aa')
+        await wait_policy.fill(elem, '123456Aa')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -161,7 +162,6 @@ async def run_test():
             await expect(frame.locator('text=Registration Completed Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The user registration did not complete successfully, or the user was not assigned the default Free or Student role as expected based on the test plan.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,19 +51,19 @@ async def run_test():
         frame = context.pages[-1]
         # Input valid email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input valid password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click the sign in button to submit login form
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -89,7 +90,6 @@ async def run_test():
         await expect(frame.locator('text=0%').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Wisdom from the teachers').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=View All').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
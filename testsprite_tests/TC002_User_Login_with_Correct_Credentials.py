@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,35 +51,35 @@ async def run_test():
         # -> Input valid email and password for the Free user role and click sign in.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Log out from current session to prepare for next user role login.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Log out from Admin user session to prepare for next user role login.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking the Settings button (index 11) to check for logout option or user menu for logout.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[8]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -87,7 +88,6 @@ async def run_test():
             await expect(frame.locator('text=Login Successful for All User Roles')).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The login functionality did not succeed for all user roles as expected. The user was not redirected to the dashboard with appropriate role permissions.')
-        await asyncio.sleep(5)
 
     finally:
         if context:
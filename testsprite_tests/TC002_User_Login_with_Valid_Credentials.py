@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,14 +51,14 @@ async def run_test():
         frame = context.pages[-1]
         # Enter valid email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # -> Enter password into the password field and click the sign in button
         frame = context.pages[-1]
         # Enter valid password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         # --> Assertions to verify final state
@@ -66,7 +67,6 @@ async def run_test():
             await expect(frame.locator('text=Login Failed: Invalid Credentials').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: User login was not successful despite entering valid email and password, or user was not redirected to the Dashboard with role-based widgets displayed as per the test plan.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,21 +51,21 @@ async def run_test():
         frame = context.pages[-1]
         # Enter incorrect email
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # -> Dismiss the new overlay or popup blocking interaction to continue login attempt
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss the new overlay or popup
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Enter incorrect password and click sign in button
         frame = context.pages[-1]
         # Enter incorrect password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongpassword')
+        await wait_policy.fill(elem, 'wrongpassword')
         
 
         # --> Assertions to verify final state
@@ -73,7 +74,6 @@ async def run_test():
             await expect(frame.locator('text=Login Successful').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError('Test case failed: Login should fail with incorrect email or password, but "Login Successful" message was found, indicating unexpected success.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,19 +51,19 @@ async def run_test():
         frame = context.pages[-1]
         # Input invalid email into email field
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input invalid password into password field
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongpassword')
+        await wait_policy.fill(elem, 'wrongpassword')
         
 
         frame = context.pages[-1]
         # Click the Sign in button to attempt login with invalid credentials
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -70,7 +71,6 @@ async def run_test():
         await expect(frame.locator('text=Sign in to your account').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Forgot your password?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Sign in').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
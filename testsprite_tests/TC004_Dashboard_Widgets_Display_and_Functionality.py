@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,23 +51,23 @@ async def run_test():
         # -> Input email and password, then click Sign in button to login as student user and navigate to dashboard
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Confirm Quick Actions widget navigation links function by clicking each and verifying navigation.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Scroll to Quick Actions widget and retry clicking each navigation button to confirm functionality
@@ -75,13 +76,13 @@ async def run_test():
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click each Quick Actions button (indices 16, 17, 18, 19) and verify navigation or action triggered
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -102,7 +103,6 @@ async def run_test():
         await expect(frame.locator('text=Locked - 100,000 XP Required').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=You need 100,000 XP to unlock God Mode').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=You currently have 50,000 XP').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
 
     finally:
         if context:
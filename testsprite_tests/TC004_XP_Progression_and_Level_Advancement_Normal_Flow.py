@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,26 +51,26 @@ async def run_test():
         frame = context.pages[-1]
         # Input email address for login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password for login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click Sign in button to submit login form
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Browse Courses' to find a course lesson to complete
         frame = context.pages[-1]
         # Click 'Browse Courses' to view available courses
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -78,7 +79,6 @@ async def run_test():
             await expect(frame.locator('text=XP Mastery Unlocked!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: XP gains through course completion and habit mastery did not lead to expected level increase across schools as per the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,21 +51,21 @@ async def run_test():
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # -> Input password into the password field at index 3 and click the Sign in button at index 5.
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         # -> Complete an activity that grants XP such as 'Begin Ritual' and verify XP progress widget updates.
         frame = context.pages[-1]
         # Click 'View All' button to explore activities or lessons that grant XP
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[4]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -73,7 +74,6 @@ async def run_test():
             await expect(frame.locator('text=XP Mastery Achieved').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: XP tracking and user level increment verification did not pass as expected. The XP progress widget did not update correctly, or the user level did not increment upon reaching XP thresholds.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,27 +51,27 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click on email input field to focus
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input email and password, then click sign in button.
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         # -> Identify and click the correct sign-in button to log in and proceed to habit tracking page.
         frame = context.pages[-1]
         # Click the visible 'Sign in' button to log in
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -78,7 +79,6 @@ async def run_test():
             await expect(page.locator('text=Habit Completion Success!')).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The habit tracker did not update the streak count as expected after marking daily completions. The streak count did not increase or reset properly according to the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,26 +51,26 @@ async def run_test():
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click Sign in button
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Courses' button to open the Course Catalog page.
         frame = context.pages[-1]
         # Click 'Courses' button to open Course Catalog page
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -78,7 +79,6 @@ async def run_test():
             await expect(frame.locator('text=Enrollment Completed Successfully').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError("Test case failed: Enrollment did not complete successfully, or the course does not appear in the user's current lessons as expected in the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -53,63 +54,63 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click on the email input field to activate it
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input email and password, then click sign in button to login and navigate to course catalog page.
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # -> Input password into the password field and click the sign in button to complete login and navigate to the course catalog.
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         # -> Dismiss the error overlay and retry clicking sign in or investigate alternative ways to proceed to course catalog.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss the error overlay by clicking × button
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the sign in button to attempt login and navigate to the course catalog page.
         frame = context.pages[-1]
         # Click sign in button
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Browse Courses' button to navigate to the course catalog page.
         frame = context.pages[-1]
         # Click 'Browse Courses' button to go to course catalog
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Select a course by clicking the 'Start Course' or 'Continue' button to proceed with enrollment or course continuation.
         frame = context.pages[-1]
         # Click 'Start Course' button for the first course
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Dismiss the error overlay and attempt to verify if course content loads or report the issue if interaction is blocked.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss the compilation error overlay by clicking × button
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Start Course' button to attempt to start the course and verify if any lessons or progress tracking features appear.
         frame = context.pages[-1]
         # Click 'Start Course' button to start the course
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -117,7 +118,6 @@ async def run_test():
             await expect(page.locator('text=Course Completion Congratulations!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed to verify course catalog browsing, enrollment, and course progress saving. Expected confirmation message 'Course Completion Congratulations!' was not found on the page.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
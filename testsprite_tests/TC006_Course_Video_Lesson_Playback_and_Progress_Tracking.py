@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,83 +51,83 @@ async def run_test():
         # -> Input email and password, then click Sign in button to log in
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on 'Courses' button to navigate to courses list
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on the 'Continue' button of the first course under Ignition to open the enrolled course's video lesson
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking 'Continue' button for the first course under Insight to see if video lesson opens
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/div[2]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Start Course' button to attempt to start the course and load the first video lesson
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try to open the next lesson in the chapter to check if video content is available there
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking 'Mark as Complete (+50 XP)' button (index 29) to simulate progress update
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Next Lesson' button to navigate to the next lesson and verify if video content is available there
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking 'Continue Learning' button (index 15) to resume the course and check if video lesson loads properly
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking 'Mark as Complete (+50 XP)' button (index 27) again to confirm progress update functionality
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Next Lesson' button (index 25) to navigate to the next lesson and check for video content availability
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div/div[2]/div[3]/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Mark as Complete (+50 XP)' button (index 27) to simulate progress update for this lesson
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -135,7 +136,6 @@ async def run_test():
             await expect(frame.locator('text=Video Playback Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The course video lessons did not play properly or user progress was not tracked and saved correctly as per the test plan.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,41 +51,41 @@ async def run_test():
         frame = context.pages[-1]
         # Input email address for teacher login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # -> Try clicking on the password input field at index 3 to focus, then input password, then click sign in button at index 5.
         frame = context.pages[-1]
         # Click on password input field to focus
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try to input password by clicking on the password field using text or placeholder, then input password, then click sign in button.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click on password input field by visible text or placeholder
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input password into password field at index 3 and click sign in button at index 5.
         frame = context.pages[-1]
         # Input password for teacher login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click Sign in button to login as teacher
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on the 'Browse Courses' button to navigate to the courses catalog or course creation page.
         frame = context.pages[-1]
         # Click on 'Browse Courses' button on dashboard to navigate to courses catalog or course creation page
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[4]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -93,7 +94,6 @@ async def run_test():
             await expect(frame.locator('text=Course Creation Successful!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed because the course creation process for a user with Teacher role did not complete successfully. The expected confirmation message 'Course Creation Successful!' was not found on the page.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,23 +51,23 @@ async def run_test():
         # -> Input teacher email and password, then click Sign in button to login.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on 'Courses' button to navigate to courses page.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Look for a button or link to create a new course and click it.
@@ -76,7 +77,7 @@ async def run_test():
         # -> Click on 'Dashboard' button to check if course creation option is available there.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -85,7 +86,6 @@ async def run_test():
             await expect(frame.locator('text=Course Creation Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Teacher role users could not access the course creation page, create new courses, add video lessons, or save content without errors as required by the test plan.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
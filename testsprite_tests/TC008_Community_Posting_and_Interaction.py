@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,47 +51,47 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click dismiss button on error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input email and password, then click Sign in button
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click Sign in button
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Navigate to community page to start creating a post
         frame = context.pages[-1]
         # Click 'View All' button to navigate to community or social feed page
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[4]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Dismiss the compile error overlay to ensure unobstructed interaction and then create a new post with title and rich text content
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss compile error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on 'View All' button (index 24) under 'The Wayless Path' section to navigate to community posts page and create a new post
         frame = context.pages[-1]
         # Click 'View All' button under 'The Wayless Path' to go to community posts page
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[4]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -99,7 +100,6 @@ async def run_test():
             await expect(frame.locator('text=Post creation successful! Your post is now live.').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed to verify that users can create posts, comment, like, and participate in challenges on the social feed. The expected confirmation message 'Post creation successful! Your post is now live.' was not found on the page.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
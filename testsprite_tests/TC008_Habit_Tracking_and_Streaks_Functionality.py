@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,23 +51,23 @@ async def run_test():
         # -> Input email and password, then click Sign in button to login
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on Mastery tab to navigate to Mastery Habits section
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -75,7 +76,6 @@ async def run_test():
             await expect(frame.locator('text=Habit Completion Unsuccessful').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: The habit could not be added, edited, completed, or tracked correctly as per the test plan. Immediate failure triggered due to test plan execution failure.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,56 +51,56 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click the Dismiss button to close the error message
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input email and password, then click Sign in to authenticate as the free user.
         frame = context.pages[-1]
         # Input the email address for login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # -> Input the password and click the sign in button to authenticate.
         frame = context.pages[-1]
         # Input the password for login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         # -> Dismiss the compilation error overlay again to try to restore access to the 'Sign in' button, then attempt to click the 'Sign in' button if it becomes accessible.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click the Dismiss button to close the compilation error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Sign in' button to submit the login form and proceed to the Pricing page.
         frame = context.pages[-1]
         # Click the 'Sign in' button to submit login form
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Dismiss the compilation error overlay on the dashboard page to access the dashboard content and proceed to the Pricing page.
         frame = context.pages[-1]
         # Click the Dismiss button to close the compilation error overlay on the dashboard page
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[4]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Dismiss' button at index 1 to remove the compilation error overlay and access the dashboard content.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click the 'Dismiss' button to close the compilation error overlay on the dashboard page
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the Pricing button to navigate to the Pricing page.
         frame = context.pages[-1]
         # Click the Pricing button to navigate to the Pricing page
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[9]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -108,7 +109,6 @@ async def run_test():
             await expect(frame.locator('text=Subscription Upgrade Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Payment processing via Stripe did not complete successfully, user role did not upgrade, or premium features were not enabled as per the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -53,14 +54,14 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss the error message popup
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input email and password, then click Sign in button to log in.
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # -> Try to locate password input and sign-in button by scrolling, inspecting other elements, or using alternative selectors.
@@ -71,49 +72,49 @@ async def run_test():
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         # -> Dismiss the ESLint error overlay and then input password and click sign-in button to log in.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss ESLint error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the sign-in button to log in.
         frame = context.pages[-1]
         # Click Sign in button
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on the Profile button to navigate to Profile settings page.
         frame = context.pages[-1]
         # Click Profile button to go to Profile settings page
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Change display name and avatar URL, then save changes.
         frame = context.pages[-1]
         # Change display name
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('New Display Name')
+        await wait_policy.fill(elem, 'New Display Name')
         
 
         # -> Reload the profile page to verify that the changes persist and check if the updated display name and avatar are reflected in the user menu/avatar components.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss compile error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click Save Character button to save changes, then reload the profile page to verify changes persist and check user menu/avatar for updates.
         frame = context.pages[-1]
         # Click Save Character button to save profile changes
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -122,7 +123,6 @@ async def run_test():
             await expect(frame.locator('text=Profile update successful!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Profile settings update did not persist after save as required by the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,65 +51,65 @@ async def run_test():
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click Sign in button
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on the Profile button to go to the Profile page.
         frame = context.pages[-1]
         # Click on Profile button to go to Profile page
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input new display name, update avatar URL, and save profile changes.
         frame = context.pages[-1]
         # Edit user display name
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Note The Founder Edited')
+        await wait_policy.fill(elem, 'Note The Founder Edited')
         
 
         frame = context.pages[-1]
         # Update avatar URL to a predefined image
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('https://mbffycgrqfeesfnhhcdm.supabase.co/storage/v1/object/public/avatars/avatars/8c94448d-e21c-4b7b-be9a-88a5692dc5d6-1759645994910.png')
+        await wait_policy.fill(elem, 'https://mbffycgrqfeesfnhhcdm.supabase.co/storage/v1/object/public/avatars/avatars/8c94448d-e21c-4b7b-be9a-88a5692dc5d6-1759645994910.png')
         
 
         frame = context.pages[-1]
         # Click Save button to save profile changes
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Change profile avatar using predefined images.
         frame = context.pages[-1]
         # Change avatar URL to another predefined image
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('https://mbffycgrqfeesfnhhcdm.supabase.co/storage/v1/object/public/avatars/avatars/1a2b3c4d-5678-90ab-cdef-1234567890ab.png')
+        await wait_policy.fill(elem, 'https://mbffycgrqfeesfnhhcdm.supabase.co/storage/v1/object/public/avatars/avatars/1a2b3c4d-5678-90ab-cdef-1234567890ab.png')
         
 
         frame = context.pages[-1]
         # Click Save Character button to save avatar change
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Upload a custom avatar image.
         frame = context.pages[-1]
         # Click on Character Description textarea to check for upload or drag-drop avatar option
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[3]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
@@ -117,7 +118,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click Save Character button to confirm any changes after upload attempt
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -125,7 +126,6 @@ async def run_test():
         await expect(frame.locator('text=Note The Founder Edited').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=humancatalystnote@gmail.com').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Save Character').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
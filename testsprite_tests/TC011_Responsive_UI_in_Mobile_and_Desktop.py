@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -58,7 +59,7 @@ async def run_test():
         
 
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Resize the window or switch to mobile viewport to verify responsive layout, touch target sizes, and glassmorphism styling on mobile.
@@ -72,14 +73,14 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click Dismiss button to close ESLint error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input email and password into the respective fields and click the Sign in button to access the dashboard.
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # --> Assertions to verify final state
@@ -89,7 +90,6 @@ async def run_test():
         await expect(frame.locator('text=Password').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Forgot your password?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Sign in').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
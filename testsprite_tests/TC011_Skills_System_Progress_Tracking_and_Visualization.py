@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,35 +51,35 @@ async def run_test():
         # -> Input email and password, then click Sign in button to log in and navigate to Skills section
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on Skills section button to navigate to Skills page
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking the 'Courses' button (index 5) to see if it leads to the Skills section or contains skill tracking information.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Look for navigation or buttons that lead to the Skills section or skill progress data. If none found, try clicking on a course's Continue or Start Course button to check if skill progress or radar chart appears there.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Scroll down slightly to ensure the Continue button is fully in viewport and try clicking the Continue button again.
@@ -87,43 +88,43 @@ async def run_test():
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Continue Learning' button to enter the course content and check for skill progress updates or radar chart visualization.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Mark as Complete (+50 XP)' button to simulate completing the lesson and check if skill progress and radar chart update accordingly.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[3]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Next Lesson' button to proceed to the next lesson and check for skill progress updates or radar chart visualization.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[3]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click 'Mark as Complete (+50 XP)' button to simulate completing the lesson and check if skill progress and radar chart update accordingly.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div[2]/div/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Navigate back to the Mastery or Skills section to verify if the radar chart visualization updates reflecting the new skill progress data.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking the 'Hub' button (index 14) to check if the radar chart visualization is available there or explore other navigation options for skill progress visualization.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div/nav/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -132,7 +133,6 @@ async def run_test():
             await expect(frame.locator('text=Skill Mastery Unlocked!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed to verify that multiple skills in cognitive, creative, discipline, and social categories are tracked accurately and radar chart visualizations render properly.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,35 +51,35 @@ async def run_test():
         # -> Input email and password, then click Sign in button to log in.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on Achievements button to navigate to Achievements page.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[8]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Find and click the Achievements button to navigate to the Achievements page or report issue if not found.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Check the dropdown at index 16 for an Achievements option and select it if available to navigate to Achievements page.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/select').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -87,7 +88,6 @@ async def run_test():
             await expect(frame.locator('text=Achievement Unlocked: Galactic Mastery').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError("Test case failed: The badge achievement system did not display the expected earned badges or update achievement progress correctly based on user activity as per the test plan.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,47 +51,47 @@ async def run_test():
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click Sign in button
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on Profile button to navigate to Profile or Skills section.
         frame = context.pages[-1]
         # Click Profile button to navigate to Profile or Skills section
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Navigate to an activity or assessment page to complete activities that update skills.
         frame = context.pages[-1]
         # Click Courses button to navigate to activities or assessments that update skills
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try alternative navigation by clicking 'Mastery' button to find activities or assessments that update skills.
         frame = context.pages[-1]
         # Click Mastery button to navigate to skill update activities
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking 'Courses' button again to verify if it is accessible or try 'Dashboard' button to find skill update activities.
         frame = context.pages[-1]
         # Retry clicking Courses button to navigate to skill update activities
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -99,7 +100,6 @@ async def run_test():
             await expect(frame.locator('text=Skill Mastery Unlocked').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed to validate tracking of cognitive, creative, discipline, and social skills with radar chart visualization updates. Expected skill update confirmation 'Skill Mastery Unlocked' not found on the page.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
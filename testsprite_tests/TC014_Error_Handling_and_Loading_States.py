@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,14 +51,14 @@ async def run_test():
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Dismiss the compile error overlay by clicking the Dismiss button
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Input email and password and click Sign in to proceed to the main app interface for further testing.
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         # --> Assertions to verify final state
@@ -65,7 +66,6 @@ async def run_test():
             await expect(page.locator('text=Data fetch successful')).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test failed: The application did not display user-friendly error messages or loading indicators during data fetch failures or slow network as expected.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
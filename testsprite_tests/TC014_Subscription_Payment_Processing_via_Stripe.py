@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,24 +51,24 @@ async def run_test():
         # -> Input email and password, then click Sign in button
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Navigate to Pricing page by clicking the appropriate button
         frame = context.pages[-1]
         # Settings button
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[8]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try alternative navigation to Pricing page or report the issue if no navigation elements are found.
@@ -77,21 +78,21 @@ async def run_test():
         frame = context.pages[-1]
         # Courses button - possible alternative navigation to subscription or pricing
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try to navigate to Settings page (index 11) to check for subscription or billing options.
         frame = context.pages[-1]
         # Settings button
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[8]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Check if there is a subscription or billing section accessible from the Settings page or sidebar.
         frame = context.pages[-1]
         # Account tab in Settings
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/nav/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try to scroll down or explore other elements to find subscription or billing options, or report issue if none found.
@@ -101,26 +102,26 @@ async def run_test():
         frame = context.pages[-1]
         # Account tab in Settings
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/nav/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking other tabs in Settings (Notifications, Appearance, Privacy) to check for subscription or billing options.
         frame = context.pages[-1]
         # Notifications tab
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         frame = context.pages[-1]
         # Appearance tab
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         frame = context.pages[-1]
         # Privacy tab
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/nav/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -129,7 +130,6 @@ async def run_test():
             await expect(frame.locator('text=Subscription Upgrade Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The subscription process did not complete successfully. Payment processing via Stripe or user role updates might have failed as per the test plan.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
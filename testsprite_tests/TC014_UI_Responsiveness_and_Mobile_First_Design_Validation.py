@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,48 +51,48 @@ async def run_test():
         frame = context.pages[-1]
         # Click 'create a new account' link to check navigation and UI on desktop
         elem = frame.locator('xpath=html/body/div/div/div/div/div/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Switch to tablet view and verify layout, touch targets, glassmorphism styling, and safe area handling.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Switch to tablet view and verify layout, touch targets, glassmorphism styling, and safe area handling.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Switch to tablet view and verify layout, touch targets, glassmorphism styling, and safe area handling.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Switch to tablet view and verify layout, touch targets, glassmorphism styling, and safe area handling.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Switch to tablet view and verify layout, touch targets, glassmorphism styling, and safe area handling.
         frame = context.pages[-1]
         # Open device toolbar to switch to tablet view
         elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Switch to tablet view and verify layout, touch targets, glassmorphism styling, and safe area handling.
         frame = context.pages[-1]
         # Open device toolbar to switch to tablet view
         elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Switch to mobile view and verify layout, touch targets, glassmorphism styling, and safe area handling.
         frame = context.pages[-1]
         # Open device toolbar to switch to mobile view
         elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -100,7 +101,6 @@ async def run_test():
             await expect(frame.locator('text=UI Responsiveness Test Passed').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test plan execution failed: UI responsiveness on multiple device screen sizes, touch target sizes, glassmorphism styling, and safe area handling verification did not pass.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
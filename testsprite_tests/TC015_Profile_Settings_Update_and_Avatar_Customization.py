@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,34 +51,34 @@ async def run_test():
         # -> Input email and password, then click Sign in button to log in
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on the Profile button to navigate to Profile settings page
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Clear and input new avatar URL in avatar URL field (index 26), then click Save Character button (index 29) to save changes and verify immediate UI update
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('https://mbffycgrqfeesfnhhcdm.supabase.co/storage/v1/object/public/avatars/avatars/updated-avatar.png')
+        await wait_policy.fill(elem, 'https://mbffycgrqfeesfnhhcdm.supabase.co/storage/v1/object/public/avatars/avatars/updated-avatar.png')
         
 
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/form/div[5]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -86,7 +87,6 @@ async def run_test():
             await expect(frame.locator('text=Profile update successful!').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: The profile settings update did not reflect immediately in the UI as expected. The test plan requires verifying that changes to personal settings and avatar are saved and displayed correctly, but this confirmation message was not found.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -54,48 +55,48 @@ async def run_test():
         frame = context.pages[-1]
         # Input email address
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         # -> Click the visible Sign in button to log in as Free user.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click the visible Sign in button
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking the Sign in button again or check for other interactive elements to proceed with login.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click the Sign in button again to attempt login
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the Sign in button to log in as Free user.
         frame = context.pages[-1]
         # Click the Sign in button
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Attempt to access teacher-specific pages or admin panel to verify access restrictions for Free user.
         frame = context.pages[-1]
         # Click Courses button to check if teacher-specific pages are accessible
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try clicking the 'Courses' button again or find alternative navigation to teacher-specific pages to verify access restrictions for Free user.
         frame = context.pages[-1]
         # Click 'Browse Courses' button as alternative to access courses page
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try to find alternative navigation elements or URLs to test access restrictions for Free user on teacher and admin pages.
@@ -106,21 +107,21 @@ async def run_test():
         frame = context.pages[-1]
         # Click 'Courses' button to test access for Free user
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Dismiss the error overlay by clicking the 'Dismiss' button (index 1) to clear the UI and enable interaction with navigation elements.
         frame = context.pages[-1].frame_locator('html > body > iframe[id="webpack-dev-server-client-overlay"][src="about:blank"]')
         # Click 'Dismiss' button to close the error overlay
         elem = frame.locator('xpath=html/body/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click the 'Courses' button (index 6) to test access restrictions for Free user on teacher-specific pages.
         frame = context.pages[-1]
         # Click 'Courses' button to test access for Free user
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -129,7 +130,6 @@ async def run_test():
             await expect(frame.locator('text=Access Granted to Teacher Features').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test failed: Users should not access unauthorized features or pages according to their role, but access was incorrectly granted.')
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,40 +51,40 @@ async def run_test():
         frame = context.pages[-1]
         # Input email for Free user login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password for Free user login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click Sign in button to login as Free user
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Attempt to access premium content or Teacher features as Free user
         frame = context.pages[-1]
         # Click Courses to check access to premium content for Free user
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try alternative way to access premium content or Teacher features for Free user, e.g. click 'Browse Courses' or use another visible button related to courses
         frame = context.pages[-1]
         # Click 'Browse Courses' button to check access to premium content for Free user
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Attempt to access a Teacher-specific feature or page to confirm access denial for Free user
         frame = context.pages[-1]
         # Click Dashboard to navigate back and try accessing Teacher features for Free user
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try alternative navigation to dashboard or Teacher features for Free user, e.g. click 'Profile' or 'Settings' or scroll to find dashboard button
@@ -93,14 +94,14 @@ async def run_test():
         frame = context.pages[-1]
         # Click Profile button to check navigation options for Free user
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click Dashboard button to navigate back and attempt to access Teacher features for Free user
         frame = context.pages[-1]
         # Click Dashboard button to navigate back from courses page
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -109,7 +110,6 @@ async def run_test():
             await expect(frame.locator('text=Exclusive Teacher Dashboard Access').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Access to premium content or Teacher features is not properly restricted for Free user as per the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -49,75 +50,75 @@ async def run_test():
  
         # -> Test the login page on a mobile screen size to verify responsive layout, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify login page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify login page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify the login page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify the login page UI responsiveness, glassmorphism effect, and touch target sizes.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Simulate tablet screen size and verify the login page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate tablet screen size and verify the login page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Proceed to test another key page or component for responsive layout, glassmorphism effect, and touch target sizes.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/div/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Simulate mobile screen size and verify the signup page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify the signup page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify the signup page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify the signup page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify the signup page UI responsiveness, glassmorphism effect, and touch target sizes.
         await page.goto('http://localhost:3000/signup', timeout=10000)
-        await asyncio.sleep(3)
+        await wait_policy.settle(page)
         
 
         # -> Simulate mobile screen size and verify the signup page UI responsiveness, glassmorphism effect, and touch target sizes.
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div/div/div/div/div/p/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -128,7 +129,6 @@ async def run_test():
         await expect(frame.locator('text=Password').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Forgot your password?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Sign in').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
 
     finally:
         if context:
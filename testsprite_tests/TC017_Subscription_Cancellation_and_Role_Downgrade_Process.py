@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+import wait_policy
 
 async def run_test():
     pw = None
@@ -50,40 +51,40 @@ async def run_test():
         frame = context.pages[-1]
         # Input the email address for login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('humancatalystnote@gmail.com')
+        await wait_policy.fill(elem, 'humancatalystnote@gmail.com')
         
 
         frame = context.pages[-1]
         # Input the password for login
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
+        await wait_policy.fill(elem, '123456')
         
 
         frame = context.pages[-1]
         # Click the Sign in button to log in
         elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Click on Settings to find subscription management options
         frame = context.pages[-1]
         # Click on Settings to access subscription management
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[9]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try alternative navigation to subscription management or report issue if no other options available.
         frame = context.pages[-1]
         # Click on Profile button to check if subscription management is accessible there
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # -> Try to access subscription management via Settings button (index 13) again or report issue if no other options available.
         frame = context.pages[-1]
         # Click on Settings button to try accessing subscription management
         elem = frame.locator('xpath=html/body/div/div/div/aside/div/nav/button[9]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await wait_policy.click(elem, timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -92,7 +93,6 @@ async def run_test():
             await expect(frame.locator('text=Subscription Cancellation Confirmed').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test failed: Subscription cancellation did not complete successfully, or user role and access were not updated correctly after cancellation or expiry as per the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
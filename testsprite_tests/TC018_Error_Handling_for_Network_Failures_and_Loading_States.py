@@ -51,7 +51,6 @@ async def run_test():
             await expect(page.locator('text=Unexpected Success Message').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The application did not display appropriate loading indicators or error messages during network delays, API failures, or invalid inputs as required by the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Log in once per role and reuse the saved Playwright storage_state in every test context
+The session for each role (free, student, teacher, admin) is cached under tmp/auth/ and
+logged in again shortly before its Supabase access token expires. Tests other than the
+auth tests (TC001-TC003) have their login-form steps removed and start already signed in.
+
+Credentials come from tmp/config.json: loginUser/loginPassword sign in as loginRole (default
+admin), and an optional "roleUsers": {"student": {"email": ..., "password": ...}, ...} adds the others.
+
+Usage:
+    python3 testsprite_tests/auth_state.py                  # log in every configured role and save its state
+    python3 testsprite_tests/auth_state.py --role admin --refresh
+"""
+import argparse
+import ast
+import asyncio
+import json
+import os
+import sys
+import time
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(TESTS_DIR, 'tmp', 'config.json')
+STATE_DIR = os.path.join(TESTS_DIR, 'tmp', 'auth')
+ROLES = ('free', 'student', 'teacher', 'admin')
+DEFAULT_ENDPOINT = 'http://localhost:3000'
+# Tests that exercise the login form itself and so never get a cached session
+AUTH_TESTS = ('TC001', 'TC002', 'TC003')
+# Log in again when the access token has less than this many seconds left. It is longer than
+# any test runs, so no context ever refreshes the shared (single-use) refresh token itself.
+REFRESH_MARGIN = 600
+# The generated tests' sign-in button
+LOGIN_SUBMIT_XPATH = 'form/div[3]/button'
+LOGIN_TIMEOUT = 30000
+
+def load_credentials(config_path=CONFIG_PATH):
+    """(endpoint, {role: (email, password)}) from the testsprite config"""
+    with open(config_path, encoding='utf-8') as f:
+        config = json.load(f)
+    credentials = {}
+    if config.get('loginUser'):
+        credentials[config.get('loginRole', 'admin')] = (config['loginUser'], config.get('loginPassword', ''))
+    for role, user in (config.get('roleUsers') or {}).items():
+        if role not in ROLES:
+            raise ValueError(f"Unknown role {role!r} in {config_path}; expected one of {', '.join(ROLES)}")
+        credentials[role] = (user['email'], user['password'])
+    return config.get('localEndpoint') or DEFAULT_ENDPOINT, credentials
+
+def is_auth_test(path):
+    return os.path.basename(path).startswith(AUTH_TESTS)
+
+def session_expiry(state):
+    """expires_at (epoch seconds) of the Supabase session in a storage_state, or None"""
+    for origin in state.get('origins', []):
+        for item in origin.get('localStorage', []):
+            if item['name'].startswith('sb-') and item['name'].endswith('-auth-token'):
+                try:
+                    return json.loads(item['value']).get('expires_at')
+                except (ValueError, AttributeError):
+                    return None
+    return None
+
+class AuthCache:
+    """Saved storage_state per role, logged in on first use and again before the token expires"""
+
+    def __init__(self, endpoint, credentials, state_dir=STATE_DIR, refresh=False, out=sys.stderr):
+        self.endpoint = endpoint
+        self.credentials = credentials
+        self.state_dir = state_dir
+        self.refresh = refresh
+        self.out = out
+        self._locks = {role: asyncio.Lock() for role in credentials}
+        self._fresh = set()   # roles logged in by this process
+        self.logins = 0
+
+    def state_path(self, role):
+        return os.path.join(self.state_dir, f"{role}.json")
+
+    def _valid(self, role):
+        path = self.state_path(role)
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, encoding='utf-8') as f:
+                expires_at = session_expiry(json.load(f))
+        except (OSError, ValueError):
+            return False
+        return expires_at is not None and expires_at - time.time() > REFRESH_MARGIN
+
+    async def storage_state(self, browser, role):
+        """Path of a current storage_state for role, logging in when there is none"""
+        async with self._locks[role]:
+            if (self.refresh and role not in self._fresh) or not self._valid(role):
+                await self.login(browser, role)
+            return self.state_path(role)
+
+    async def login(self, browser, role):
+        """Sign in through the login form in a fresh context and save its storage_state"""
+        email, password = self.credentials[role]
+        started = time.perf_counter()
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            await page.goto(f"{self.endpoint}/login", timeout=LOGIN_TIMEOUT)
+            await page.fill('input[type="email"]', email, timeout=LOGIN_TIMEOUT)
+            await page.fill('input[type="password"]', password, timeout=LOGIN_TIMEOUT)
+            await page.click('button[type="submit"]', timeout=LOGIN_TIMEOUT)
+            await page.wait_for_url('**/dashboard**', timeout=LOGIN_TIMEOUT)
+            await page.wait_for_function(
+                "() => Object.keys(localStorage).some(k => k.startsWith('sb-') && k.endsWith('-auth-token'))",
+                timeout=LOGIN_TIMEOUT,
+            )
+            os.makedirs(self.state_dir, exist_ok=True)
+            tmp_path = self.state_path(role) + '.tmp'
+            await context.storage_state(path=tmp_path)
+            os.replace(tmp_path, self.state_path(role))
+        finally:
+            await context.close()
+        self._fresh.add(role)
+        self.logins += 1
+        print(f"-- logged in as {role} ({email}) in {time.perf_counter() - started:.1f}s", file=self.out)
+
+def _run_test_body(tree):
+    """Statement list of the try block in run_test(), where the generated steps live"""
+    for node in tree.body:
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == 'run_test':
+            for statement in node.body:
+                if isinstance(statement, ast.Try):
+                    return statement.body
+    return None
+
+def _action(statement):
+    """('fill'|'click', args) for an `await wait_policy.fill/click(...)` statement, else None"""
+    if not (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Await)):
+        return None
+    call = statement.value.value
+    if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+            and isinstance(call.func.value, ast.Name) and call.func.value.id == 'wait_policy'
+            and call.func.attr in ('fill', 'click')):
+        return call.func.attr, call.args
+    return None
+
+def _assigns(statement, name):
+    return (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+            and isinstance(statement.targets[0], ast.Name) and statement.targets[0].id == name)
+
+def _selector(statement):
+    """First string passed to .locator(...) in an `elem = ...` assignment"""
+    for node in ast.walk(statement.value):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'locator'
+                and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)):
+            return node.args[0].value
+    return ''
+
+def strip_login_steps(tree, credentials):
+    """Remove the steps that fill configured credentials and the sign-in clicks after them
+
+    Returns the role whose email the test signed in with, or None when it has
+    no login steps (the tree is then unchanged).
+    """
+    body = _run_test_body(tree)
+    if body is None:
+        return None
+    roles_by_email = {email: role for role, (email, _) in credentials.items()}
+    secrets = set(roles_by_email) | {password for _, password in credentials.values()}
+    drop = set()
+    role = None
+
+    def step(i):
+        # An action plus the `frame = ...` / `elem = ...` lines that set it up
+        indexes = [i]
+        for name in ('elem', 'frame'):
+            if indexes[-1] > 0 and _assigns(body[indexes[-1] - 1], name):
+                indexes.append(indexes[-1] - 1)
+        return indexes
+
+    for i, statement in enumerate(body):
+        action = _action(statement)
+        if action is None:
+            continue
+        kind, args = action
+        if kind == 'fill' and len(args) > 1 and isinstance(args[1], ast.Constant) and args[1].value in secrets:
+            role = role or roles_by_email.get(args[1].value)
+            drop.update(step(i))
+        elif kind == 'click' and drop and i > 0 and _assigns(body[i - 1], 'elem'):
+            # Sign-in clicks, including the retries some generated tests make after a failed login
+            if LOGIN_SUBMIT_XPATH in _selector(body[i - 1]):
+                drop.update(step(i))
+    if role is None:
+        return None
+    body[:] = [statement for i, statement in enumerate(body) if i not in drop] or [ast.Pass()]
+    return role
+
+async def _login_all(roles, refresh):
+    from playwright.async_api import async_playwright
+    endpoint, credentials = load_credentials()
+    cache = AuthCache(endpoint, credentials, refresh=refresh)
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        try:
+            for role in roles or sorted(credentials):
+                if role not in credentials:
+                    print(f"-- WARNING: no credentials for {role} in {CONFIG_PATH}", file=sys.stderr)
+                    continue
+                print(f"{role}: {await cache.storage_state(browser, role)}")
+        finally:
+            await browser.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--role', action='append', choices=ROLES, help="role to log in (default: every configured role)")
+    parser.add_argument('--refresh', action='store_true', help="log in again even if the saved session is current")
+    args = parser.parse_args(argv)
+    asyncio.run(_login_all(args.role, args.refresh))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Run the TC tests across worker processes, sharded by how long each test has taken before
+Shards are balanced by historical duration (tmp/test_results.json, overridden by the last
+suite_runner.py results), longest test first onto the least loaded shard. A test with no history
+is estimated from its length. Each shard is one suite_runner.py process with its own browsers,
+the machine's cores split between the shards running on it; their results are merged into a
+single tmp/run_results.json.
+
+Usage:
+    python3 testsprite_tests/shard_runner.py --shards 8                 # 8 processes on this machine
+    python3 testsprite_tests/shard_runner.py --shards 8 --workers 2     # 2 browsers in each
+    python3 testsprite_tests/shard_runner.py --shards 4 --plan          # print the assignment only
+    python3 testsprite_tests/shard_runner.py --shards 4 --shard 2       # run one shard (e.g. a CI matrix job)
+"""
+import argparse
+import heapq
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from suite_runner import DEFAULT_WORKERS, RESULTS_PATH, discover, test_title
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(TESTS_DIR, 'tmp', 'test_results.json')
+SHARD_RESULTS = os.path.join(TESTS_DIR, 'tmp', 'shards', 'shard_{}.json')
+DEFAULT_SHARDS = os.cpu_count() or 1
+
+def shard_workers(processes, cpus=os.cpu_count() or 1):
+    """Browsers per shard when processes shards share this machine: its cores split between them"""
+    return max(1, min(DEFAULT_WORKERS, cpus // processes))
+
+def _seconds_between(start, end):
+    parse = lambda stamp: datetime.fromisoformat(stamp.replace('Z', '+00:00'))
+    return (parse(end) - parse(start)).total_seconds()
+
+def load_history(history_path=HISTORY_PATH, results_path=RESULTS_PATH):
+    """{title: seconds} from test_results.json (created -> modified), then the last runner results"""
+    durations = {}
+    if os.path.exists(history_path):
+        with open(history_path, encoding='utf-8') as f:
+            for test in json.load(f):
+                if test.get('created') and test.get('modified'):
+                    durations[test['title']] = _seconds_between(test['created'], test['modified'])
+    if os.path.exists(results_path):
+        with open(results_path, encoding='utf-8') as f:
+            for result in json.load(f).get('results', []):
+                durations[result['title']] = result['duration']
+    return durations
+
+def _line_count(path):
+    with open(path, encoding='utf-8') as f:
+        return sum(1 for _ in f)
+
+def estimate_durations(paths, history):
+    """{path: seconds}; tests without history get their line count times the median seconds per line"""
+    known = {path: history[test_title(path)] for path in paths if test_title(path) in history}
+    per_line = [seconds / _line_count(path) for path, seconds in known.items()]
+    rate = statistics.median(per_line) if per_line else 1.0
+    return {path: known[path] if path in known else _line_count(path) * rate for path in paths}
+
+def plan_shards(durations, shards):
+    """Longest-first onto the least loaded shard; returns [(estimated seconds, [paths])] per shard"""
+    heap = [(0.0, n) for n in range(shards)]
+    assigned = [[] for _ in range(shards)]
+    totals = [0.0] * shards
+    for path in sorted(durations, key=lambda path: (-durations[path], path)):
+        total, n = heapq.heappop(heap)
+        assigned[n].append(path)
+        totals[n] = total + durations[path]
+        heapq.heappush(heap, (totals[n], n))
+    return [(totals[n], sorted(assigned[n])) for n in range(shards)]
+
+def _runner_command(paths, results, workers, args):
+    command = [sys.executable, os.path.join(TESTS_DIR, 'suite_runner.py'), '--results', results,
+               '--timeout', str(args.timeout), '--workers', str(workers)]
+    if args.concurrency:
+        command += ['--concurrency', str(args.concurrency)]
+    if args.no_auth_cache:
+        command.append('--no-auth-cache')
+    if args.no_history:
+        command.append('--no-history')
+    return command + [os.path.basename(path) for path in paths]
+
+def merge_results(shard_paths, path, wall_time):
+    """Combine the shard result files into one report in title order; returns it"""
+    results = []
+    for n, shard_path in enumerate(shard_paths, 1):
+        if not os.path.exists(shard_path):
+            continue
+        with open(shard_path, encoding='utf-8') as f:
+            for result in json.load(f)['results']:
+                results.append(dict(result, shard=n))
+    report = {
+        'finished': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'shards': len(shard_paths),
+        'wallTime': round(wall_time, 3),
+        'results': sorted(results, key=lambda result: result['file']),
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('tests', nargs='*', help="filename prefixes to run (default: every TC*.py)")
+    parser.add_argument('--shards', type=int, default=DEFAULT_SHARDS,
+                        help=f"worker processes (default: one per core, {DEFAULT_SHARDS})")
+    parser.add_argument('--shard', type=int, help="run only this shard (1-based) of --shards")
+    parser.add_argument('--plan', action='store_true', help="print the shard assignment and exit")
+    parser.add_argument('--workers', type=int,
+                        help="browsers per shard process (default: the cores split between the shards run here)")
+    parser.add_argument('--concurrency', type=int, help="tests at once per shard process")
+    parser.add_argument('--timeout', type=float, default=300, help="seconds per test")
+    parser.add_argument('--no-auth-cache', action='store_true', help="let every test sign in through the login form")
+    parser.add_argument('--results', default=RESULTS_PATH, help="where the merged JSON results are written")
+    parser.add_argument('--no-history', action='store_true', help="do not record the shards' step timings")
+    args = parser.parse_args(argv)
+
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if args.shard is not None and not 1 <= args.shard <= args.shards:
+        parser.error(f"--shard must be between 1 and {args.shards}")
+    paths = discover(args.tests)
+    if not paths:
+        parser.error("no test files matched")
+
+    durations = estimate_durations(paths, load_history())
+    shards = [shard for shard in plan_shards(durations, min(args.shards, len(paths))) if shard[1]]
+    longest = max(durations.values())
+    for n, (total, shard_paths) in enumerate(shards, 1):
+        print(f"-- shard {n}: {len(shard_paths)} tests, ~{total:.0f}s", file=sys.stderr)
+        if args.plan:
+            for path in shard_paths:
+                print(f"   {durations[path]:>6.0f}s  {os.path.basename(path)}", file=sys.stderr)
+    print(f"-- ~{max(total for total, _ in shards):.0f}s estimated wall time "
+          f"(longest test ~{longest:.0f}s, serial ~{sum(durations.values()):.0f}s)", file=sys.stderr)
+    if args.plan:
+        return 0
+
+    selected = list(enumerate(shards, 1))
+    if args.shard is not None:
+        selected = [(args.shard, shards[args.shard - 1])] if args.shard <= len(shards) else []
+    if not args.no_auth_cache:
+        # Sign in once here, so the shard processes all find a current session instead of racing to log in
+        subprocess.run([sys.executable, os.path.join(TESTS_DIR, 'auth_state.py')], check=False)
+
+    workers = args.workers or shard_workers(len(selected) or 1)
+    print(f"-- {workers} browsers per shard", file=sys.stderr)
+    started = time.perf_counter()
+    processes = []
+    for n, (_, shard_paths) in selected:
+        results = SHARD_RESULTS.format(n)
+        os.makedirs(os.path.dirname(results), exist_ok=True)
+        if os.path.exists(results):
+            os.remove(results)
+        processes.append((n, results, subprocess.Popen(_runner_command(shard_paths, results, workers, args))))
+    failed_shards = [n for n, _, process in processes if process.wait() != 0]
+    wall_time = time.perf_counter() - started
+
+    report = merge_results([results for _, results, _ in processes], args.results, wall_time)
+    failed = sum(result['testStatus'] != 'PASSED' for result in report['results'])
+    missing = sum(len(shard[1]) for _, shard in selected) - len(report['results'])
+    print(f"-- {len(report['results']) - failed} passed, {failed} failed"
+          f"{f', {missing} without results' if missing else ''} in {wall_time:.1f}s across {len(processes)} "
+          f"shards; results in {args.results}", file=sys.stderr)
+    return 1 if failed or missing or failed_shards else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
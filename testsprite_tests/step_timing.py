@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Per-step timing for the TC tests and an append-only SQLite history of it, with a trend report
+suite_runner.py times every awaited step of a test (navigation, each fill/click, each assertion),
+plus browser launch and context setup, and appends each run to tmp/step_history.sqlite.
+Run as a script, this compares each step's median over the latest runs of its test with its
+median over the runs before them and flags the steps that got slower by more than --threshold percent.
+
+Usage:
+    python3 testsprite_tests/step_timing.py                          # steps whose p50 regressed > 20%
+    python3 testsprite_tests/step_timing.py --threshold 50 --recent 5 --baseline 20
+    python3 testsprite_tests/step_timing.py --runs                   # list the recorded runs
+"""
+import argparse
+import ast
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(TESTS_DIR, 'tmp', 'step_history.sqlite')
+# Name the instrumented test code calls its timer by
+TIMER_NAME = '__step_timer__'
+LABEL_LENGTH = 120
+# Steps recorded for the run as a whole rather than for one test
+SUITE_TEST = '(suite)'
+DEFAULT_THRESHOLD = 20.0
+DEFAULT_RECENT = 3
+DEFAULT_BASELINE = 10
+# Slowdowns smaller than this many seconds are noise, whatever their percentage
+DEFAULT_MIN_SECONDS = 0.2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    revision TEXT,
+    workers INTEGER,
+    concurrency INTEGER,
+    wall_time REAL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    test TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    step TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    ok INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS steps_by_step ON steps (test, step, run_id);
+CREATE TRIGGER IF NOT EXISTS runs_append_only_update BEFORE UPDATE ON runs
+    BEGIN SELECT RAISE(ABORT, 'step history is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS runs_append_only_delete BEFORE DELETE ON runs
+    BEGIN SELECT RAISE(ABORT, 'step history is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS steps_append_only_update BEFORE UPDATE ON steps
+    BEGIN SELECT RAISE(ABORT, 'step history is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS steps_append_only_delete BEFORE DELETE ON steps
+    BEGIN SELECT RAISE(ABORT, 'step history is append-only'); END;
+"""
+
+class StepTimer:
+    """Wall time of each step of one test, in order, with whether the step raised"""
+
+    def __init__(self):
+        self.steps = []
+        self._seen = {}
+
+    def label(self, step):
+        # A label repeated within one test (the same assertion twice) gets #2, #3... so it trends separately
+        count = self._seen.get(step, 0) + 1
+        self._seen[step] = count
+        return step if count == 1 else f"{step} #{count}"
+
+    @contextmanager
+    def step(self, step):
+        label = self.label(step)
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.steps.append((label, time.perf_counter() - started, ok))
+
+def _call_name(call):
+    func = call.func
+    return func.attr if isinstance(func, ast.Attribute) else ast.unparse(func)
+
+def _first_string(node, method):
+    """First string argument of a .<method>(...) call inside node"""
+    for inner in ast.walk(node):
+        if (isinstance(inner, ast.Call) and isinstance(inner.func, ast.Attribute) and inner.func.attr == method
+                and inner.args and isinstance(inner.args[0], ast.Constant) and isinstance(inner.args[0].value, str)):
+            return inner.args[0].value
+    return None
+
+def step_label(statement, selector=None):
+    """Stable name for a test statement: 'goto <url>', 'click <selector>', 'expect <selector> to_be_visible'..."""
+    awaited = next((node.value for node in ast.walk(statement) if isinstance(node, ast.Await)), None)
+    if not isinstance(awaited, ast.Call):
+        return type(statement).__name__.lower()
+    name = _call_name(awaited)
+    if name in ('fill', 'click') and selector:
+        label = f"{name} {selector}"
+    elif name == 'new_context':
+        label = "context setup"
+    elif name == 'goto' and awaited.args and isinstance(awaited.args[0], ast.Constant):
+        label = f"goto {awaited.args[0].value}"
+    elif name.startswith('to_'):
+        label = f"expect {_first_string(awaited, 'locator') or '?'} {name}"
+    elif name == 'wait_for_load_state' and awaited.args and isinstance(awaited.args[0], ast.Constant):
+        label = f"wait_for_load_state {awaited.args[0].value}"
+    else:
+        label = ast.unparse(awaited.func)
+    if isinstance(statement, ast.For):
+        label = f"each frame: {label}"
+    return label[:LABEL_LENGTH]
+
+def instrument(tree):
+    """Wrap every awaiting statement of run_test()'s try block in `with __step_timer__.step(label):`"""
+    for node in tree.body:
+        if not (isinstance(node, ast.AsyncFunctionDef) and node.name == 'run_test'):
+            continue
+        for block in node.body:
+            if not isinstance(block, ast.Try):
+                continue
+            body = []
+            selector = None
+            for statement in block.body:
+                if isinstance(statement, ast.Assign) and any(
+                        isinstance(target, ast.Name) and target.id == 'elem' for target in statement.targets):
+                    selector = _first_string(statement, 'locator')
+                if not any(isinstance(inner, ast.Await) for inner in ast.walk(statement)):
+                    body.append(statement)
+                    continue
+                timed = ast.With(
+                    items=[ast.withitem(context_expr=ast.Call(
+                        func=ast.Attribute(value=ast.Name(id=TIMER_NAME, ctx=ast.Load()), attr='step', ctx=ast.Load()),
+                        args=[ast.Constant(step_label(statement, selector))], keywords=[],
+                    ))],
+                    body=[statement],
+                )
+                body.append(ast.copy_location(timed, statement))
+            block.body = body
+    return ast.fix_missing_locations(tree)
+
+def _revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=TESTS_DIR, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def connect(path=HISTORY_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Shard processes append to the same file at the end of their runs
+    conn = sqlite3.connect(path, timeout=30)
+    conn.executescript(SCHEMA)
+    return conn
+
+def record_run(runs, launches, wall_time, workers, concurrency, path=HISTORY_PATH):
+    """Append one suite run: browser launches, then each test's context setup and steps; returns run_id"""
+    conn = connect(path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (started_at, revision, workers, concurrency, wall_time) VALUES (?, ?, ?, ?, ?)",
+                (datetime.now(timezone.utc).isoformat(timespec='seconds'), _revision(), workers, concurrency,
+                 wall_time),
+            )
+            run_id = cursor.lastrowid
+            rows = [(run_id, SUITE_TEST, seq, f"browser launch #{seq + 1}", seconds, 1)
+                    for seq, seconds in enumerate(launches)]
+            for run in runs:
+                rows.extend((run_id, run.title, seq, label, seconds, int(ok))
+                            for seq, (label, seconds, ok) in enumerate(run.timer.steps))
+            conn.executemany("INSERT INTO steps (run_id, test, seq, step, seconds, ok) VALUES (?, ?, ?, ?, ?, ?)",
+                             rows)
+    finally:
+        conn.close()
+    return run_id
+
+def regressions(conn, threshold=DEFAULT_THRESHOLD, recent=DEFAULT_RECENT, baseline=DEFAULT_BASELINE,
+                min_seconds=DEFAULT_MIN_SECONDS):
+    """[(test, step, baseline p50, recent p50, percent)] for steps whose p50 rose more than threshold percent
+
+    Windows are per test: its last `recent` runs against the `baseline` runs before them. shard_runner.py
+    records each shard as its own run, so a window of the latest run_ids overall would hold other tests.
+    Only steps that completed are compared, so a timeout does not read as a slow step.
+    """
+    windows = {}
+    for test, run_id in conn.execute("SELECT DISTINCT test, run_id FROM steps ORDER BY test, run_id DESC"):
+        run_ids = windows.setdefault(test, [])
+        if len(run_ids) < recent + baseline:
+            run_ids.append(run_id)
+    samples = {}
+    for test, run_ids in windows.items():
+        if len(run_ids) <= recent:
+            continue
+        recent_ids = set(run_ids[:recent])
+        for run_id, step, seconds in conn.execute(
+                "SELECT run_id, step, seconds FROM steps WHERE test = ? AND ok AND run_id >= ?", (test, run_ids[-1])):
+            before, after = samples.setdefault((test, step), ([], []))
+            (after if run_id in recent_ids else before).append(seconds)
+    flagged = []
+    for (test, step), (before, after) in samples.items():
+        if not before or not after:
+            continue
+        old, new = statistics.median(before), statistics.median(after)
+        if new - old < min_seconds or old <= 0:
+            continue
+        percent = (new - old) / old * 100
+        if percent > threshold:
+            flagged.append((test, step, old, new, percent))
+    return sorted(flagged, key=lambda item: item[3] - item[2], reverse=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--history', default=HISTORY_PATH)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"percent p50 increase to flag (default: {DEFAULT_THRESHOLD:g})")
+    parser.add_argument('--recent', type=int, default=DEFAULT_RECENT,
+                        help=f"latest runs whose p50 is checked (default: {DEFAULT_RECENT})")
+    parser.add_argument('--baseline', type=int, default=DEFAULT_BASELINE,
+                        help=f"earlier runs the p50 is compared with (default: {DEFAULT_BASELINE})")
+    parser.add_argument('--min-seconds', type=float, default=DEFAULT_MIN_SECONDS,
+                        help="ignore slowdowns smaller than this")
+    parser.add_argument('--runs', action='store_true', help="list the recorded runs")
+    args = parser.parse_args(argv)
+
+    if args.recent < 1 or args.baseline < 1:
+        parser.error("--recent and --baseline must be at least 1")
+    if not os.path.exists(args.history):
+        print(f"-- no step history at {args.history}; run suite_runner.py first", file=sys.stderr)
+        return 1
+    conn = connect(args.history)
+    try:
+        if args.runs:
+            for row in conn.execute("SELECT r.run_id, r.started_at, r.revision, r.workers, r.wall_time, "
+                                    "COUNT(DISTINCT s.test) FROM runs r LEFT JOIN steps s USING (run_id) "
+                                    "GROUP BY r.run_id ORDER BY r.run_id"):
+                run_id, started_at, revision, workers, wall_time, tests = row
+                print(f"{run_id:>5}  {started_at}  {revision or '-':<9} {tests:>3} tests  "
+                      f"{workers or '-'} workers  {wall_time or 0:.1f}s")
+            return 0
+        flagged = regressions(conn, args.threshold, args.recent, args.baseline, args.min_seconds)
+    finally:
+        conn.close()
+
+    for test, step, old, new, percent in flagged:
+        print(f"{percent:>+7.0f}%  {old:>7.2f}s -> {new:>7.2f}s  {test}: {step}")
+    print(f"-- {len(flagged)} steps regressed more than {args.threshold:g}% "
+          f"(p50 of each test's last {args.recent} runs vs the {args.baseline} before them)", file=sys.stderr)
+    return 1 if flagged else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
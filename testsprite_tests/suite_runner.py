@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Concurrent runner for the generated TC*.py Playwright tests
+Each worker launches one Chromium; every test gets its own BrowserContext on the least busy
+worker, and at most --concurrency tests run at once. The test files are run unchanged: their
+asyncio.run(run_test()) line is dropped, and the playwright session and browser they start are
+the worker's shared ones, so only the context they open is new. Apart from the login tests, each
+test's context starts signed in from auth_state.py's cached session instead of filling the login form.
+Every step is timed and the run is appended to step_timing.py's history.
+
+Usage:
+    python3 testsprite_tests/suite_runner.py                        # every TC*.py, one worker per core (max 4)
+    python3 testsprite_tests/suite_runner.py --workers 6 --concurrency 12
+    python3 testsprite_tests/suite_runner.py TC002 TC004_XP         # tests whose filename starts with these
+"""
+import argparse
+import ast
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+try:
+    from playwright import async_api
+except ImportError:
+    # Only running tests needs playwright; shard_runner.py imports discover() and test_title() without it
+    async_api = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from auth_state import AuthCache, is_auth_test, load_credentials, strip_login_steps
+from step_timing import HISTORY_PATH, TIMER_NAME, StepTimer, instrument, record_run
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_PATTERN = 'TC*.py'
+RESULTS_PATH = os.path.join(TESTS_DIR, 'tmp', 'run_results.json')
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+# Seconds before a single test is cancelled and reported as failed
+DEFAULT_TIMEOUT = 300
+# The generated tests' launch arguments without --single-process, which cannot host several contexts at once
+BROWSER_ARGS = ["--window-size=1280,720", "--disable-dev-shm-usage", "--ipc=host"]
+
+def discover(selected=None, tests_dir=TESTS_DIR):
+    """TC*.py paths in name order; with selected, only those whose filename starts with one of them"""
+    paths = sorted(glob.glob(os.path.join(tests_dir, TEST_PATTERN)))
+    if selected:
+        paths = [path for path in paths if any(os.path.basename(path).startswith(prefix) for prefix in selected)]
+    return paths
+
+def test_title(path):
+    """'TC002_User_Login_Success.py' -> 'TC002-User Login Success', as test_results.json titles them"""
+    case, _, name = os.path.splitext(os.path.basename(path))[0].partition('_')
+    return f"{case}-{name.replace('_', ' ')}"
+
+def _is_entry_call(node):
+    """The module-level asyncio.run(...) statement that runs a test on import"""
+    return (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute) and node.value.func.attr == 'run'
+            and isinstance(node.value.func.value, ast.Name) and node.value.func.value.id == 'asyncio')
+
+def load_test(path, credentials=None):
+    """(code object, role) for a test module without its asyncio.run(run_test()) line
+
+    With credentials, the login-form steps of a non-auth test are removed and
+    role names the cached session its contexts should start with.
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    tree.body = [node for node in tree.body if not _is_entry_call(node)]
+    role = None
+    if credentials and not is_auth_test(path):
+        role = strip_login_steps(tree, credentials)
+    return compile(instrument(tree), path, 'exec'), role
+
+def _describe(error):
+    """Exception type and the first line of its message"""
+    message = str(error).strip()
+    return f"{type(error).__name__}: {message.splitlines()[0]}" if message else type(error).__name__
+
+class TestRun:
+    """One test's execution: where it ran, the contexts it opened and how it ended"""
+
+    def __init__(self, path):
+        self.path = path
+        self.title = test_title(path)
+        self.worker = None
+        self.role = None
+        self.contexts = []
+        self.timer = StepTimer()
+        self.status = None
+        self.error = None
+        self.duration = None
+
+    def as_result(self):
+        return {
+            'title': self.title,
+            'file': os.path.basename(self.path),
+            'testStatus': self.status,
+            'testError': self.error,
+            'duration': round(self.duration, 3),
+            'worker': self.worker.index,
+            'role': self.role,
+            'steps': [{'step': step, 'seconds': round(seconds, 3), 'ok': ok} for step, seconds, ok in self.timer.steps],
+        }
+
+class _SharedAsyncAPI:
+    """Stands in for playwright.async_api inside a test module, handing it the worker's session"""
+
+    def __init__(self, run, auth=None):
+        self._run = run
+        self._auth = auth
+
+    def __getattr__(self, name):
+        return getattr(async_api, name)
+
+    def async_playwright(self):
+        return _SharedPlaywright(self._run, self._auth)
+
+class _SharedPlaywright:
+    """start() / chromium.launch() / stop() of a test resolve to the worker's running browser"""
+
+    def __init__(self, run, auth=None):
+        self._run = run
+        self._auth = auth
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, **options):
+        return _SharedBrowser(self._run, self._auth)
+
+    async def stop(self):
+        pass
+
+class _SharedBrowser:
+    """The worker's browser as one test sees it: new_context() is real, close() leaves the browser running"""
+
+    def __init__(self, run, auth=None):
+        self._run = run
+        self._auth = auth
+
+    def __getattr__(self, name):
+        return getattr(self._run.worker.browser, name)
+
+    async def new_context(self, **options):
+        browser = self._run.worker.browser
+        if self._run.role and self._auth is not None and 'storage_state' not in options:
+            options['storage_state'] = await self._auth.storage_state(browser, self._run.role)
+        context = await browser.new_context(**options)
+        self._run.contexts.append(context)
+        return context
+
+    async def close(self):
+        pass
+
+class BrowserWorker:
+    """One launched Chromium and the number of tests currently using it"""
+
+    def __init__(self, index, browser):
+        self.index = index
+        self.browser = browser
+        self.active = 0
+
+class SuiteRunner:
+    """Runs test modules over a pool of shared browsers, at most `concurrency` at a time"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, concurrency=None, timeout=DEFAULT_TIMEOUT, headless=True,
+                 auth=None, out=sys.stderr):
+        self.worker_count = workers
+        self.concurrency = concurrency or workers
+        self.timeout = timeout
+        self.headless = headless
+        self.auth = auth
+        self.out = out
+        self.workers = []
+        self.launch_times = []
+
+    async def run(self, paths):
+        """Run every path; returns their TestRuns in path order"""
+        runs = [TestRun(path) for path in paths]
+        async with async_api.async_playwright() as pw:
+            browsers = await asyncio.gather(*(self._launch(pw) for _ in range(self.worker_count)))
+            self.workers = [BrowserWorker(index, browser) for index, browser in enumerate(browsers)]
+            semaphore = asyncio.Semaphore(self.concurrency)
+            try:
+                await asyncio.gather(*(self._run_test(run, semaphore) for run in runs))
+            finally:
+                await asyncio.gather(*(worker.browser.close() for worker in self.workers), return_exceptions=True)
+        return runs
+
+    async def _launch(self, pw):
+        started = time.perf_counter()
+        browser = await pw.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+        self.launch_times.append(time.perf_counter() - started)
+        return browser
+
+    async def _run_test(self, run, semaphore):
+        async with semaphore:
+            run.worker = min(self.workers, key=lambda worker: worker.active)
+            run.worker.active += 1
+            started = time.perf_counter()
+            try:
+                namespace = {'__name__': f"tc_{os.path.splitext(os.path.basename(run.path))[0]}",
+                             '__file__': run.path}
+                code, run.role = load_test(run.path, self.auth.credentials if self.auth else None)
+                namespace[TIMER_NAME] = run.timer
+                exec(code, namespace)
+                namespace['async_api'] = _SharedAsyncAPI(run, self.auth)
+                await asyncio.wait_for(namespace['run_test'](), self.timeout)
+                run.status = 'PASSED'
+            except asyncio.TimeoutError:
+                run.status, run.error = 'FAILED', f"timed out after {self.timeout}s"
+            except Exception as e:
+                run.status, run.error = 'FAILED', _describe(e)
+            finally:
+                run.duration = time.perf_counter() - started
+                run.worker.active -= 1
+                # Contexts a failed test never reached its finally block to close
+                for context in run.contexts:
+                    try:
+                        await context.close()
+                    except async_api.Error:
+                        pass
+            print(f"{run.status:<6} {run.title} ({run.duration:.1f}s, worker {run.worker.index})", file=self.out)
+
+def write_results(runs, path, wall_time, runner):
+    """Save the run as JSON next to test_results.json"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    report = {
+        'finished': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'workers': runner.worker_count,
+        'concurrency': runner.concurrency,
+        'wallTime': round(wall_time, 3),
+        'results': [run.as_result() for run in runs],
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('tests', nargs='*', help="filename prefixes to run (default: every TC*.py)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"browsers to launch (default: {DEFAULT_WORKERS})")
+    parser.add_argument('--concurrency', type=int, help="tests running at once across all workers (default: --workers)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="seconds per test")
+    parser.add_argument('--headed', action='store_true', help="show the browser windows")
+    parser.add_argument('--results', default=RESULTS_PATH, help="where the JSON results are written")
+    parser.add_argument('--no-auth-cache', action='store_true',
+                        help="let every test sign in through the login form")
+    parser.add_argument('--refresh-auth', action='store_true', help="log in again even if a cached session is current")
+    parser.add_argument('--history', default=HISTORY_PATH, help="SQLite file the step timings are appended to")
+    parser.add_argument('--no-history', action='store_true', help="do not record this run's step timings")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    paths = discover(args.tests)
+    if not paths:
+        parser.error("no test files matched")
+    if async_api is None:
+        raise SystemExit("suite_runner.py needs playwright (pip install playwright && playwright install chromium)")
+
+    auth = None
+    if not args.no_auth_cache:
+        endpoint, credentials = load_credentials()
+        auth = AuthCache(endpoint, credentials, refresh=args.refresh_auth)
+    runner = SuiteRunner(min(args.workers, len(paths)), args.concurrency, args.timeout,
+                         headless=not args.headed, auth=auth)
+    started = time.perf_counter()
+    runs = asyncio.run(runner.run(paths))
+    wall_time = time.perf_counter() - started
+    write_results(runs, args.results, wall_time, runner)
+    if not args.no_history:
+        run_id = record_run(runs, runner.launch_times, wall_time, runner.worker_count, runner.concurrency,
+                            args.history)
+        print(f"-- step timings recorded as run {run_id} in {args.history}", file=sys.stderr)
+
+    failed = sum(run.status != 'PASSED' for run in runs)
+    test_time = sum(run.duration for run in runs)
+    print(f"-- {len(runs) - failed} passed, {failed} failed in {wall_time:.1f}s "
+          f"({test_time:.1f}s of test time, {test_time / wall_time:.1f}x) on {runner.worker_count} browsers; "
+          f"results in {args.results}", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
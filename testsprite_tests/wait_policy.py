@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Event-driven waits for the generated TC tests, replacing their fixed wait_for_timeout() and asyncio.sleep() sleeps
+fill() waits for the field to be visible, then fills it. click() waits the same way, clicks, and
+then waits for the Supabase auth/REST/RPC responses the click set off. settle() replaces the sleep
+after a navigation, and the sleep at the end of each test is dropped. Run as a script, it rewrites
+the TC files to use these waits and reports the fixed sleep removed from each test.
+
+Usage:
+    python3 testsprite_tests/wait_policy.py --dry-run        # report what the migration would remove
+    python3 testsprite_tests/wait_policy.py                  # rewrite every TC*.py
+    python3 testsprite_tests/wait_policy.py TC002 TC004_XP   # rewrite the matching files only
+    python3 testsprite_tests/wait_policy.py --compare before.json tmp/run_results.json
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import re
+import sys
+from contextlib import asynccontextmanager
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+except ImportError:
+    # Only the waits need playwright; the migration mode runs without it
+    PlaywrightTimeout = asyncio.TimeoutError
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# ms a target may take to become visible; with the action's own 5s timeout this is the old 3s sleep + 5s budget
+READY_TIMEOUT = 3000
+# Seconds after a click for the requests it triggers to be issued
+REQUEST_GRACE = 0.1
+# Seconds to wait for those requests' responses
+RESPONSE_TIMEOUT = 15
+# Requests a step depends on: Supabase auth, table reads/writes, RPCs and edge functions
+SUPABASE_REQUEST = re.compile(r'/(auth|rest|functions)/v1/')
+# Named endpoints for response() in hand-written steps
+SUPABASE_ENDPOINTS = {
+    'auth': '/auth/v1/token',
+    'signup': '/auth/v1/signup',
+    'user': '/auth/v1/user',
+    'rpc': '/rest/v1/rpc/',
+}
+
+async def ready(locator, timeout=READY_TIMEOUT):
+    """Wait until locator is visible; a timeout is left for the action itself to report"""
+    try:
+        await locator.wait_for(state='visible', timeout=timeout)
+    except PlaywrightTimeout:
+        pass
+
+@asynccontextmanager
+async def supabase_responses(page, pattern=SUPABASE_REQUEST, timeout=RESPONSE_TIMEOUT):
+    """Wait, on exit, for the responses to matching requests the page issued inside the block"""
+    issued = []
+
+    def on_request(request):
+        if pattern.search(request.url):
+            issued.append(request)
+
+    page.on('request', on_request)
+    try:
+        yield issued
+        await asyncio.sleep(REQUEST_GRACE)
+    finally:
+        page.remove_listener('request', on_request)
+    if issued:
+        try:
+            await asyncio.wait_for(asyncio.gather(*(request.response() for request in issued)), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+async def fill(locator, value, **options):
+    await ready(locator)
+    await locator.fill(value, **options)
+
+async def click(locator, **options):
+    await ready(locator)
+    async with supabase_responses(locator.page):
+        await locator.click(**options)
+
+async def response(page, endpoint, action, timeout=RESPONSE_TIMEOUT):
+    """Run action() and return the response from a SUPABASE_ENDPOINTS name or URL substring"""
+    needle = SUPABASE_ENDPOINTS.get(endpoint, endpoint)
+    async with page.expect_response(lambda r: needle in r.url, timeout=timeout * 1000) as info:
+        await action()
+    return await info.value
+
+async def settle(page, timeout=RESPONSE_TIMEOUT):
+    """Wait for network idle, for steps that depend on no single request"""
+    try:
+        await page.wait_for_load_state('networkidle', timeout=timeout * 1000)
+    except PlaywrightTimeout:
+        pass
+
+# `await page.wait_for_timeout(3000); await elem.fill('x')` as the test generator writes it
+FIXED_WAIT = re.compile(
+    r'await (?P<page>\w+)\.wait_for_timeout\((?P<ms>\d+)\); await (?P<target>\w+)\.(?P<action>fill|click)\((?P<args>.*)\)$'
+)
+# `await page.goto(url)` followed by a fixed `await asyncio.sleep(3)` for the page to load
+GOTO = re.compile(r'^\s*await (?P<page>\w+)\.goto\(')
+SLEEP = re.compile(r'^(?P<indent>\s*)await asyncio\.sleep\((?P<seconds>\d+(?:\.\d+)?)\)\s*$')
+IMPORT_AFTER = 'from playwright.async_api import expect\n'
+IMPORT_LINE = 'import wait_policy\n'
+
+def _next_statement(lines, index):
+    """The first non-blank line after lines[index], stripped"""
+    for line in lines[index + 1:]:
+        if line.strip():
+            return line.strip()
+    return ''
+
+def migrate_source(source):
+    """(new source, sleeps removed, ms of fixed sleep removed) for one test module
+
+    Fixed waits before a fill/click become wait_policy.fill/click, a sleep right after a goto
+    becomes wait_policy.settle(page), and the sleep ending the steps before `finally:` is dropped.
+    """
+    removed = ms = 0
+    lines = []
+    source_lines = source.splitlines(keepends=True)
+    page = None
+    for index, line in enumerate(source_lines):
+        body = line.rstrip('\n')
+        match = FIXED_WAIT.search(body)
+        sleep = SLEEP.match(body)
+        if match:
+            args = match['args']
+            call = f"await wait_policy.{match['action']}({match['target']}{', ' + args if args else ''})"
+            line = body[:match.start()] + call + line[len(body):]
+            removed += 1
+            ms += int(match['ms'])
+        elif sleep and page is not None:
+            line = f"{sleep['indent']}await wait_policy.settle({page})" + line[len(body):]
+            removed += 1
+            ms += int(float(sleep['seconds']) * 1000)
+        elif sleep and _next_statement(source_lines, index) == 'finally:':
+            removed += 1
+            ms += int(float(sleep['seconds']) * 1000)
+            continue
+        if body.strip():
+            goto = GOTO.match(body)
+            page = goto['page'] if goto else None
+        lines.append(line)
+    source = ''.join(lines)
+    if 'wait_policy.' in source and IMPORT_LINE not in source:
+        if IMPORT_AFTER not in source:
+            raise ValueError("no playwright.async_api import to add the wait_policy import after")
+        source = source.replace(IMPORT_AFTER, IMPORT_AFTER + IMPORT_LINE, 1)
+    return source, removed, ms
+
+def remaining_sleeps(source):
+    return len(re.findall(r'\.wait_for_timeout\(|asyncio\.sleep\(', source))
+
+def compare_runs(before_path, after_path):
+    """Print the measured time saved per test between two suite_runner.py result files"""
+    durations = []
+    for path in (before_path, after_path):
+        with open(path, encoding='utf-8') as f:
+            durations.append({result['title']: result['duration'] for result in json.load(f)['results']})
+    before, after = durations
+    titles = [title for title in before if title in after]
+    if not titles:
+        print("-- the two runs have no tests in common", file=sys.stderr)
+        return 1
+    print(f"{'test':<70} {'before':>8} {'after':>8} {'saved':>8}")
+    for title in titles:
+        print(f"{title[:70]:<70} {before[title]:>7.1f}s {after[title]:>7.1f}s {before[title] - after[title]:>7.1f}s")
+    saved = sum(before[title] - after[title] for title in titles)
+    print(f"-- {saved:,.1f}s saved over {len(titles)} tests; {saved / len(titles):.1f}s per test on average",
+          file=sys.stderr)
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('tests', nargs='*', help="filename prefixes to migrate (default: every TC*.py)")
+    parser.add_argument('--dry-run', action='store_true', help="report without rewriting the files")
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help="report measured seconds saved per test between two suite_runner.py result files")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare_runs(*args.compare)
+
+    paths = sorted(glob.glob(os.path.join(TESTS_DIR, 'TC*.py')))
+    if args.tests:
+        paths = [path for path in paths if any(os.path.basename(path).startswith(prefix) for prefix in args.tests)]
+    if not paths:
+        parser.error("no test files matched")
+
+    total_removed = total_ms = 0
+    print(f"{'test':<70} {'sleeps':>6} {'saved':>8} {'left':>5}")
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        migrated, removed, ms = migrate_source(source)
+        if removed and not args.dry_run:
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(migrated)
+            os.replace(tmp_path, path)
+        total_removed += removed
+        total_ms += ms
+        print(f"{os.path.splitext(os.path.basename(path))[0][:70]:<70} {removed:>6} {ms / 1000:>7.0f}s "
+              f"{remaining_sleeps(migrated):>5}")
+    verb = "would remove" if args.dry_run else "removed"
+    print(f"-- {verb} {total_removed} fixed sleeps ({total_ms / 1000:,.0f}s) from {len(paths)} tests; "
+          f"{total_ms / 1000 / len(paths):.0f}s per test on average", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())